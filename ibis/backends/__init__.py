@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import collections.abc
+import concurrent.futures
 import contextlib
 import functools
 import importlib.metadata
 import keyword
 import re
 import sys
+import threading
+import time
 import urllib.parse
 import weakref
 from collections import Counter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple
 
 import ibis
 import ibis.common.exceptions as exc
@@ -20,9 +24,17 @@ import ibis.config
 import ibis.expr.operations as ops
 import ibis.expr.types as ir
 from ibis import util
+from ibis.common.fingerprint import tokenize
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+    from collections.abc import (
+        AsyncIterator,
+        Callable,
+        Iterable,
+        Iterator,
+        Mapping,
+        MutableMapping,
+    )
     from urllib.parse import ParseResult
 
     import pandas as pd
@@ -109,6 +121,7 @@ class _FileIOHandler:
         *,
         params: Mapping[ir.Scalar, Any] | None = None,
         limit: int | str | None = None,
+        dtype_backend: Literal["numpy", "numpy_nullable", "pyarrow"] | None = None,
         **kwargs: Any,
     ) -> pd.DataFrame | pd.Series | Any:
         """Execute an Ibis expression and return a pandas `DataFrame`, `Series`, or scalar.
@@ -126,11 +139,16 @@ class _FileIOHandler:
         limit
             An integer to effect a specific row limit. A value of `None` means
             "no limit". The default is in `ibis/config.py`.
+        dtype_backend
+            The kind of pandas dtypes to convert the result to. `None` uses
+            `ibis.options.dtype_backend`.
         kwargs
             Keyword arguments
 
         """
-        return self.execute(expr, params=params, limit=limit, **kwargs)
+        return self.execute(
+            expr, params=params, limit=limit, dtype_backend=dtype_backend, **kwargs
+        )
 
     def to_pandas_batches(
         self,
@@ -139,6 +157,7 @@ class _FileIOHandler:
         params: Mapping[ir.Scalar, Any] | None = None,
         limit: int | str | None = None,
         chunk_size: int = 1_000_000,
+        dtype_backend: Literal["numpy", "numpy_nullable", "pyarrow"] | None = None,
         **kwargs: Any,
     ) -> Iterator[pd.DataFrame | pd.Series | Any]:
         """Execute an Ibis expression and return an iterator of pandas `DataFrame`s.
@@ -155,6 +174,9 @@ class _FileIOHandler:
         chunk_size
             Maximum number of rows in each returned `DataFrame` batch. This may have
             no effect depending on the backend.
+        dtype_backend
+            The kind of pandas dtypes to convert the batches to. `None` uses
+            `ibis.options.dtype_backend`.
         kwargs
             Keyword arguments
 
@@ -164,19 +186,21 @@ class _FileIOHandler:
             An iterator of pandas `DataFrame`s.
 
         """
-        from ibis.formats.pandas import PandasData
+        from ibis.formats.pandas import PandasData, iter_with_dtype_backend
 
+        pa = self._import_pyarrow()
         orig_expr = expr
         expr = expr.as_table()
         schema = expr.schema()
-        yield from (
+        batches = (
             orig_expr.__pandas_result__(
-                PandasData.convert_table(batch.to_pandas(), schema)
+                PandasData.from_pyarrow(pa.Table.from_batches([batch]), schema)
             )
             for batch in self.to_pyarrow_batches(
                 expr, params=params, limit=limit, chunk_size=chunk_size, **kwargs
             )
         )
+        yield from iter_with_dtype_backend(batches, dtype_backend)
 
     @util.experimental
     def to_pyarrow(
@@ -768,6 +792,14 @@ class CanCreateDatabase(CanListDatabase):
         """
 
 
+class QueryResult(NamedTuple):
+    """The result of one of the expressions passed to `execute_many`."""
+
+    result: Any
+    elapsed: float
+    """The wall-clock time in seconds spent executing the expression."""
+
+
 class CacheEntry(NamedTuple):
     orig_op: ops.Relation
     cached_op_ref: weakref.ref[ops.Relation]
@@ -796,7 +828,9 @@ class CacheHandler:
         """
         entry = self._cache_op_to_entry.get(table.op())
         if entry is None or (cached_op := entry.cached_op_ref()) is None:
-            cached_op = self._create_cached_table(util.gen_name("cached"), table).op()
+            cached_op = self._load_or_create_cached_table(
+                util.gen_name("cached"), table
+            ).op()
             entry = CacheEntry(
                 table.op(),
                 weakref.ref(cached_op),
@@ -828,6 +862,38 @@ class CacheHandler:
                 if not sys.is_finalizing():
                     raise
 
+    def _load_or_create_cached_table(self, name: str, table: ir.Table) -> ir.Table:
+        """Create a cached table, reusing a persisted result if possible.
+
+        Results are persisted only if `ibis.options.cache.directory` is set and
+        the backend can compute a key for `table`.
+        """
+        options = ibis.options.cache
+        if (
+            options.directory is None
+            or (key := self._persistent_cache_key(table)) is None
+        ):
+            return self._create_cached_table(name, table)
+
+        from ibis.common.caching import PersistentCache
+
+        store = PersistentCache(options.directory, max_size=options.max_size)
+        if (data := store.get(key)) is not None:
+            return self._create_cached_table(
+                name, ibis.memtable(data, schema=table.schema())
+            )
+
+        cached = self._create_cached_table(name, table)
+        store.set(key, self.to_pyarrow(cached))
+        return cached
+
+    def _persistent_cache_key(self, table: ir.Table) -> str | None:
+        """Return a key identifying the result of `table` across processes.
+
+        Results of expressions without a key are never persisted.
+        """
+        return None
+
     def _create_cached_table(self, name: str, expr: ir.Table) -> ir.Table:
         return self.create_table(name, expr, schema=expr.schema(), temp=True)
 
@@ -835,6 +901,22 @@ class CacheHandler:
         self.drop_table(name, force=True)
 
 
+def _with_dtype_backend(execute: Callable) -> Callable:
+    """Handle the `dtype_backend` argument of a backend's `execute` method."""
+
+    @functools.wraps(execute)
+    def wrapper(self, *args, dtype_backend=None, **kwargs):
+        if dtype_backend is None:
+            return execute(self, *args, **kwargs)
+
+        from ibis.formats.pandas import dtype_backend as use_dtype_backend
+
+        with use_dtype_backend(dtype_backend):
+            return execute(self, *args, **kwargs)
+
+    return wrapper
+
+
 class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
     """Base backend class.
 
@@ -846,6 +928,19 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
 
     supports_temporary_tables = False
     supports_python_udfs = False
+    supports_connection_pool = False
+    """Whether `execute_many` may run queries over additional connections.
+
+    Backends whose drivers allow several concurrent connections to the same
+    database opened from the saved connection parameters set this to `True`.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the results are converted deep inside each backend's implementation,
+        # so select the dtype backend around the whole method
+        if (execute := cls.__dict__.get("execute")) is not None:
+            cls.execute = _with_dtype_backend(execute)
 
     def __init__(self, *args, **kwargs):
         self._con_args: tuple[Any] = args
@@ -1171,7 +1266,235 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
         return self.compiler.to_sql(expr, params=params)
 
     def execute(self, expr: ir.Expr) -> Any:
-        """Execute an expression."""
+        """Execute an expression.
+
+        Besides their own arguments, the implementations accept
+        `dtype_backend`, the kind of pandas dtypes to convert the result to.
+        `None` uses `ibis.options.dtype_backend`.
+        """
+
+    def _pooled_connection(self) -> BaseBackend:
+        """Open another connection to the database for `execute_many`."""
+        return self.connect(*self._con_args, **self._con_kwargs)
+
+    def execute_many(
+        self,
+        exprs: Iterable[ir.Expr],
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = "default",
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[QueryResult]:
+        """Execute independent expressions concurrently.
+
+        If the backend supports it, the expressions are dispatched over a pool
+        of at most `max_workers` connections to the same database, opened from
+        the parameters this backend was connected with and closed before
+        returning. Otherwise the expressions are executed one after the other
+        on this connection.
+
+        Parameters
+        ----------
+        exprs
+            Ibis expressions to execute.
+        params
+            Mapping of scalar parameter expressions to value, shared by all
+            the expressions.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        max_workers
+            The maximum number of queries to run at the same time. Defaults to
+            the number of expressions.
+        kwargs
+            Keyword arguments passed to `execute`.
+
+        Returns
+        -------
+        list[QueryResult]
+            The result of each expression and the time spent executing it, in
+            the order of `exprs`.
+
+        """
+        exprs = list(exprs)
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        workers = min(max_workers or len(exprs), len(exprs))
+
+        def run(con: BaseBackend, expr: ir.Expr) -> QueryResult:
+            start = time.perf_counter()
+            result = con.execute(expr, params=params, limit=limit, **kwargs)
+            elapsed = time.perf_counter() - start
+            util.log(f"{self.name}: executed expression in {elapsed:.3f}s")
+            return QueryResult(result, elapsed)
+
+        if workers <= 1 or not (self.supports_connection_pool and self._can_reconnect):
+            return [run(self, expr) for expr in exprs]
+
+        # every worker thread opens its own connection on first use, so there
+        # are never more connections than workers
+        local = threading.local()
+        opened = []
+
+        def run_pooled(expr: ir.Expr) -> QueryResult:
+            if (con := getattr(local, "con", None)) is None:
+                con = local.con = self._pooled_connection()
+                opened.append(con)
+            return run(con, expr)
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+                return list(executor.map(run_pooled, exprs))
+        finally:
+            for con in opened:
+                with contextlib.suppress(Exception):
+                    con.disconnect()
+
+    async def execute_many_async(
+        self, exprs: Iterable[ir.Expr], /, **kwargs: Any
+    ) -> list[QueryResult]:
+        """Execute independent expressions concurrently without blocking the event loop.
+
+        See `execute_many` for the accepted keyword arguments.
+
+        Returns
+        -------
+        list[QueryResult]
+            The result of each expression and the time spent executing it, in
+            the order of `exprs`.
+
+        """
+        return await self._run_async(
+            functools.partial(self.execute_many, list(exprs), **kwargs)
+        )
+
+    def _interrupt(self) -> None:
+        """Interrupt the query running on this connection, if any.
+
+        Called from another thread when the task awaiting one of the async
+        methods is cancelled. Backends whose driver can cancel an in-flight
+        query implement this, otherwise the query runs to completion in the
+        background and its result is discarded.
+        """
+
+    async def _run_async(
+        self,
+        func: Callable[[], Any],
+        executor: concurrent.futures.Executor | None = None,
+    ) -> Any:
+        """Run the blocking `func` in a worker thread of `executor`.
+
+        Cancelling the awaiting task interrupts the running query.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, func)
+        except asyncio.CancelledError:
+            with contextlib.suppress(Exception):
+                self._interrupt()
+            raise
+
+    async def execute_async(self, expr: ir.Expr, /, **kwargs: Any) -> Any:
+        """Execute an expression without blocking the event loop.
+
+        Cancelling the awaiting task interrupts the query if the backend's
+        driver supports it.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to execute.
+        kwargs
+            Keyword arguments passed to `execute`.
+
+        """
+        return await self._run_async(functools.partial(self.execute, expr, **kwargs))
+
+    async def to_pyarrow_async(self, expr: ir.Expr, /, **kwargs: Any) -> pa.Table:
+        """Execute an expression and return a pyarrow table without blocking the event loop.
+
+        Cancelling the awaiting task interrupts the query if the backend's
+        driver supports it.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow.
+        kwargs
+            Keyword arguments passed to `to_pyarrow`.
+
+        """
+        return await self._run_async(functools.partial(self.to_pyarrow, expr, **kwargs))
+
+    async def to_pyarrow_batches_async(
+        self, expr: ir.Expr, /, **kwargs: Any
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Execute an expression and iterate over its record batches asynchronously.
+
+        Each batch is fetched in a worker thread, so the event loop is free
+        while waiting for the next one. Cancelling the consuming task
+        interrupts the query if the backend's driver supports it.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow.
+        kwargs
+            Keyword arguments passed to `to_pyarrow_batches`.
+
+        Returns
+        -------
+        AsyncIterator[pa.RecordBatch]
+            An asynchronous iterator of record batches.
+
+        """
+        # the reader is only ever used from one thread, so it is never closed
+        # while a cancelled read is still in progress
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+        try:
+            reader = await self._run_async(
+                functools.partial(self.to_pyarrow_batches, expr, **kwargs), executor
+            )
+            try:
+                batches = iter(reader)
+                while (
+                    batch := await self._run_async(
+                        functools.partial(next, batches, None), executor
+                    )
+                ) is not None:
+                    yield batch
+            finally:
+                executor.submit(reader.close)
+        finally:
+            executor.shutdown(wait=False)
+
+    async def raw_sql_async(self, query: str, /, **kwargs: Any) -> Any:
+        """Execute a query string without blocking the event loop.
+
+        Cancelling the awaiting task interrupts the query if the backend's
+        driver supports it.
+
+        Parameters
+        ----------
+        query
+            The query to execute.
+        kwargs
+            Keyword arguments passed to `raw_sql`.
+
+        Returns
+        -------
+        Any
+            The value returned by the backend's `raw_sql`, for example a
+            cursor which the caller is responsible for closing.
+
+        """
+        if (raw_sql := getattr(self, "raw_sql", None)) is None:
+            raise NotImplementedError(
+                f'Backend "{self.name}" does not implement "raw_sql"'
+            )
+        return await self._run_async(functools.partial(raw_sql, query, **kwargs))
 
     @abc.abstractmethod
     def create_table(
@@ -1343,6 +1666,12 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
         return query
 
 
+@tokenize.register(BaseBackend)
+def _(value):
+    # backends are identified by the database they are connected to
+    return tokenize(("backend", value.name, value.db_identity))
+
+
 @functools.cache
 def _get_backend_names(*, exclude: tuple[str] = ()) -> frozenset[str]:
     """Return the set of known backend names.
@@ -50,6 +50,7 @@ class Backend(SQLBackend, CanCreateDatabase):
 
     # ClickHouse itself does, but the client driver does not
     supports_temporary_tables = False
+    supports_connection_pool = True
 
     class Options(ibis.config.Config):
         """Clickhouse options.
@@ -541,10 +541,14 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl):
         return expr.__pyarrow_result__(arrow_table)
 
     def execute(self, expr: ir.Expr, **kwargs: Any):
-        batch_reader = self.to_pyarrow_batches(expr, **kwargs)
-        return expr.__pandas_result__(
-            batch_reader.read_pandas(timestamp_as_object=True)
+        from ibis.formats.pandas import PandasData
+
+        with self.to_pyarrow_batches(expr, **kwargs) as batch_reader:
+            table = batch_reader.read_all()
+        df = PandasData.from_pyarrow(
+            table, expr.as_table().schema(), timestamp_as_object=True
         )
+        return expr.__pandas_result__(df)
 
     def create_table(
         self,
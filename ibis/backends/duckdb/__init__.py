@@ -71,6 +71,7 @@ class _Settings:
 class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
     name = "duckdb"
     compiler = sc.duckdb.compiler
+    _param_style = "named"
 
     @property
     def settings(self) -> _Settings:
@@ -92,6 +93,8 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
     def raw_sql(self, query: str | sg.Expression, **kwargs: Any) -> Any:
         with contextlib.suppress(AttributeError):
             query = query.sql(dialect=self.name)
+        if (params := kwargs.pop("params", None)) is not None:
+            kwargs["parameters"] = params
         return self.con.execute(query, **kwargs)
 
     def create_table(
@@ -321,6 +324,9 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
     def _safe_raw_sql(self, *args, **kwargs):
         yield self.raw_sql(*args, **kwargs)
 
+    def _interrupt(self) -> None:
+        self.con.interrupt()
+
     def list_catalogs(self, like: str | None = None) -> list[str]:
         col = "catalog_name"
         query = sg.select(sge.Distinct(expressions=[sg.column(col)])).from_(
@@ -1260,10 +1266,10 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         """
         self._run_pre_execute_hooks(expr)
         table_expr = expr.as_table()
-        sql = self.compile(table_expr, limit=limit, params=params)
+        sql, raw_kwargs = self._compile_bound(table_expr, limit=limit, params=params)
         if table_expr.schema().geospatial:
             self._load_extensions(["spatial"])
-        return self.con.sql(sql)
+        return self.con.sql(sql, **raw_kwargs)
 
     def to_pyarrow_batches(
         self,
@@ -1294,12 +1300,12 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         """
         self._run_pre_execute_hooks(expr)
         table = expr.as_table()
-        sql = self.compile(table, limit=limit, params=params)
+        sql, raw_kwargs = self._compile_bound(table, limit=limit, params=params)
 
         def batch_producer(cur):
             yield from cur.fetch_record_batch(rows_per_batch=chunk_size)
 
-        result = self.raw_sql(sql)
+        result = self.raw_sql(sql, **raw_kwargs)
         return pa.ipc.RecordBatchReader.from_batches(
             expr.as_table().schema().to_pyarrow(), batch_producer(result)
         )
@@ -1323,29 +1329,9 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath):
         **_: Any,
     ) -> Any:
         """Execute an expression."""
-        import pandas as pd
-        import pyarrow.types as pat
-
         table = self._to_duckdb_relation(expr, params=params, limit=limit).arrow()
-
-        df = pd.DataFrame(
-            {
-                name: (
-                    col.to_pylist()
-                    if (
-                        pat.is_nested(col.type)
-                        or
-                        # pyarrow / duckdb type null literals columns as int32?
-                        # but calling `to_pylist()` will render it as None
-                        col.null_count
-                    )
-                    else col.to_pandas()
-                )
-                for name, col in zip(table.column_names, table.columns)
-            }
-        )
-        df = DuckDBPandasData.convert_table(df, expr.as_table().schema())
-        return expr.__pandas_result__(df)
+        df = DuckDBPandasData.from_pyarrow(table, expr.as_table().schema())
+        return expr.__pandas_result__(df, data_mapper=DuckDBPandasData)
 
     @util.experimental
     def to_torch(
@@ -465,3 +465,82 @@ def test_create_table_with_nulls(con, kwargs):
 
     with pytest.raises(com.IbisTypeError, match="NULL typed columns"):
         con.create_table(name, **kwargs)
+
+
+def test_compile_cache(monkeypatch):
+    con = ibis.duckdb.connect()
+    con.create_table("t", schema=ibis.schema({"a": "int64"}))
+    t = con.table("t")
+    p = ibis.param("int64")
+
+    def expr():
+        return t.filter(t.a > p).a.sum()
+
+    sql = con.compile(expr(), params={p: 1})
+    assert con.compile(expr(), params={p: 1}) == sql
+    assert con.compile(expr(), params={p: 2}) != sql
+    assert con.compile_cache_info() == (1, 2, 256, 2)
+
+    monkeypatch.setattr(ibis.options.sql, "fuse_selects", False)
+    con.compile(expr(), params={p: 1})
+    assert con.compile_cache_info().misses == 3
+
+    con.clear_compile_cache()
+    assert con.compile_cache_info() == (0, 0, 256, 0)
+
+    # values comparing equal but compiling differently aren't conflated
+    assert "-0.0" not in con.compile(t.a.sum() + 0.0)
+    assert "-0.0" in con.compile(t.a.sum() + -0.0)
+    q = ibis.param("float64")
+    assert "-0.0" not in con.compile(t.a.sum() + q, params={q: 0.0})
+    assert "-0.0" in con.compile(t.a.sum() + q, params={q: -0.0})
+
+
+def test_compile_cache_does_not_keep_memtables_alive():
+    con = ibis.duckdb.connect()
+    name = gen_name("compile_cache_memtable")
+    t = ibis.memtable({"a": [1, 2, 3]}, name=name)
+
+    assert con.execute(t.a.sum()) == 6
+    assert name in con.list_tables()
+    assert con.compile_cache_info().currsize == 0
+
+    del t
+    assert name not in con.list_tables()
+
+
+def test_bind_params(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "bind_params", True)
+
+    con = ibis.duckdb.connect()
+    t = con.create_table("t", ibis.memtable({"a": [1, 2, 3], "s": list("xy%")}))
+    value = ibis.param("int64")
+    values = ibis.param("array<int64>")
+    expr = t.filter(t.a > value, t.s.like("%")).a.sum()
+
+    sql, kwargs = con._compile_bound(expr, params={value: 1})
+    assert "$param_" in sql
+    assert kwargs == {"params": {value.op().name: 1}}
+
+    con.clear_compile_cache()
+    assert [con.execute(expr, params={value: v}) for v in (0, 1, 2)] == [6, 5, 3]
+    assert con.compile_cache_info().currsize == 1
+
+    # non primitive parameters are still inlined
+    expr = t.a.sum() + values.length()
+    assert con.execute(expr, params={values: [1, 2]}) == 8
+
+
+@pytest.mark.parametrize(
+    ("dtype_backend", "dtype"),
+    [
+        ("numpy", np.dtype("float64")),
+        ("numpy_nullable", pd.Int64Dtype()),
+        ("pyarrow", pd.ArrowDtype(pa.int64())),
+    ],
+)
+def test_execute_dtype_backend(dtype_backend, dtype):
+    con = ibis.duckdb.connect()
+    t = ibis.memtable({"x": [1, None]}, schema={"x": "int64"})
+    assert con.execute(t, dtype_backend=dtype_backend).x.dtype == dtype
+    assert con.execute(t.x, dtype_backend=dtype_backend).dtype == dtype
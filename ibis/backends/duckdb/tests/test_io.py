@@ -394,6 +394,49 @@ def test_memtable_recordbatchreader_raises(con):
     tm.assert_frame_equal(res, table.to_pandas())
 
 
+@pytest.mark.parametrize("suffix", [".arrow", ".feather"])
+def test_memtable_from_arrow_ipc_file(con, tmp_path, suffix):
+    table = pa.table({"x": [1, 2, 3], "y": ["a", None, "c"]})
+    path = tmp_path / f"data{suffix}"
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    t = ibis.memtable(str(path))
+    assert t.schema() == ibis.schema({"x": "int64", "y": "string"})
+    assert con.to_pyarrow(t.order_by("x")).equals(table)
+    assert ibis.memtable(path).op().data == t.op().data
+
+    renamed = ibis.memtable(path, columns=["a", "b"])
+    assert con.to_pyarrow(renamed.order_by("a")).equals(
+        table.rename_columns(["a", "b"])
+    )
+
+
+def test_memtable_spill(con, tmp_path, monkeypatch):
+    import gc
+
+    from ibis.formats.pyarrow import PyArrowIPCFileProxy
+
+    monkeypatch.setattr(ibis.options.memtable, "spill_threshold", 16)
+    monkeypatch.setattr(ibis.options.memtable, "spill_directory", str(tmp_path))
+
+    df = pd.DataFrame({"x": range(10), "y": [str(i) for i in range(10)]})
+    t = ibis.memtable(df)
+    data = t.op().data
+    assert isinstance(data, PyArrowIPCFileProxy)
+    assert os.path.dirname(data.obj) == str(tmp_path)
+    tm.assert_frame_equal(con.execute(t.order_by("x")), df)
+
+    small = ibis.memtable({"x": [1]})
+    assert not isinstance(small.op().data, PyArrowIPCFileProxy)
+
+    # spilled files are removed along with the memtable
+    path = ibis.memtable(df).op().data.obj
+    gc.collect()
+    assert not os.path.exists(path)
+
+
 def test_csv_with_slash_n_null(con, tmp_path):
     data_path = tmp_path / "data.csv"
     data_path.write_text("a\n1\n3\n\\N\n")
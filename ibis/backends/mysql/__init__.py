@@ -38,7 +38,9 @@ if TYPE_CHECKING:
 class Backend(SQLBackend, CanCreateDatabase):
     name = "mysql"
     compiler = sc.mysql.compiler
+    _param_style = "pyformat"
     supports_create_or_replace = False
+    supports_connection_pool = True
 
     def _from_url(self, url: ParseResult, **kwargs):
         """Connect to a backend using a URL `url`.
@@ -289,6 +291,9 @@ class Backend(SQLBackend, CanCreateDatabase):
         with contextlib.suppress(AttributeError):
             query = query.sql(dialect=self.name)
 
+        if (params := kwargs.pop("params", None)) is not None:
+            kwargs["args"] = params
+
         con = self.con
         autocommit = con.get_autocommit()
 
@@ -374,11 +379,11 @@ class Backend(SQLBackend, CanCreateDatabase):
 
         self._run_pre_execute_hooks(expr)
         table = expr.as_table()
-        sql = self.compile(table, limit=limit, **kwargs)
+        sql, raw_kwargs = self._compile_bound(table, limit=limit, **kwargs)
 
         schema = table.schema()
 
-        with self._safe_raw_sql(sql) as cur:
+        with self._safe_raw_sql(sql, **raw_kwargs) as cur:
             result = self._fetch_from_cursor(cur, schema)
         return expr.__pandas_result__(result)
 
@@ -512,9 +517,8 @@ class Backend(SQLBackend, CanCreateDatabase):
         self._run_pre_execute_hooks(expr)
 
         schema = expr.as_table().schema()
-        with self._safe_raw_sql(
-            self.compile(expr, limit=limit, params=params)
-        ) as cursor:
+        sql, raw_kwargs = self._compile_bound(expr, limit=limit, params=params)
+        with self._safe_raw_sql(sql, **raw_kwargs) as cursor:
             df = self._fetch_from_cursor(cursor, schema)
         table = pa.Table.from_pandas(
             df, schema=schema.to_pyarrow(), preserve_index=False
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import contextlib
+import os
+import tempfile
+import weakref
 from collections.abc import Iterable, Mapping
 from functools import lru_cache
 from pathlib import Path
@@ -17,7 +21,12 @@ from ibis.backends.polars.compiler import translate
 from ibis.backends.polars.rewrites import bind_unbound_table, rewrite_join
 from ibis.backends.sql.dialects import Polars
 from ibis.common.dispatch import lazy_singledispatch
-from ibis.expr.rewrites import lower_stringslice, replace_parameter
+from ibis.expr.rewrites import (
+    fold_constants,
+    lower_stringslice,
+    push_filters_down,
+    replace_parameter,
+)
 from ibis.formats.polars import PolarsSchema
 from ibis.util import gen_name, normalize_filename, normalize_filenames
 
@@ -28,6 +37,11 @@ if TYPE_CHECKING:
     import pyarrow as pa
 
 
+def _remove_file(path: str) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
 class Backend(BaseBackend, NoUrl):
     name = "polars"
     dialect = Polars
@@ -404,10 +418,15 @@ class Backend(BaseBackend, NoUrl):
             params = {param.op(): value for param, value in params.items()}
 
         node = expr.as_table().op()
+        if ibis.options.sql.push_down_predicates:
+            node = node.replace(push_filters_down)
         node = node.replace(
             rewrite_join | replace_parameter | bind_unbound_table | lower_stringslice,
             context={"params": params, "backend": self},
         )
+        # must come after replacing the parameters so their values are folded
+        if ibis.options.sql.fold_constants:
+            node = node.replace(fold_constants)
 
         return translate(node, ctx=self._context)
 
@@ -423,15 +442,13 @@ class Backend(BaseBackend, NoUrl):
         lazy_frame = self._context.execute(query, eager=False)
         return sch.infer(lazy_frame)
 
-    def _to_dataframe(
+    def _to_lazyframe(
         self,
         expr: ir.Expr,
         params: Mapping[ir.Expr, object] | None = None,
         limit: int | None = None,
-        streaming: bool = False,
-        engine: Literal["cpu", "gpu"] | pl.GPUEngine = "cpu",
         **kwargs: Any,
-    ) -> pl.DataFrame:
+    ) -> pl.LazyFrame:
         self._run_pre_execute_hooks(expr)
         table_expr = expr.as_table()
         lf = self.compile(table_expr, params=params, **kwargs)
@@ -439,14 +456,43 @@ class Backend(BaseBackend, NoUrl):
             limit = ibis.options.sql.default_limit
         if limit is not None:
             lf = lf.limit(limit)
-        df = lf.collect(streaming=streaming, engine=engine)
         # XXX: Polars sometimes returns data with the incorrect column names.
         # For now we catch this case and rename them here if needed.
-        expected_cols = tuple(table_expr.columns)
+        columns = lf.collect_schema().names()
+        expected_cols = table_expr.columns
+        if tuple(columns) != expected_cols:
+            lf = lf.rename(dict(zip(columns, expected_cols)))
+        return lf
+
+    def _to_dataframe(
+        self,
+        expr: ir.Expr,
+        params: Mapping[ir.Expr, object] | None = None,
+        limit: int | None = None,
+        streaming: bool = False,
+        engine: Literal["cpu", "gpu"] | pl.GPUEngine = "cpu",
+        **kwargs: Any,
+    ) -> pl.DataFrame:
+        lf = self._to_lazyframe(expr, params=params, limit=limit, **kwargs)
+        df = lf.collect(streaming=streaming, engine=engine)
+        expected_cols = expr.as_table().columns
         if tuple(df.columns) != expected_cols:
             df = df.rename(dict(zip(df.columns, expected_cols)))
         return df
 
+    @staticmethod
+    def _sink(lf: pl.LazyFrame, format: str, path: str | Path, **kwargs: Any) -> None:
+        """Write `lf` to `path` with the streaming engine, if possible.
+
+        Polars refuses to sink plans that its streaming engine cannot execute,
+        in which case the result is collected and written in one go.
+        """
+        try:
+            getattr(lf, f"sink_{format}")(path, **kwargs)
+        except pl.exceptions.InvalidOperationError:
+            df = lf.collect(streaming=True)
+            getattr(df, f"write_{format}")(path, **kwargs)
+
     def execute(
         self,
         expr: ir.Expr,
@@ -456,6 +502,8 @@ class Backend(BaseBackend, NoUrl):
         engine: Literal["cpu", "gpu"] | pl.GPUEngine = "cpu",
         **kwargs: Any,
     ):
+        from ibis.formats.pandas import PandasData
+
         df = self._to_dataframe(
             expr,
             params=params,
@@ -464,19 +512,8 @@ class Backend(BaseBackend, NoUrl):
             engine=engine,
             **kwargs,
         )
-        if isinstance(expr, (ir.Table, ir.Scalar)):
-            return expr.__pandas_result__(df.to_pandas())
-        else:
-            assert isinstance(expr, ir.Column), type(expr)
-
-            dtype = expr.type()
-            if dtype.is_temporal():
-                return expr.__pandas_result__(df.to_pandas())
-            else:
-                from ibis.formats.pandas import PandasData
-
-                # note: skip frame-construction overhead
-                return PandasData.convert_column(df.to_series().to_pandas(), dtype)
+        df = PandasData.from_pyarrow(df.to_arrow(), expr.as_table().schema())
+        return expr.__pandas_result__(df)
 
     def to_polars(
         self,
@@ -537,9 +574,66 @@ class Backend(BaseBackend, NoUrl):
         chunk_size: int = 1_000_000,
         **kwargs: Any,
     ):
-        self._import_pyarrow()
-        table = self._to_pyarrow_table(expr, params=params, limit=limit, **kwargs)
-        return table.to_reader(chunk_size)
+        """Execute expression and return a reader of record batches.
+
+        The query is executed by the Polars streaming engine and spilled to a
+        temporary Arrow IPC file which is memory-mapped and read back in
+        batches of at most `chunk_size` rows, so the full result never has to
+        be held in memory. Queries the streaming engine cannot sink are
+        collected in memory instead.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        kwargs
+            Keyword arguments passed to the compiler.
+
+        Returns
+        -------
+        RecordBatchReader
+            Collection of pyarrow `RecordBatch`s.
+        """
+        pa = self._import_pyarrow()
+        from ibis.formats.pyarrow import PyArrowData
+
+        schema = expr.as_table().schema()
+        lf = self._to_lazyframe(expr, params=params, limit=limit, **kwargs)
+        # spill the result with the types of the expression's schema
+        lf = lf.cast(PolarsSchema.from_ibis(schema))
+
+        fd, path = tempfile.mkstemp(suffix=".arrow")
+        os.close(fd)
+        try:
+            # uncompressed, so that the file can be memory-mapped
+            self._sink(lf, "ipc", path, compression=None)
+        except BaseException:
+            _remove_file(path)
+            raise
+
+        def batch_producer():
+            try:
+                with pa.memory_map(path) as source:
+                    reader = pa.ipc.open_file(source)
+                    for i in range(reader.num_record_batches):
+                        table = pa.Table.from_batches([reader.get_batch(i)])
+                        table = PyArrowData.convert_table(table, schema)
+                        yield from table.to_batches(max_chunksize=chunk_size)
+            finally:
+                _remove_file(path)
+
+        batches = batch_producer()
+        # generators never started don't run their cleanup, so also remove the
+        # file when the reader is closed or collected before being consumed
+        weakref.finalize(batches, _remove_file, path)
+        return pa.ipc.RecordBatchReader.from_batches(schema.to_pyarrow(), batches)
 
     def _create_cached_table(self, name, expr):
         return self.create_table(name, self.compile(expr).cache())
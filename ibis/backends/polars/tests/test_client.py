@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gc
+
 import polars as pl
 import polars.testing
 import pytest
@@ -76,3 +78,112 @@ def test_engine(con, mocker, to_method):
     mocked_collect = mocker.patch("polars.LazyFrame.collect")
     getattr(con, to_method)(t, engine="gpu")
     mocked_collect.assert_called_once_with(streaming=False, engine="gpu")
+
+
+@pytest.fixture
+def memtable_con():
+    return ibis.polars.connect()
+
+
+@pytest.mark.parametrize(
+    ("aggregate", "num_rows"),
+    [(False, 10), (True, 1)],
+    ids=["streamable", "not_streamable"],
+)
+def test_to_pyarrow_batches_chunk_size(
+    memtable_con, tmp_path, monkeypatch, aggregate, num_rows
+):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+
+    t = ibis.memtable({"x": range(10), "y": list("ab") * 5})
+    if aggregate:
+        t = t.aggregate(total=t.x.sum())
+
+    with memtable_con.to_pyarrow_batches(t, chunk_size=3) as reader:
+        assert reader.schema == t.schema().to_pyarrow()
+        batches = list(reader)
+
+    assert all(batch.num_rows <= 3 for batch in batches)
+    assert sum(batch.num_rows for batch in batches) == num_rows
+    # the spilled result is removed once the reader has been consumed
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("close", [False, True])
+def test_to_pyarrow_batches_unconsumed(memtable_con, tmp_path, monkeypatch, close):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+
+    t = ibis.memtable({"x": range(10)})
+    reader = memtable_con.to_pyarrow_batches(t)
+    assert list(tmp_path.iterdir())
+
+    if close:
+        reader.close()
+    del reader
+    gc.collect()
+    assert not list(tmp_path.iterdir())
+
+
+def test_sink(memtable_con, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    pcsv = pytest.importorskip("pyarrow.csv")
+
+    df = pl.DataFrame({"x": range(10), "y": list("ab") * 5})
+    t = memtable_con.create_table(gen_name("sink"), df)
+    # polars computes the length as an unsigned 32 bit integer
+    expr = t.filter(t.x > 2).mutate(n=t.y.length(), z=t.x.cast("int16") + 1)
+
+    memtable_con.to_parquet(expr, tmp_path / "out.parquet")
+    result = pq.read_table(tmp_path / "out.parquet")
+    assert result.schema == expr.schema().to_pyarrow()
+    assert result.equals(memtable_con.to_pyarrow(expr))
+
+    memtable_con.to_csv(expr, tmp_path / "out.csv")
+    expected = pa.BufferOutputStream()
+    pcsv.write_csv(memtable_con.to_pyarrow(expr), expected)
+    result = (tmp_path / "out.csv").read_bytes()
+    assert result == expected.getvalue().to_pybytes()
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_push_down_predicates(memtable_con, monkeypatch, how):
+    t = ibis.memtable({"k": [1, 2, 3, 4], "a": [1.0, 2.0, None, 4.0]})
+    u = ibis.memtable({"k": [2, 3, 4, 5], "b": ["x", "y", "z", None]})
+    joined = t.join(u, "k", how=how)
+    expr = (
+        joined.filter(joined.a > 1, joined.b != "y")
+        .union(joined.filter(joined.a.isnull()))
+        .filter(ibis._.a < 4)
+    )
+
+    expected = memtable_con.to_polars(expr)
+    monkeypatch.setattr(ibis.options.sql, "push_down_predicates", True)
+    result = memtable_con.to_polars(expr)
+    polars.testing.assert_frame_equal(
+        result, expected, check_row_order=False, check_column_order=True
+    )
+
+
+def test_fold_constants(memtable_con, monkeypatch):
+    t = ibis.memtable({"x": [1, 2, 3], "y": ["a", None, "c"]})
+    n = ibis.param("int64")
+    expr = t.filter(t.x > n - 1, ibis.literal(True)).mutate(
+        z=ibis.coalesce(ibis.null("string"), t.y, "b" + ibis.literal("c")),
+        w=ibis.ifelse(n > 0, t.x * (n + 1), 0),
+    )
+
+    expected = memtable_con.to_polars(expr, params={n: 2})
+    monkeypatch.setattr(ibis.options.sql, "fold_constants", True)
+    result = memtable_con.to_polars(expr, params={n: 2})
+    polars.testing.assert_frame_equal(result, expected)
+
+
+def test_execute_dtype_backend(memtable_con):
+    pd = pytest.importorskip("pandas")
+    pa = pytest.importorskip("pyarrow")
+
+    t = ibis.memtable({"x": [1, None]}, schema={"x": "int64"})
+    result = memtable_con.execute(t, dtype_backend="pyarrow")
+    assert result.x.dtype == pd.ArrowDtype(pa.int64())
+    assert result.x.isna().tolist() == [False, True]
@@ -11,7 +11,6 @@ from urllib.parse import unquote_plus
 import psycopg
 import sqlglot as sg
 import sqlglot.expressions as sge
-from pandas.api.types import is_float_dtype
 
 import ibis
 import ibis.backends.sql.compilers as sc
@@ -27,7 +26,7 @@ from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import TRUE, C, ColGen
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from urllib.parse import ParseResult
 
     import pandas as pd
@@ -43,7 +42,9 @@ class NatDumper(psycopg.adapt.Dumper):
 class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
     name = "postgres"
     compiler = sc.postgres.compiler
+    _param_style = "pyformat"
     supports_python_udfs = True
+    supports_connection_pool = True
 
     def _from_url(self, url: ParseResult, **kwargs):
         """Connect to a backend using a URL `url`.
@@ -94,13 +95,17 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
 
         return self.connect(**kwargs)
 
-    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+    def _in_memory_data(self, op: ops.InMemoryTable) -> pa.Table:
         schema = op.schema
         if null_columns := schema.null_fields:
             raise exc.IbisTypeError(
                 f"{self.name} cannot yet reliably handle `null` typed columns; "
                 f"got null typed columns: {null_columns}"
             )
+        return op.data.to_pyarrow(schema)
+
+    def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
+        data = self._in_memory_data(op)
 
         name = op.name
         quoted = self.compiler.quoted
@@ -108,31 +113,40 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             kind="TABLE",
             this=sg.exp.Schema(
                 this=sg.to_identifier(name, quoted=quoted),
-                expressions=schema.to_sqlglot(self.dialect),
+                expressions=op.schema.to_sqlglot(self.dialect),
             ),
             properties=sg.exp.Properties(expressions=[sge.TemporaryProperty()]),
         )
         create_stmt_sql = create_stmt.sql(self.dialect)
 
-        df = op.data.to_frame()
-        # nan gets compiled into 'NaN'::float which throws errors in non-float columns
-        # In order to hold NaN values, pandas automatically converts integer columns
-        # to float columns if there are NaN values in them. Therefore, we need to convert
-        # them to their original dtypes (that support pd.NA) to figure out which columns
-        # are actually non-float, then fill the NaN values in those columns with None.
-        convert_df = df.convert_dtypes()
-        for col in convert_df.columns:
-            if not is_float_dtype(convert_df[col]):
-                df[col] = df[col].replace(float("nan"), None)
-
-        data = df.itertuples(index=False)
-        sql = self._build_insert_template(
-            name, schema=schema, columns=True, placeholder="%s"
-        )
-
         with self.begin() as cur:
             cur.execute(create_stmt_sql)
-            cur.executemany(sql, data)
+            self._copy_from(cur, sg.table(name, quoted=quoted), data)
+
+    def _copy_from(
+        self,
+        cur: psycopg.Cursor,
+        table: sge.Table,
+        data: pa.Table,
+        columns: Iterable[str] | None = None,
+    ) -> None:
+        """Stream `data` into `table` using `COPY ... FROM STDIN`.
+
+        Rows are written in batches converted from Arrow, so a single
+        statement loads the whole table instead of one `INSERT` per row.
+        """
+        target = table
+        if columns is not None:
+            quoted = self.compiler.quoted
+            target = sge.Schema(
+                this=table,
+                expressions=[sg.to_identifier(col, quoted=quoted) for col in columns],
+            )
+
+        with cur.copy(f"COPY {target.sql(self.dialect)} FROM STDIN") as copy:
+            for batch in data.to_batches(max_chunksize=100_000):
+                for row in zip(*(column.to_pylist() for column in batch.columns)):
+                    copy.write_row(row)
 
     @contextlib.contextmanager
     def begin(self):
@@ -634,17 +648,19 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         if temp:
             properties.append(sge.TemporaryProperty())
 
+        data = query = None
         if obj is not None:
             if not isinstance(obj, ir.Expr):
                 table = ibis.memtable(obj)
             else:
                 table = obj
 
-            self._run_pre_execute_hooks(table)
-
-            query = self.compiler.to_sqlglot(table)
-        else:
-            query = None
+            if isinstance(op := table.op(), ops.InMemoryTable):
+                # in-memory data is copied straight into the new table
+                data = self._in_memory_data(op)
+            else:
+                self._run_pre_execute_hooks(table)
+                query = self.compiler.to_sqlglot(table)
 
         if overwrite:
             temp_name = util.gen_name(f"{self.name}_table")
@@ -672,6 +688,8 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
                     self.dialect
                 )
                 cur.execute(insert_stmt)
+            elif data is not None:
+                self._copy_from(cur, table_expr, data)
 
             if overwrite:
                 cur.execute(
@@ -689,6 +707,58 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
             name, schema=schema, source=self, namespace=ops.Namespace(database=database)
         ).to_expr()
 
+    def insert(
+        self,
+        table_name: str,
+        obj: pd.DataFrame | ir.Table | list | dict,
+        database: str | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        """Insert data into a table.
+
+        In-memory data is streamed into the table with `COPY` instead of
+        being uploaded to a temporary table first.
+
+        Parameters
+        ----------
+        table_name
+            The name of the table to which data needs will be inserted
+        obj
+            The source data or expression to insert
+        database
+            Name of the attached database that the table is located in.
+        overwrite
+            If `True` then replace existing contents of table
+
+        """
+        if not isinstance(obj, ir.Table):
+            obj = ibis.memtable(obj)
+
+        if not isinstance(op := obj.op(), ops.InMemoryTable):
+            super().insert(table_name, obj, database=database, overwrite=overwrite)
+            return
+
+        table_loc = self._to_sqlglot_table(database)
+        catalog, db = self._to_catalog_db_tuple(table_loc)
+
+        if overwrite:
+            self.truncate_table(table_name, database=(catalog, db))
+
+        # same column matching as `_build_insert_from_table`
+        target_cols = self.get_schema(table_name, catalog=catalog, database=db).keys()
+        columns = (
+            source_cols
+            if (source_cols := op.schema.keys()) <= target_cols
+            else target_cols
+        )
+
+        data = self._in_memory_data(op)
+        table = sg.table(
+            table_name, db=db, catalog=catalog, quoted=self.compiler.quoted
+        )
+        with self.begin() as cur:
+            self._copy_from(cur, table, data, columns=columns)
+
     def drop_table(
         self,
         name: str,
@@ -708,6 +778,9 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
         with contextlib.closing(self.raw_sql(*args, **kwargs)) as result:
             yield result
 
+    def _interrupt(self) -> None:
+        self.con.cancel()
+
     def raw_sql(self, query: str | sg.Expression, **kwargs: Any) -> Any:
         import psycopg
         import psycopg.types
@@ -30,6 +30,7 @@ import ibis
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.types as ir
+from ibis.backends.postgres import Backend
 from ibis.backends.tests.errors import PsycoPgOperationalError
 from ibis.util import gen_name
 
@@ -84,6 +85,29 @@ def test_compile_toplevel(assert_sql):
     assert_sql(expr)
 
 
+def test_bind_params_pyformat(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "bind_params", True)
+
+    con = Backend()
+    t = ibis.table({"s": "string"}, name="t")
+    value = ibis.param("string")
+    expr = t.filter(t.s.like("a%") | (t.s == value))
+
+    sql, kwargs = con._compile_bound(expr, params={value: "b"})
+    name = value.op().name
+    assert "'a%%'" in sql
+    assert f"%({name})s" in sql
+    assert kwargs == {"params": {name: "b"}}
+
+    # placeholder-like text in literals and identifiers is left alone
+    text = f"x :{name} y"
+    expr = t.filter(t.s == value).mutate(**{f":{name}": ibis.literal(text)})
+    sql, _ = con._compile_bound(expr, params={value: "b"})
+    assert sql.count(f"%({name})s") == 1
+    assert f"'{text}'" in sql
+    assert f'":{name}"' in sql
+
+
 def test_list_catalogs(con):
     assert POSTGRES_TEST_DB is not None
     assert POSTGRES_TEST_DB in con.list_catalogs()
@@ -202,6 +226,40 @@ def test_insert_with_cte(con):
     assert Y.execute().empty
 
 
+def test_copy_in_memory_data(con, mocker):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, None],
+            "b": [1.5, np.nan, 3.0],
+            "c": ["x", None, "z"],
+            "d": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+            "e": [[1, 2], [], None],
+        }
+    )
+    spy = mocker.spy(Backend, "_copy_from")
+
+    name = gen_name("postgres_copy")
+    t = con.create_table(name, df, temp=True)
+    assert spy.call_count == 1
+    assert t.count().execute() == 3
+
+    con.insert(name, df.iloc[:2])
+    assert spy.call_count == 2
+
+    con.insert(name, df[["a", "c"]], overwrite=True)
+    assert spy.call_count == 3
+
+    result = t.order_by("a").execute()
+    assert result.a.tolist()[:2] == [1, 2]
+    assert pd.isna(result.a.iat[2])
+    assert result.c.tolist() == ["x", None, "z"]
+    assert result.b.isna().all()
+
+    # memtables are uploaded with COPY as well
+    assert con.execute(ibis.memtable(df).count()) == 3
+    assert spy.call_count == 4
+
+
 @pytest.fixture(scope="module")
 def contz(con):
     with con.begin() as c:
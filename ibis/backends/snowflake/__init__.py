@@ -10,7 +10,7 @@ import tempfile
 import warnings
 from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import unquote_plus
 from urllib.request import urlretrieve
 
@@ -141,6 +141,7 @@ class Backend(SQLBackend, CanCreateCatalog, CanCreateDatabase):
     name = "snowflake"
     compiler = sc.snowflake.compiler
     supports_python_udfs = True
+    supports_connection_pool = True
 
     _top_level_methods = ("from_connection", "from_snowpark")
 
@@ -476,8 +477,7 @@ $$ {defn["source"]} $$"""
     def _fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
         if (table := cursor.fetch_arrow_all()) is None:
             table = schema.to_pyarrow().empty_table()
-        df = table.to_pandas(timestamp_as_object=True)
-        df.columns = list(schema.names)
+        df = SnowflakePandasData.from_pyarrow(table, schema, timestamp_as_object=True)
         return SnowflakePandasData.convert_table(df, schema)
 
     def to_pandas_batches(
@@ -487,7 +487,10 @@ $$ {defn["source"]} $$"""
         params: Mapping[ir.Scalar, Any] | None = None,
         limit: int | str | None = None,
         chunk_size: int = 1_000_000,
+        dtype_backend: Literal["numpy", "numpy_nullable", "pyarrow"] | None = None,
     ) -> Iterator[pd.DataFrame | pd.Series | Any]:
+        from ibis.formats.pandas import iter_with_dtype_backend
+
         self._run_pre_execute_hooks(expr)
         sql = self.compile(expr, limit=limit, params=params)
         target_schema = expr.as_table().schema()
@@ -496,8 +499,12 @@ $$ {defn["source"]} $$"""
         )
 
         with self._safe_raw_sql(sql) as cur:
-            yield from map(
-                expr.__pandas_result__, map(converter, cur.fetch_pandas_batches())
+            yield from iter_with_dtype_backend(
+                map(
+                    expr.__pandas_result__,
+                    map(converter, cur.fetch_pandas_batches()),
+                ),
+                dtype_backend,
             )
 
     def to_pyarrow_batches(
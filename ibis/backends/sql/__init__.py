@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import abc
+import hashlib
+import itertools
 from functools import partial
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 import sqlglot as sg
 import sqlglot.expressions as sge
+from sqlglot.tokens import TokenType
 
 import ibis
 import ibis.common.exceptions as exc
@@ -14,23 +17,61 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import BaseBackend
+from ibis.backends.sql.rewrites import exact_key
+from ibis.common.caching import LRUCache
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
 
     import pandas as pd
     import pyarrow as pa
 
     from ibis.backends.sql.compilers.base import SQLGlotCompiler
+    from ibis.common.caching import CacheInfo
     from ibis.expr.schema import SchemaLike
 
 
+def _to_pyformat(sql: str, dialect: sg.Dialect, names: set[str]) -> str:
+    """Convert the named placeholders `names` of `sql` to the pyformat style.
+
+    The statement is lexed with sqlglot, so only the actual placeholders are
+    converted, and the other percent signs are escaped, including the ones in
+    string literals, quoted identifiers and comments.
+    """
+    tokens = dialect.tokenize(sql)
+    pieces = []
+    start = 0
+    for colon, name in itertools.pairwise(tokens):
+        if (
+            colon.token_type is TokenType.COLON
+            and name.token_type is TokenType.VAR
+            and name.start == colon.end + 1
+            and name.text in names
+        ):
+            pieces.append(sql[start : colon.start].replace("%", "%%"))
+            pieces.append(f"%({name.text})s")
+            start = name.end + 1
+    pieces.append(sql[start:].replace("%", "%%"))
+    return "".join(pieces)
+
+
 class SQLBackend(BaseBackend):
     compiler: ClassVar[SQLGlotCompiler]
     name: ClassVar[str]
 
     _top_level_methods = ("from_connection",)
 
+    _param_style: ClassVar[Literal["named", "pyformat"] | None] = None
+    """The DB-API parameter style used to bind scalar parameters.
+
+    `None` if the backend doesn't support binding parameters, in which case
+    their values are always inlined into the compiled SQL.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compile_cache = LRUCache()
+
     @property
     def dialect(self) -> sg.Dialect:
         return self.compiler.dialect
@@ -107,11 +148,188 @@ class SQLBackend(BaseBackend):
         pretty: bool = False,
     ):
         """Compile an Ibis expression to a SQL string."""
-        query = self.compiler.to_sqlglot(expr, limit=limit, params=params)
-        sql = query.sql(dialect=self.dialect, pretty=pretty, copy=False)
+        return self._compile(expr, limit=limit, params=params, pretty=pretty)
+
+    def _compile(
+        self,
+        expr: ir.Expr,
+        *,
+        limit: str | None = None,
+        params: Mapping[ir.Expr, Any] | None = None,
+        pretty: bool = False,
+        bind_params: bool = False,
+    ) -> str:
+        cache = self._compile_cache
+        cache.maxsize = ibis.options.sql.compile_cache_size
+        key = self._compile_cache_key(expr, limit, params, pretty, bind_params)
+
+        if key is None or (sql := cache.get(key)) is None:
+            query = self.compiler.to_sqlglot(
+                expr, limit=limit, params=params, bind_params=bind_params
+            )
+            sql = query.sql(dialect=self.dialect, pretty=pretty, copy=False)
+            if bind_params and self._param_style == "pyformat":
+                names = {node.name for node in query.find_all(sge.Placeholder)}
+                dialect = sg.Dialect.get_or_raise(self.dialect)
+                sql = _to_pyformat(sql, dialect, names)
+            if key is not None and self._is_compile_cacheable(expr):
+                cache.set(key, sql)
+
         self._log(sql)
         return sql
 
+    def _compile_bound(
+        self,
+        expr: ir.Expr,
+        *,
+        limit: str | None = None,
+        params: Mapping[ir.Expr, Any] | None = None,
+        pretty: bool = False,
+    ) -> tuple[str, dict[str, Any]]:
+        """Compile `expr` for execution, binding scalar parameters if enabled.
+
+        If `ibis.options.sql.bind_params` is set and the backend's driver
+        supports it, scalar parameters are compiled to placeholders and their
+        values are passed to the driver instead of being inlined as literals.
+        This lets the database reuse query plans across parameter values.
+
+        Returns
+        -------
+        tuple[str, dict[str, Any]]
+            The SQL string and the keyword arguments to pass to `raw_sql`.
+        """
+        if not (params and self._param_style and ibis.options.sql.bind_params):
+            return self.compile(expr, limit=limit, params=params, pretty=pretty), {}
+
+        compiler = self.compiler
+        inlined, values = {}, {}
+        for param, value in params.items():
+            node = param.op()
+            if isinstance(node, ops.Alias):
+                node = node.arg
+            if compiler._is_bindable_param(node.dtype):
+                if value is not None:
+                    value = ops.Literal(value, dtype=node.dtype).value
+                    value = compiler._bound_param_value(value, node.dtype)
+                values[node.name] = value
+            else:
+                inlined[param] = value
+
+        sql = self._compile(
+            expr, limit=limit, params=inlined, pretty=pretty, bind_params=True
+        )
+        return sql, {"params": values}
+
+    def _compile_cache_key(
+        self,
+        expr: ir.Expr,
+        limit: int | str | None,
+        params: Mapping[ir.Expr, Any] | None,
+        pretty: bool,
+        bind_params: bool,
+    ) -> tuple | None:
+        """Construct the compiled SQL cache key, `None` if not cacheable."""
+        if not self._compile_cache.maxsize:
+            return None
+
+        options = ibis.options.sql
+        if limit == "default":
+            limit = options.default_limit
+
+        # operations and values compare with `==`, conflating `0.0` and `-0.0`
+        try:
+            params = frozenset(
+                (param.op(), exact_key(value))
+                for param, value in (params or {}).items()
+            )
+        except TypeError:
+            # unhashable parameter values, e.g., lists for array parameters
+            return None
+
+        return (
+            exact_key(expr.op()),
+            limit,
+            params,
+            bind_params,
+            self.dialect,
+            options.fuse_selects,
+            options.push_down_predicates,
+            options.eliminate_common_subexpressions,
+            options.prune_columns,
+            options.fold_constants,
+            options.egraph_optimize,
+            options.egraph_iterations,
+            options.egraph_timeout,
+            pretty,
+        )
+
+    def _is_compile_cacheable(self, expr: ir.Expr) -> bool:
+        """Whether `expr` may be kept alive by the compiled SQL cache.
+
+        Memtables and cached tables are cleaned up when their operations are
+        garbage collected, which the cache must not prevent.
+        """
+        cached_names = self._cache_name_to_entry
+        return not any(
+            isinstance(table, ops.InMemoryTable) or table.name in cached_names
+            for table in expr.op().find((ops.InMemoryTable, ops.DatabaseTable))
+        )
+
+    def compile_cache_info(self) -> CacheInfo:
+        """Return statistics about the compiled SQL cache.
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple of cache `hits`, `misses`, `maxsize` and `currsize`.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.duckdb.connect()
+        >>> t = ibis.table({"a": "int64"}, name="t")
+        >>> sql = con.compile(t.a.sum())
+        >>> sql = con.compile(t.a.sum())
+        >>> con.compile_cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=256, currsize=1)
+
+        """
+        return self._compile_cache.info()
+
+    def clear_compile_cache(self) -> None:
+        """Discard every cached compiled SQL string and reset the statistics."""
+        self._compile_cache.clear()
+
+    def _persistent_cache_key(self, table: ir.Table) -> str | None:
+        op = table.op()
+        if op.find(ops.InMemoryTable):
+            # in-memory data is not versioned and only lives in this process
+            return None
+        sources = []
+        for source in op.find(ops.DatabaseTable):
+            if (version := self._table_version(source)) is None:
+                return None
+            sources.append(
+                (
+                    source.name,
+                    source.namespace.catalog,
+                    source.namespace.database,
+                    tuple(map(str, source.schema.items())),
+                    version,
+                )
+            )
+        sources.sort(key=repr)
+        token = repr((self.db_identity, self.compile(table), sources))
+        return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+    def _table_version(self, op: ops.DatabaseTable) -> Hashable | None:
+        """Return a value that changes whenever the data in `op` changes.
+
+        Results depending on a table without a version are not persisted
+        across processes.
+        """
+        return None
+
     def _log(self, sql: str) -> None:
         """Log `sql`.
 
@@ -220,13 +438,15 @@ class SQLBackend(BaseBackend):
 
         self._run_pre_execute_hooks(expr)
         table = expr.as_table()
-        sql = self.compile(table, params=params, limit=limit, **kwargs)
+        sql, raw_kwargs = self._compile_bound(
+            table, params=params, limit=limit, **kwargs
+        )
 
         schema = table.schema()
 
         # TODO(kszucs): these methods should be abstractmethods or this default
         # implementation should be removed
-        with self._safe_raw_sql(sql) as cur:
+        with self._safe_raw_sql(sql, **raw_kwargs) as cur:
             result = self._fetch_from_cursor(cur, schema)
         return expr.__pandas_result__(result)
 
@@ -256,9 +476,8 @@ class SQLBackend(BaseBackend):
     ) -> Iterable[list]:
         self._run_pre_execute_hooks(expr)
 
-        with self._safe_raw_sql(
-            self.compile(expr, limit=limit, params=params)
-        ) as cursor:
+        sql, raw_kwargs = self._compile_bound(expr, limit=limit, params=params)
+        with self._safe_raw_sql(sql, **raw_kwargs) as cursor:
             while batch := cursor.fetchmany(chunk_size):
                 yield batch
 
@@ -298,17 +517,39 @@ class SQLBackend(BaseBackend):
         pa = self._import_pyarrow()
 
         schema = expr.as_table().schema()
-        array_type = schema.as_struct().to_pyarrow()
-        arrays = (
-            pa.array(map(tuple, batch), type=array_type)
-            for batch in self._cursor_batches(
-                expr, params=params, limit=limit, chunk_size=chunk_size
-            )
+        batches = self._arrow_batches(
+            expr, params=params, limit=limit, chunk_size=chunk_size
         )
-        batches = map(pa.RecordBatch.from_struct_array, arrays)
-
         return pa.ipc.RecordBatchReader.from_batches(schema.to_pyarrow(), batches)
 
+    def _arrow_batches(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1_000_000,
+    ) -> Iterator[pa.RecordBatch]:
+        """Yield the result of `expr` as record batches.
+
+        Backends whose driver can produce Arrow data natively should override
+        this method. The default converts every batch of rows fetched from the
+        cursor with `_rows_to_arrow`.
+        """
+        schema = expr.as_table().schema()
+        for rows in self._cursor_batches(
+            expr, params=params, limit=limit, chunk_size=chunk_size
+        ):
+            yield self._rows_to_arrow(rows, schema)
+
+    def _rows_to_arrow(
+        self, rows: Iterable[Sequence], schema: sch.Schema
+    ) -> pa.RecordBatch:
+        import pyarrow as pa
+
+        array = pa.array(map(tuple, rows), type=schema.as_struct().to_pyarrow())
+        return pa.RecordBatch.from_struct_array(array)
+
     def insert(
         self,
         table_name: str,
@@ -4,8 +4,8 @@ import abc
 import calendar
 import itertools
 import math
-import operator
 import string
+import weakref
 from functools import partial, reduce
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -17,6 +17,7 @@ import ibis.common.exceptions as com
 import ibis.common.patterns as pats
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
+from ibis.backends.sql.optimizer import CostModel, optimize
 from ibis.backends.sql.rewrites import (
     FirstValue,
     LastValue,
@@ -246,7 +247,7 @@ STAR = sge.Star()
 
 @public
 class SQLGlotCompiler(abc.ABC):
-    __slots__ = "f", "v"
+    __slots__ = "_lowered", "f", "v"
 
     agg = AggGen()
     """A generator for handling aggregate functions"""
@@ -262,6 +263,9 @@ class SQLGlotCompiler(abc.ABC):
     post_rewrites: tuple[type[pats.Replace], ...] = ()
     """A sequence of rewrites to apply to the expression tree after SQL-specific transforms."""
 
+    cost_model: CostModel = CostModel()
+    """The cost model choosing between equivalent plans when `ibis.options.sql.egraph_optimize` is set."""
+
     no_limit_value: sge.Null | None = None
     """The value to use to indicate no limit."""
 
@@ -453,6 +457,7 @@ class SQLGlotCompiler(abc.ABC):
             dialect=self.__class__.dialect, copy=self.__class__.copy_func_args
         )
         self.v = VarGen()
+        self._lowered = weakref.WeakKeyDictionary()
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -566,6 +571,24 @@ class SQLGlotCompiler(abc.ABC):
             this=sge.convert(arg), to=self.type_mapper.from_ibis(to), copy=False
         )
 
+    def _is_bindable_param(self, dtype: dt.DataType) -> bool:
+        """Whether parameters of type `dtype` can be passed to the driver.
+
+        Parameters of other types are always inlined as literals.
+        """
+        return (
+            dtype.is_numeric()
+            or dtype.is_string()
+            or dtype.is_boolean()
+            or dtype.is_date()
+            or dtype.is_time()
+            or dtype.is_timestamp()
+        )
+
+    def _bound_param_value(self, value: Any, dtype: dt.DataType) -> Any:
+        """Convert a normalized parameter value for the driver."""
+        return value
+
     def _prepare_params(self, params):
         result = {}
         for param, value in params.items():
@@ -581,6 +604,7 @@ class SQLGlotCompiler(abc.ABC):
         *,
         limit: str | None = None,
         params: Mapping[ir.Expr, Any] | None = None,
+        bind_params: bool = False,
     ):
         import ibis
 
@@ -594,7 +618,7 @@ class SQLGlotCompiler(abc.ABC):
         if params is None:
             params = {}
 
-        sql = self.translate(table_expr.op(), params=params)
+        sql = self.translate(table_expr.op(), params=params, bind_params=bind_params)
         assert not isinstance(sql, sge.Subquery)
 
         if isinstance(sql, sge.Table):
@@ -603,7 +627,13 @@ class SQLGlotCompiler(abc.ABC):
         assert not isinstance(sql, sge.Subquery)
         return sql
 
-    def translate(self, op, *, params: Mapping[ir.Value, Any]) -> sge.Expression:
+    def translate(
+        self,
+        op,
+        *,
+        params: Mapping[ir.Value, Any],
+        bind_params: bool = False,
+    ) -> sge.Expression:
         """Translate an ibis operation to a sqlglot expression.
 
         Parameters
@@ -612,6 +642,10 @@ class SQLGlotCompiler(abc.ABC):
             An ibis operation
         params
             A mapping of expressions to concrete values
+        bind_params
+            Whether to compile scalar parameters missing from `params` to
+            placeholders whose values are passed to the driver at execution
+            time
         compiler
             An instance of SQLGlotCompiler
         translate_rel
@@ -628,14 +662,28 @@ class SQLGlotCompiler(abc.ABC):
         # substitute parameters immediately to avoid having to define a
         # ScalarParameter translation rule
         params = self._prepare_params(params)
-        if self.lowered_ops:
-            op = op.replace(reduce(operator.or_, self.lowered_ops.values()))
+        if options.sql.egraph_optimize:
+            op = optimize(
+                op,
+                cost=self.cost_model,
+                iterations=options.sql.egraph_iterations,
+                timeout=options.sql.egraph_timeout,
+            )
         op, ctes = sqlize(
             op,
             params=params,
+            bind_params=bind_params,
+            lowered_ops=tuple(self.lowered_ops.values()),
             rewrites=self.rewrites,
             post_rewrites=self.post_rewrites,
             fuse_selects=options.sql.fuse_selects,
+            push_down_predicates=options.sql.push_down_predicates,
+            eliminate_common_subexpressions=(
+                options.sql.eliminate_common_subexpressions
+            ),
+            prune_columns=options.sql.prune_columns,
+            fold_constants=options.sql.fold_constants,
+            memo=self._lowered if options.sql.incremental_compile else None,
         )
 
         aliases = {}
@@ -694,6 +742,9 @@ class SQLGlotCompiler(abc.ABC):
                     f"No translation rule for {type(op).__name__}"
                 )
 
+    def visit_ScalarParameter(self, op, *, dtype, counter):
+        return self.cast(sge.Placeholder(this=op.name), dtype)
+
     def visit_Field(self, op, *, rel, name):
         return sg.column(
             self._gen_valid_name(name), table=rel.alias_or_name, quoted=self.quoted
@@ -113,8 +113,11 @@ class DuckDBCompiler(SQLGlotCompiler):
         *,
         limit: str | None = None,
         params: Mapping[ir.Expr, Any] | None = None,
+        bind_params: bool = False,
     ):
-        sql = super().to_sqlglot(expr, limit=limit, params=params)
+        sql = super().to_sqlglot(
+            expr, limit=limit, params=params, bind_params=bind_params
+        )
 
         table_expr = expr.as_table()
         geocols = table_expr.schema().geospatial
@@ -162,6 +162,7 @@ class MSSQLCompiler(SQLGlotCompiler):
         *,
         limit: str | None = None,
         params: Mapping[ir.Expr, Any] | None = None,
+        bind_params: bool = False,
     ):
         """Compile an Ibis expression to a sqlglot object."""
         import ibis
@@ -175,7 +176,9 @@ class MSSQLCompiler(SQLGlotCompiler):
 
         if conversions:
             table_expr = table_expr.mutate(**conversions)
-        return super().to_sqlglot(table_expr, limit=limit, params=params)
+        return super().to_sqlglot(
+            table_expr, limit=limit, params=params, bind_params=bind_params
+        )
 
     def visit_RandomScalar(self, op):
         # By default RAND() will generate the same value for all calls within a
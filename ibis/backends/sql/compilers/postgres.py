@@ -128,6 +128,7 @@ class PostgresCompiler(SQLGlotCompiler):
         *,
         limit: str | None = None,
         params: Mapping[ir.Expr, Any] | None = None,
+        bind_params: bool = False,
     ):
         table_expr = expr.as_table()
         geocols = table_expr.schema().geospatial
@@ -135,7 +136,9 @@ class PostgresCompiler(SQLGlotCompiler):
 
         if conversions:
             table_expr = table_expr.mutate(**conversions)
-        return super().to_sqlglot(table_expr, limit=limit, params=params)
+        return super().to_sqlglot(
+            table_expr, limit=limit, params=params, bind_params=bind_params
+        )
 
     def _compile_python_udf(self, udf_node: ops.ScalarUDF):
         config = udf_node.__config__
@@ -15,6 +15,14 @@ from ibis.backends.sql.dialects import SQLite
 from ibis.common.temporal import DateUnit, IntervalUnit
 
 
+def _format_temporal(value) -> str:
+    """Format a temporal value the way SQLite does.
+
+    This means " " instead of "T" and no offset suffix for UTC.
+    """
+    return value.isoformat().replace("T", " ").replace("Z", "").replace("+00:00", "")
+
+
 class SQLiteCompiler(SQLGlotCompiler):
     __slots__ = ()
 
@@ -490,6 +498,18 @@ class SQLiteCompiler(SQLGlotCompiler):
     def visit_Xor(self, op, *, left, right):
         return (left.or_(right)).and_(sg.not_(left.and_(right)))
 
+    def visit_ScalarParameter(self, op, *, dtype, counter):
+        # values are converted in `_bound_param_value` to match the
+        # representation of the corresponding literals
+        return sge.Placeholder(this=op.name)
+
+    def _bound_param_value(self, value, dtype):
+        if dtype.is_decimal():
+            return float(value)
+        elif dtype.is_date() or dtype.is_timestamp() or dtype.is_time():
+            return _format_temporal(value)
+        return value
+
     def visit_NonNullLiteral(self, op, *, value, dtype):
         if dtype.is_binary():
             return self.f.unhex(value.hex())
@@ -507,14 +527,8 @@ class SQLiteCompiler(SQLGlotCompiler):
             # To ensure comparisons apply uniformly between temporal values
             # (which are always represented as strings), we need to enforce
             # that temporal literals are formatted the same way that SQLite
-            # formats them. This means " " instead of "T" and no offset suffix
-            # for UTC.
-            value = (
-                value.isoformat()
-                .replace("T", " ")
-                .replace("Z", "")
-                .replace("+00:00", "")
-            )
+            # formats them.
+            value = _format_temporal(value)
             dtype = dt.string(nullable=dtype.nullable)
         elif (
             dtype.is_map()
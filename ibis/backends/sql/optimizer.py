@@ -0,0 +1,287 @@
+"""Cost based optimization of expression graphs using equality saturation.
+
+The expression graph is loaded into an e-graph which is saturated with
+rewrite rules, every rule adding an equivalent form of the operations it
+matches. The cheapest equivalent expression according to a cost model is then
+extracted from the e-graph.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import ibis.common.exceptions as com
+import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
+from ibis.common.annotations import ValidationError
+from ibis.common.egraph import EGraph, ENode, Pattern, Rewrite, Variable
+from ibis.common.patterns import NoMatch
+from ibis.expr.rewrites import (
+    merge_projects,
+    push_filter_into_join,
+    push_filter_into_union,
+    push_filter_through_project,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+class Cost(NamedTuple):
+    """Estimated cost of an operation.
+
+    Costs compare by `total` first, so the cheapest plan is the one doing the
+    least work overall, then by the `per_row` cost of value expressions.
+    """
+
+    total: float
+    """Cost of computing the relations the operation depends on."""
+    per_row: float
+    """Cost of evaluating a value expression for a single row."""
+    rows: float
+    """Estimated number of rows of a relation."""
+
+
+class CostModel:
+    """Estimate the cost of evaluating a query plan.
+
+    The cost of a relation is the cost of its inputs plus the cost of
+    evaluating its value expressions on every row of its inputs, so plans
+    evaluating expressions on fewer rows are preferred. Compilers can use a
+    differently parametrized or subclassed model to reflect their engine.
+
+    Parameters
+    ----------
+    table_rows
+        Estimated number of rows of the tables the query reads.
+    selectivity
+        Estimated fraction of rows kept by a filter.
+    """
+
+    __slots__ = ("selectivity", "table_rows")
+
+    def __init__(self, table_rows: float = 1e6, selectivity: float = 0.5):
+        self.table_rows = table_rows
+        self.selectivity = selectivity
+
+    def __call__(self, enode: ENode, costof: Callable[[ENode], Cost]) -> Cost:
+        if issubclass(enode.head, ops.Relation):
+            return self.relation_cost(enode, costof)
+        elif issubclass(enode.head, ops.Field):
+            # the relation is accounted for where it is used as an input
+            return Cost(0, 1, 0)
+
+        total = per_row = rows = 0
+        for child in enode.__children__:
+            cost = costof(child)
+            total += cost.total
+            per_row += cost.per_row
+            rows = max(rows, cost.rows)
+        return Cost(total, per_row + 1, rows)
+
+    def relation_cost(self, enode: ENode, costof: Callable[[ENode], Cost]) -> Cost:
+        """Estimate the cost of a relation."""
+        total = per_row = 0
+        inputs = []
+        for child in enode.__children__:
+            cost = costof(child)
+            total += cost.total
+            per_row += cost.per_row
+            # the rows of subqueries don't change the rows of the relation
+            if not issubclass(child.head, ops.Value):
+                inputs.append(cost.rows)
+
+        if not inputs:
+            # scan a table
+            inputs.append(self.table_rows)
+            total += self.table_rows
+
+        # every input row is passed through and has its values evaluated
+        total += sum(inputs) * (per_row + 1) + 1
+        return Cost(total, 0, self.estimate_rows(enode, inputs))
+
+    def estimate_rows(self, enode: ENode, inputs: Sequence[float]) -> float:
+        """Estimate the number of rows of a relation given its inputs'."""
+        if issubclass(enode.head, ops.Filter):
+            return max(inputs) * self.selectivity
+        elif issubclass(enode.head, ops.Limit):
+            n = enode.args[enode.head.__argnames__.index("n")]
+            if isinstance(n, int):
+                return min(n, max(inputs))
+        elif issubclass(enode.head, ops.Set):
+            return sum(inputs)
+        return max(inputs)
+
+
+def _guarded(func):
+    """Keep a matched enode as is if the rewritten operation is invalid.
+
+    Enodes created by rewrites are converted back to operations using an
+    arbitrary member of their argument eclasses, some combinations of which
+    don't form valid operations.
+    """
+
+    @functools.wraps(func)
+    def wrapper(egraph, enode, **kwargs):
+        try:
+            return func(egraph, enode, **kwargs)
+        except (com.IbisError, ValidationError):
+            return enode
+
+    return wrapper
+
+
+def _node_rule(rule) -> Callable[..., ENode]:
+    """Apply a graph rewrite rule to the operation of an enode."""
+
+    @_guarded
+    def applier(egraph, enode, **_):
+        node = egraph.term(enode)
+        result = rule.match(node, {})
+        if result is NoMatch or result == node:
+            return enode
+        return result
+
+    return applier
+
+
+def _pattern(head: type, **args: Any) -> Pattern:
+    """Match operations of type `head` binding the unspecified arguments."""
+    prefix = head.__name__.lower()
+    return Pattern(
+        head,
+        [args.get(name, Variable(f"{prefix}_{name}")) for name in head.__argnames__],
+    )
+
+
+_ARITHMETIC = {
+    ops.Add: operator.add,
+    ops.Subtract: operator.sub,
+    ops.Multiply: operator.mul,
+}
+
+
+@_guarded
+def _fold_arithmetic(egraph, enode, left, left_dtype, right, right_dtype, **_):
+    if left is None or right is None:
+        return enode
+    node = enode.head(ops.Literal(left, left_dtype), ops.Literal(right, right_dtype))
+    dtype = node.dtype
+    if not (dtype.is_integer() or dtype.is_floating()):
+        return enode
+
+    value = _ARITHMETIC[enode.head](left, right)
+    if dtype.is_integer() and not dtype.bounds.lower <= value <= dtype.bounds.upper:
+        return enode
+    return ops.Literal(value, dtype)
+
+
+@_guarded
+def _fold_not(egraph, enode, value, **_):
+    if value is None:
+        return enode
+    return ops.Literal(not value, dt.boolean)
+
+
+@_guarded
+def _remove_cast(egraph, enode, cast_arg, cast_to, **_):
+    if egraph.term(cast_arg).dtype == cast_to:
+        return cast_arg
+    return enode
+
+
+_x = Variable("x")
+_true = Pattern(ops.Literal, (True, dt.boolean))
+_false = Pattern(ops.Literal, (False, dt.boolean))
+
+
+RELATION_RULES = (
+    Rewrite(
+        _pattern(ops.Filter, parent=_pattern(ops.Project)),
+        _node_rule(push_filter_through_project),
+    ),
+    Rewrite(
+        _pattern(ops.Filter, parent=_pattern(ops.JoinChain)),
+        _node_rule(push_filter_into_join),
+    ),
+    Rewrite(
+        _pattern(ops.Filter, parent=_pattern(ops.Union)),
+        _node_rule(push_filter_into_union),
+    ),
+    Rewrite(
+        _pattern(ops.Project, parent=_pattern(ops.Project)),
+        _node_rule(merge_projects),
+    ),
+)
+"""Rules commuting filters with projections, joins and unions."""
+
+VALUE_RULES = (
+    *(
+        Rewrite(
+            _pattern(
+                head,
+                left=Pattern(ops.Literal, (Variable("left"), Variable("left_dtype"))),
+                right=Pattern(
+                    ops.Literal, (Variable("right"), Variable("right_dtype"))
+                ),
+            ),
+            _fold_arithmetic,
+        )
+        for head in _ARITHMETIC
+    ),
+    Rewrite(
+        Pattern(ops.Not, (Pattern(ops.Literal, (Variable("value"), dt.boolean)),)),
+        _fold_not,
+    ),
+    Rewrite(Pattern(ops.Not, (Pattern(ops.Not, (_x,)),)), _x),
+    Rewrite(Pattern(ops.And, (_x, _true)), _x),
+    Rewrite(Pattern(ops.And, (_true, _x)), _x),
+    Rewrite(Pattern(ops.And, (_x, _false)), _false),
+    Rewrite(Pattern(ops.And, (_false, _x)), _false),
+    Rewrite(Pattern(ops.Or, (_x, _false)), _x),
+    Rewrite(Pattern(ops.Or, (_false, _x)), _x),
+    Rewrite(Pattern(ops.Or, (_x, _true)), _true),
+    Rewrite(Pattern(ops.Or, (_true, _x)), _true),
+    Rewrite(_pattern(ops.Cast), _remove_cast),
+)
+"""Rules folding constants, simplifying boolean expressions and removing
+redundant casts."""
+
+RULES = RELATION_RULES + VALUE_RULES
+
+
+def optimize(
+    node: ops.Node,
+    *,
+    rules: Sequence[Rewrite] = RULES,
+    cost: Callable[[ENode, Callable[[ENode], Any]], Any] | None = None,
+    iterations: int = 8,
+    timeout: float | None = None,
+) -> ops.Node:
+    """Rewrite an expression graph to the cheapest equivalent graph.
+
+    Parameters
+    ----------
+    node
+        The root of the expression graph.
+    rules
+        The rewrite rules adding equivalent forms of the matched operations.
+    cost
+        The cost model to extract the cheapest graph with, see
+        `EGraph.extract`. Defaults to a `CostModel` instance.
+    iterations
+        The maximum number of times the rules are applied to the whole graph.
+    timeout
+        The number of seconds after which no more rules are applied.
+
+    Returns
+    -------
+    Node
+        The cheapest expression graph equivalent to `node` found.
+    """
+    egraph = EGraph()
+    root = egraph.add(node)
+    egraph.run(rules, n=iterations, timeout=timeout)
+    return egraph.extract(root, cost=cost or CostModel())
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import operator
 import sys
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping
 from functools import reduce
 from typing import TYPE_CHECKING, Any
 
@@ -15,16 +15,17 @@ import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 from ibis.common.annotations import attribute
-from ibis.common.collections import FrozenDict  # noqa: TC001
+from ibis.common.collections import FrozenOrderedDict  # noqa: TC001
 from ibis.common.deferred import var
 from ibis.common.graph import Graph
 from ibis.common.patterns import InstanceOf, Object, Pattern, replace
 from ibis.common.typing import VarTuple  # noqa: TC001
-from ibis.expr.rewrites import d, p, replace_parameter
+from ibis.expr.rewrites import d, p, push_filters_down, replace_parameter
+from ibis.expr.rewrites import fold_constants as constant_folding
 from ibis.expr.schema import Schema
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
 x = var("x")
 y = var("y")
@@ -50,7 +51,7 @@ class Select(ops.Relation):
     """Relation modelled after SQL's SELECT statement."""
 
     parent: ops.Relation
-    selections: FrozenDict[str, ops.Value] = {}
+    selections: FrozenOrderedDict[str, ops.Value] = {}
     predicates: VarTuple[ops.Value[dt.Boolean]] = ()
     qualified: VarTuple[ops.Value[dt.Boolean]] = ()
     sort_keys: VarTuple[ops.SortKey] = ()
@@ -240,6 +241,21 @@ def complexity(node):
     return node.map_nodes(accum)[node]
 
 
+@replace(Object(Select))
+def drop_true_select_predicates(_, **kwargs):
+    """Remove the predicates of a Select which are always true."""
+
+    def is_true(pred):
+        return isinstance(pred, ops.Literal) and pred.value is True
+
+    if not any(map(is_true, _.predicates + _.qualified)):
+        return _
+    return _.copy(
+        predicates=tuple(pred for pred in _.predicates if not is_true(pred)),
+        qualified=tuple(pred for pred in _.qualified if not is_true(pred)),
+    )
+
+
 @replace(Object(Select, Object(Select)))
 def merge_select_select(_, **kwargs):
     """Merge subsequent Select relations into one.
@@ -332,6 +348,264 @@ def merge_select_select(_, **kwargs):
     return result if complexity(result) <= complexity(_) else _
 
 
+CSE_MIN_SAVINGS = 4
+"""Minimum number of value nodes whose repeated evaluation hoisting a common
+subexpression must save, hoisting cheap expressions isn't worth a subquery."""
+
+
+def _repeated_subexpressions(
+    values: Sequence[ops.Value], parent: ops.Relation
+) -> dict[ops.Value, int]:
+    """Count the occurrences of the repeated row-level subexpressions."""
+    blocking = (
+        ops.Reduction,
+        ops.Analytic,
+        ops.WindowFunction,
+        ops.Subquery,
+        ops.Unnest,
+        ops.Impure,
+    )
+    trivial = (ops.Field, ops.Literal, ops.SortKey)
+
+    graph = {}
+    for value in values:
+        graph.update(Graph.from_bfs(value, filter=ops.Value))
+
+    counts = dict.fromkeys(values, 0)
+    for value in values:
+        counts[value] += 1
+    for children in graph.values():
+        for child in children:
+            counts[child] = counts.get(child, 0) + 1
+
+    return {
+        node: count
+        for node, count in counts.items()
+        if count > 1
+        and not isinstance(node, trivial)
+        and node.relations == {parent}
+        and not node.find(blocking, filter=ops.Value)
+    }
+
+
+def _common_subexpressions(
+    parent: ops.Relation, values: Sequence[ops.Value]
+) -> dict[str, ops.Value]:
+    """Pick the repeated subexpressions of `values` worth computing once.
+
+    Subexpressions are picked greedily, the ones saving the most repeated
+    evaluations first, until the savings fall below `CSE_MIN_SAVINGS`.
+    """
+    hoisted = {}
+    while True:
+        best, savings = None, 0
+        for node, count in _repeated_subexpressions(values, parent).items():
+            saved = (count - 1) * len(Graph.from_bfs(node, filter=ops.Value))
+            if saved > savings:
+                best, savings = node, saved
+        if savings < CSE_MIN_SAVINGS:
+            return hoisted
+
+        i = len(hoisted)
+        while (name := f"_ibis_cse_{i}") in parent.schema:
+            i += 1
+        hoisted[name] = best
+
+        # stand in a field of a placeholder table for the picked expression
+        # so its occurrences aren't counted again
+        placeholder = ops.Field(ops.UnboundTable(name, {name: best.dtype}), name)
+        values = [v.replace({best: placeholder}, filter=ops.Value) for v in values]
+
+
+@replace(Object(Select) | p.Aggregate)
+def hoist_common_subexpressions(_, **kwargs):
+    """Compute repeated value subexpressions once in an intermediate Select.
+
+    Expressions like regex extractions or JSON parsing repeated across the
+    clauses of a query are otherwise evaluated for each of their occurrences
+    by engines that don't eliminate common subexpressions on their own.
+    Predicates that don't reference a hoisted expression are evaluated by the
+    intermediate Select, so the hoisted expressions are computed only for the
+    rows passing them.
+    """
+    if isinstance(_, Select):
+        clauses = {
+            "selections": _.selections,
+            "predicates": _.predicates,
+            "qualified": _.qualified,
+            "sort_keys": _.sort_keys,
+        }
+    else:
+        clauses = {"groups": _.groups, "metrics": _.metrics}
+
+    values = []
+    for clause in clauses.values():
+        values.extend(clause.values() if isinstance(clause, Mapping) else clause)
+
+    if not (hoisted := _common_subexpressions(_.parent, values)):
+        return _
+    exprs = set(hoisted.values())
+
+    pushed = ()
+    if isinstance(_, Select):
+        pushed = tuple(
+            pred
+            for pred in _.predicates
+            if not pred.find(exprs.__contains__, filter=ops.Value)
+        )
+        clauses["predicates"] = tuple(
+            pred for pred in _.predicates if pred not in pushed
+        )
+
+    fields = {name: ops.Field(_.parent, name) for name in _.parent.schema}
+    inner = Select(_.parent, selections={**fields, **hoisted}, predicates=pushed)
+
+    subs = {expr: ops.Field(inner, name) for name, expr in hoisted.items()}
+
+    def rewrite(value):
+        # rebind every value bound to the parent, not only its fields but
+        # also the reductions over it like CountStar, to the intermediate Select
+        return value.replace(subs, filter=ops.Value, replacements={_.parent: inner})
+
+    kwargs = {}
+    for name, clause in clauses.items():
+        if isinstance(clause, Mapping):
+            kwargs[name] = {k: rewrite(v) for k, v in clause.items()}
+        else:
+            kwargs[name] = tuple(map(rewrite, clause))
+
+    return _.copy(parent=inner, **kwargs)
+
+
+def _require_fields(values: Iterable[ops.Value], required: dict) -> None:
+    """Record the columns of the relations referenced by `values`."""
+    for value in values:
+        for node in Graph.from_bfs(value, filter=ops.Value):
+            if isinstance(node, ops.Field):
+                required.setdefault(node.rel, set()).add(node.name)
+            elif isinstance(node, ops.CountStar):
+                # counting the rows doesn't need any particular column
+                required.setdefault(node.arg, set())
+            elif isinstance(node, ops.Value):
+                for child in node.__children__:
+                    if isinstance(child, ops.Relation):
+                        required[child] = set(child.schema)
+
+
+def _project(rel: ops.Relation, names: Sequence[str]) -> ops.Relation:
+    if tuple(rel.schema) == tuple(names):
+        return rel
+    return Select(rel, selections={name: ops.Field(rel, name) for name in names})
+
+
+def _prune_columns(root: ops.Relation) -> ops.Relation:
+    """Remove the columns not needed to compute `root` from every relation.
+
+    Relations only ever reference the columns of their inputs through fields,
+    so the columns each relation has to provide are collected from its
+    consumers, visiting the consumers before the relations they consume. The
+    graph is then rebuilt bottom-up with the unneeded selections, metrics and
+    join outputs removed.
+
+    Distinct selects and set operations other than `UNION ALL` keep all of
+    their columns since removing any of them would change their results.
+    """
+    passthrough = (ops.Reference, ops.Limit, ops.Sample)
+
+    required: dict[ops.Relation, set[str]] = {root: set(root.schema)}
+    kept: dict[ops.Relation, list[str]] = {}
+
+    ordered, _ = Graph.from_bfs(root).toposort()
+    for node in reversed(ordered):
+        if not isinstance(node, ops.Relation):
+            continue
+
+        names = required.get(node, set())
+        if isinstance(node, Select) and not node.distinct:
+            selections = [k for k in node.selections if k in names]
+            # a select must produce at least one column
+            kept[node] = selections = selections or list(node.selections)[:1]
+            values = [node.selections[k] for k in selections]
+            values.extend((*node.predicates, *node.qualified, *node.sort_keys))
+        elif isinstance(node, ops.Aggregate):
+            metrics = [k for k in node.metrics if k in names]
+            if not node.groups and not metrics:
+                metrics = list(node.metrics)[:1]
+            kept[node] = metrics
+            values = [*node.groups.values(), *(node.metrics[k] for k in metrics)]
+        elif isinstance(node, ops.JoinChain):
+            columns = [k for k in node.values if k in names]
+            kept[node] = columns = columns or list(node.values)[:1]
+            values = [node.values[k] for k in columns]
+            for link in node.rest:
+                values.extend(link.predicates)
+            for table in node.tables:
+                required.setdefault(table, set())
+        elif isinstance(node, passthrough):
+            required.setdefault(node.parent, set()).update(names)
+            values = [v for v in node.__children__ if isinstance(v, ops.Value)]
+        elif isinstance(node, ops.Union) and not node.distinct:
+            # both sides have to provide the same columns in the same order
+            kept[node] = [k for k in node.schema if k in names] or list(node.schema)[:1]
+            for child in (node.left, node.right):
+                required.setdefault(child, set()).update(kept[node])
+            values = []
+        else:
+            values = []
+            for child in node.__children__:
+                if isinstance(child, ops.Relation):
+                    required[child] = set(child.schema)
+                elif isinstance(child, ops.Value):
+                    values.append(child)
+
+        _require_fields(values, required)
+
+    # only traverse the parts of the graph which are still needed, the fields
+    # of removed columns would be invalid in the pruned relations
+    live = set()
+    queue = [root]
+    while queue:
+        node = queue.pop()
+        if node in live:
+            continue
+        live.add(node)
+        if (names := kept.get(node)) is None:
+            queue.extend(node.__children__)
+        elif isinstance(node, Select):
+            queue.append(node.parent)
+            queue.extend(node.selections[k] for k in names)
+            queue.extend((*node.predicates, *node.qualified, *node.sort_keys))
+        elif isinstance(node, ops.Aggregate):
+            queue.append(node.parent)
+            queue.extend(node.groups.values())
+            queue.extend(node.metrics[k] for k in names)
+        elif isinstance(node, ops.JoinChain):
+            queue.append(node.first)
+            queue.extend(node.rest)
+            queue.extend(node.values[k] for k in names)
+        else:
+            queue.extend(node.__children__)
+
+    def prune(node, kwargs):
+        if (names := kept.get(node)) is None:
+            return node.__recreate__(kwargs) if kwargs else node
+
+        args = dict(zip(node.__argnames__, node.__args__))
+        args.update(kwargs or {})
+        if isinstance(node, Select):
+            args["selections"] = {k: args["selections"][k] for k in names}
+        elif isinstance(node, ops.Aggregate):
+            args["metrics"] = {k: args["metrics"][k] for k in names}
+        elif isinstance(node, ops.JoinChain):
+            args["values"] = {k: args["values"][k] for k in names}
+        else:
+            args["left"] = _project(args["left"], names)
+            args["right"] = _project(args["right"], names)
+        return node.__recreate__(args)
+
+    return root.replace(prune, filter=live.__contains__)
+
+
 def extract_ctes(node: ops.Relation) -> set[ops.Relation]:
     cte_types = (Select, ops.Aggregate, ops.JoinChain, ops.Set, ops.Limit, ops.Sample)
     dont_count = (ops.Field, ops.CountStar, ops.CountDistinctStar)
@@ -347,12 +621,89 @@ def extract_ctes(node: ops.Relation) -> set[ops.Relation]:
     return result
 
 
+def _literal_keys(node: ops.Node) -> tuple:
+    """The exact representations of the literals of the graph of `node`."""
+    return tuple(lit.__intern_key__ for lit in node.find(ops.Literal))
+
+
+def exact_key(value: Any) -> Any:
+    """Key `value` so that it only matches interchangeable values.
+
+    Operations and parameter values compare with `==`, which conflates values
+    like `0.0` and `-0.0`, so they are keyed along with the exact
+    representation of their literals or of themselves.
+    """
+    if isinstance(value, ops.Node):
+        return (value, _literal_keys(value))
+    elif value is None or type(value) in (bool, int, str):
+        return value
+    return (type(value), value, repr(value))
+
+
+def _lower(
+    node: ops.Relation,
+    passes: Sequence[tuple[Pattern, dict | None]],
+    memo: MutableMapping[ops.Node, tuple] | None,
+    key: tuple | None,
+) -> ops.Relation:
+    """Apply the replace passes one after another, reusing memoized results.
+
+    Every pass is a bottom-up rewrite, so the result of a pass for a subtree
+    only depends on that subtree. This allows seeding the passes with the
+    results recorded for previously lowered relations found in the graph so
+    only the new nodes on top of them have to be rewritten.
+    """
+    if memo is None or key is None:
+        for replacer, context in passes:
+            node = node.replace(replacer, context=context)
+        return node
+
+    hits = {}
+
+    def unseen(node):
+        if isinstance(node, ops.Relation):
+            entry = memo.get(node)
+            if (
+                entry is not None
+                and entry[0] == key
+                and entry[1] == _literal_keys(node)
+            ):
+                hits[node] = entry[2]
+                return False
+        return True
+
+    Graph.from_bfs(node, filter=unseen)
+
+    root = node
+    current = dict(zip(hits, hits))
+    stages = []
+    for i, (replacer, context) in enumerate(passes):
+        seeds = {}
+        for hit, outputs in hits.items():
+            output = hit if outputs[i] is None else outputs[i]
+            seeds[current[hit]] = current[hit] = output
+        node = node.replace(replacer, context=context, replacements=seeds)
+        stages.append(node)
+
+    # the recorded stages must not reference the weakly held key
+    stages = tuple(None if stage is root else stage for stage in stages)
+    memo[root] = (key, _literal_keys(root), stages)
+    return node
+
+
 def sqlize(
     node: ops.Node,
     params: Mapping[ops.ScalarParameter, Any],
+    bind_params: bool = False,
+    lowered_ops: Sequence[Pattern] = (),
     rewrites: Sequence[Pattern] = (),
     post_rewrites: Sequence[Pattern] = (),
     fuse_selects: bool = True,
+    push_down_predicates: bool = False,
+    eliminate_common_subexpressions: bool = False,
+    prune_columns: bool = False,
+    fold_constants: bool = False,
+    memo: MutableMapping[ops.Node, tuple] | None = None,
 ) -> tuple[ops.Node, list[ops.Node]]:
     """Lower the ibis expression graph to a SQL-like relational algebra.
 
@@ -362,12 +713,35 @@ def sqlize(
         The root node of the expression graph.
     params
         A mapping of scalar parameters to their values.
+    bind_params
+        Whether to keep scalar parameters missing from `params` in the graph
+        so they can be bound by the driver at execution time.
+    lowered_ops
+        Rewrites lowering operations unsupported by the backend, applied
+        before anything else.
     rewrites
         Supplementary rewrites to apply before SQL-specific transforms.
     post_rewrites
         Supplementary rewrites to apply after SQL-specific transforms.
     fuse_selects
         Whether to merge subsequent Select nodes into one where possible.
+    push_down_predicates
+        Whether to apply filter predicates before projections, joins and
+        unions where possible.
+    eliminate_common_subexpressions
+        Whether to compute expensive value subexpressions repeated within a
+        query once in an intermediate Select.
+    prune_columns
+        Whether to remove the columns not needed to compute the result from
+        the intermediate relations.
+    fold_constants
+        Whether to evaluate the value expressions of literals at compile time
+        and drop the branches and predicates which are known to be skipped.
+    memo
+        Optional weak-keyed mapping to record the lowered relations in. Any
+        previously lowered relation found in the graph is reused instead of
+        being lowered again, so expressions built incrementally on top of
+        each other only pay for their new nodes.
 
     Returns
     -------
@@ -376,13 +750,21 @@ def sqlize(
     """
     assert isinstance(node, ops.Relation)
 
+    passes = []
+    # lower the operations the backend doesn't support natively
+    if lowered_ops:
+        passes.append((reduce(operator.or_, lowered_ops), None))
+
     # apply the backend specific rewrites
     if rewrites:
-        node = node.replace(reduce(operator.or_, rewrites))
+        passes.append((reduce(operator.or_, rewrites), None))
+
+    if push_down_predicates:
+        passes.append((push_filters_down, None))
 
     # lower the expression graph to a SQL-like relational algebra
-    context = {"params": params}
-    result = node.replace(
+    context = {"params": params, "bind_params": bind_params}
+    lowering = (
         replace_parameter
         | remove_aliases
         | project_to_select
@@ -392,16 +774,47 @@ def sqlize(
         | fill_null_to_select
         | drop_null_to_select
         | drop_columns_to_select
-        | first_to_firstvalue,
-        context=context,
+        | first_to_firstvalue
     )
+    passes.append((lowering, context))
+
+    # must come after lowering so the substituted parameters are folded too
+    if fold_constants:
+        passes.append((constant_folding | drop_true_select_predicates, None))
 
     # squash subsequent Select nodes into one
     if fuse_selects:
-        result = result.replace(merge_select_select)
+        passes.append((merge_select_select, None))
 
     if post_rewrites:
-        result = result.replace(reduce(operator.or_, post_rewrites))
+        passes.append((reduce(operator.or_, post_rewrites), None))
+
+    # must come after fusing, the intermediate selects would be merged otherwise
+    if eliminate_common_subexpressions:
+        passes.append((hoist_common_subexpressions, None))
+
+    try:
+        key = (
+            frozenset((param, exact_key(value)) for param, value in params.items()),
+            bind_params,
+            tuple(lowered_ops),
+            tuple(rewrites),
+            tuple(post_rewrites),
+            fuse_selects,
+            push_down_predicates,
+            eliminate_common_subexpressions,
+            fold_constants,
+        )
+    except TypeError:
+        # unhashable parameter values, don't memoize
+        key = None
+
+    result = _lower(node, passes, memo=memo, key=key)
+
+    # pruning depends on the consumers of the relations rather than just their
+    # inputs, so it can't be memoized like the bottom-up passes
+    if prune_columns:
+        result = _prune_columns(result)
 
     # extract common table expressions while wrapping them in a CTE node
     ctes = extract_ctes(result)
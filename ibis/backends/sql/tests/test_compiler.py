@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import math
+
+import pytest
 import sqlglot as sg
 
 import ibis
+import ibis.backends.sql.compilers as sc
+import ibis.expr.operations as ops
 from ibis import _
 from ibis.backends.sql.dialects import Trino
+from ibis.backends.sql.optimizer import optimize
 
 
 def test_window_with_row_number_compiles():
@@ -26,3 +32,266 @@ def test_transpile_join():
         "SELECT * FROM t1 JOIN t2 ON x = y", read="duckdb", write=Trino
     )
     assert "CROSS JOIN" not in result
+
+
+def test_incremental_compile_reuses_lowered_relations(monkeypatch):
+    compiler = sc.duckdb.compiler
+    t = ibis.table({"a": "int64", "b": "string"}, name="t")
+    expr1 = t.filter(t.a > 1).mutate(c=t.a + 1)
+    expr2 = expr1.filter(expr1.c < 10).select("b", "c")
+
+    monkeypatch.setattr(ibis.options.sql, "incremental_compile", False)
+    expected1 = compiler.to_sqlglot(expr1).sql("duckdb")
+    expected2 = compiler.to_sqlglot(expr2).sql("duckdb")
+    assert expr1.op() not in compiler._lowered
+
+    monkeypatch.setattr(ibis.options.sql, "incremental_compile", True)
+    assert compiler.to_sqlglot(expr1).sql("duckdb") == expected1
+    *_, stages1 = compiler._lowered[expr1.op()]
+
+    assert compiler.to_sqlglot(expr2).sql("duckdb") == expected2
+    *_, stages2 = compiler._lowered[expr2.op()]
+    # the lowered form of the first expression is reused as is
+    lowered1 = stages1[-2]
+    assert lowered1 is not None
+    assert stages2[-2].find_below(lambda node: node is lowered1)
+
+    # entries don't outlive the expressions
+    num_entries = len(compiler._lowered)
+    del expr1, expr2
+    assert len(compiler._lowered) == num_entries - 2
+
+
+def test_incremental_compile_signed_zero(monkeypatch):
+    compiler = sc.duckdb.compiler
+    t = ibis.table({"a": "float64"}, name="t")
+    positive = t.filter(t.a > 0.0)
+    negative = t.filter(t.a > -0.0)
+
+    monkeypatch.setattr(ibis.options.sql, "incremental_compile", True)
+    assert "-0.0" not in compiler.to_sqlglot(positive).sql("duckdb")
+    # the relations compare equal but their lowered forms aren't shared
+    assert positive.op() == negative.op()
+    assert "-0.0" in compiler.to_sqlglot(negative.select("a")).sql("duckdb")
+
+
+def test_eliminate_common_subexpressions(monkeypatch):
+    t = ibis.table({"a": "string", "b": "int64"}, name="t")
+    key = t.a.re_extract(r"(\d+)-x", 1)
+    expr = t.filter(key != "", t.b > 1).mutate(k=key, u=key.upper()).order_by(key)
+    agg = t.group_by(k=key).agg(n=key.length().sum(), m=(t.b + 1).max())
+
+    monkeypatch.setattr(ibis.options.sql, "eliminate_common_subexpressions", False)
+    assert ibis.to_sql(expr, dialect="duckdb").count("REGEXP_EXTRACT") == 4
+    assert ibis.to_sql(agg, dialect="duckdb").count("REGEXP_EXTRACT") == 2
+
+    monkeypatch.setattr(ibis.options.sql, "eliminate_common_subexpressions", True)
+    sql = ibis.to_sql(expr, dialect="duckdb")
+    assert sql.count("REGEXP_EXTRACT") == 1
+    # predicates independent of the hoisted expression filter rows first
+    (inner,) = sg.parse_one(sql, read="duckdb").find_all(sg.exp.Subquery)
+    assert inner.this.args["where"].sql("duckdb") == 'WHERE "t0"."b" > 1'
+    assert ibis.to_sql(agg, dialect="duckdb").count("REGEXP_EXTRACT") == 1
+
+    # reductions over the whole parent are rebound to the intermediate Select
+    counted = t.group_by(k=key).agg(n=t.count(), m=key.length().sum())
+    sql = ibis.to_sql(counted, dialect="duckdb")
+    assert sql.count("REGEXP_EXTRACT") == 1
+    assert "COUNT(*)" in sql
+
+    # cheap expressions aren't worth a subquery
+    cheap = t.mutate(c=t.b + 1, d=(t.b + 1) * 2)
+    assert "_ibis_cse" not in ibis.to_sql(cheap, dialect="duckdb")
+
+
+def test_eliminate_common_subexpressions_results(monkeypatch):
+    con = ibis.sqlite.connect()
+    t = con.create_table(
+        "t", ibis.memtable({"a": ["1-x", "22-x", "x", "3-x"], "b": [1, 2, 3, 4]})
+    )
+    key = t.a.re_extract(r"(\d+)-x", 1)
+    expr = (
+        t.filter(key != "", t.b > 1)
+        .mutate(k=key, u=key.length() + t.b)
+        .order_by(key.length().desc(), "b")
+    )
+    agg = (
+        t.group_by(k=key.length()).agg(n=key.length().sum(), c=t.count()).order_by("k")
+    )
+
+    expected = [con.execute(e) for e in (expr, agg)]
+    monkeypatch.setattr(ibis.options.sql, "eliminate_common_subexpressions", True)
+    assert "_ibis_cse" in con.compile(expr)
+    for e, exp in zip((expr, agg), expected):
+        assert con.execute(e).equals(exp)
+
+
+def test_prune_columns(monkeypatch):
+    t = ibis.table({**{f"c{i}": "int64" for i in range(100)}, "k": "int64"}, "t")
+    u = ibis.table({**{f"d{i}": "int64" for i in range(100)}, "k": "int64"}, "u")
+    left = t.mutate(x=t.c0 + 1).filter(_.x > 1)
+    left = left.mutate(w=ibis.row_number().over(order_by=left.c1))
+    right = u.mutate(y=u.d0 * 2)
+    expr = left.join(right, "k").select("c2", "x", "y", "w")
+
+    monkeypatch.setattr(ibis.options.sql, "prune_columns", True)
+    sql = sg.parse_one(ibis.to_sql(expr, dialect="duckdb"), read="duckdb")
+    selects = {
+        tuple(col.alias_or_name for col in select.expressions)
+        for select in sql.find_all(sg.exp.Select)
+    }
+    assert selects == {
+        ("c2", "x", "y", "w"),
+        ("c2", "k", "x", "w"),
+        ("c1", "c2", "k", "x"),
+        ("k", "y"),
+    }
+
+    # distinct selects and set operations keep the columns they depend on
+    distinct = t.select("c0", "c1").distinct().select("c0")
+    assert '"c1"' in ibis.to_sql(distinct, dialect="duckdb")
+    mutated = t.mutate(z=t.c0 + 1)
+    union = mutated.union(mutated, distinct=True).select("c0")
+    assert '"c1"' in ibis.to_sql(union, dialect="duckdb")
+
+
+def test_prune_columns_results(monkeypatch):
+    con = ibis.sqlite.connect()
+    t = con.create_table(
+        "t",
+        ibis.memtable(
+            {"a": [1, 2, 2, 3], "b": [4, 5, 6, 7], "c": ["x", "y", "z", "w"]}
+        ),
+    )
+    exprs = [
+        t.mutate(d=t.a + t.b).join(t.mutate(e=t.b * 2), "a").select("d", "e"),
+        t.mutate(d=t.b * 2).group_by("a").agg(s=_.d.sum(), m=_.c.max()).select("s"),
+        t.mutate(d=t.a + 1).union(t.mutate(d=t.b + 1)).select("d"),
+        t.mutate(d=t.a + 1).union(t.mutate(d=t.a + 1), distinct=True).select("a"),
+        t.select("a", "c").distinct().select("a"),
+        t.mutate(d=t.a + 1).filter(_.d > 2).count(),
+    ]
+
+    expected = [con.execute(expr) for expr in exprs]
+    monkeypatch.setattr(ibis.options.sql, "prune_columns", True)
+    for expr, exp in zip(exprs, expected):
+        result = con.execute(expr)
+        if isinstance(exp, int):
+            assert result == exp
+        else:
+            key = list(exp.columns)
+            result = result.sort_values(key).reset_index(drop=True)
+            assert result.equals(exp.sort_values(key).reset_index(drop=True))
+
+
+def test_fold_constants(monkeypatch):
+    t = ibis.table({"a": "int64", "b": "string"}, "t")
+    n = ibis.param("int64")
+    expr = t.filter(t.a > n + 1, ibis.literal(True)).select(
+        c=ibis.ifelse(n > 1, t.b + "x" + "y", "z"),
+        d=ibis.coalesce(ibis.null("int64"), n * 2, t.a),
+    )
+
+    monkeypatch.setattr(ibis.options.sql, "fold_constants", True)
+    sql = ibis.to_sql(expr, dialect="duckdb", params={n: 2})
+    assert 'WHERE\n  "t0"."a" > 3' in sql
+    assert "TRUE" not in sql
+    assert "CASE" not in sql
+    assert "COALESCE" not in sql
+    assert "4 AS" in sql
+
+
+def test_fold_constants_results(monkeypatch):
+    con = ibis.sqlite.connect()
+    t = con.create_table("t", ibis.memtable({"a": [1, 2, 3], "b": ["x", None, "z"]}))
+    expr = t.filter(t.a >= ibis.literal(1) + 1, ibis.literal(2) > 1).mutate(
+        c=ibis.coalesce(ibis.null("string"), t.b, "w" + ibis.literal("v")),
+        d=ibis.cases((ibis.literal(1) > 2, 0), (t.a > 2, t.a), else_=-t.a),
+        e=ibis.literal(-7) // 2 + t.a,
+        f=ibis.literal(7) % -2 + t.a,
+    )
+
+    expected = con.execute(expr)
+    monkeypatch.setattr(ibis.options.sql, "fold_constants", True)
+    assert "TRUE" not in ibis.to_sql(expr)
+    assert con.execute(expr).equals(expected)
+
+
+def test_egraph_optimize(monkeypatch):
+    t = ibis.table({"a": "int64", "b": "int64"}, "t")
+    u = ibis.table({"a": "int64", "b": "int64"}, "u")
+    expr = t.filter(~~(t.a.cast("int64") > ibis.literal(2) + 3), t.b > 0)
+    union = t.union(u).filter(_.a > 1)
+
+    monkeypatch.setattr(ibis.options.sql, "egraph_optimize", True)
+    sql = ibis.to_sql(expr, dialect="duckdb")
+    assert "NOT" not in sql
+    assert "CAST" not in sql
+    assert '"t0"."a" > 5' in sql
+
+    # the filter is applied to both branches of the union
+    sql = sg.parse_one(ibis.to_sql(union, dialect="duckdb"), read="duckdb")
+    assert isinstance(sql, sg.exp.Union)
+    assert len(list(sql.find_all(sg.exp.Where))) == 2
+
+    # filters on expensive computed columns stay above the projection
+    w = t.select(x=t.a.cast("float64").ln() * 2, b=t.b)
+    sql = ibis.to_sql(w.filter(w.x > 1), dialect="duckdb")
+    assert sql.count("LN(") == 1
+
+
+def test_egraph_optimize_results(monkeypatch):
+    con = ibis.sqlite.connect()
+    t = con.create_table("t", ibis.memtable({"a": [1, 2, 2, 3], "b": [4, 5, None, 7]}))
+    exprs = [
+        t.mutate(c=t.a + 1).filter(_.c > 2, _.b.notnull() | ibis.literal(False)),
+        t.join(t.mutate(d=t.b * 2), "a").filter(_.d > 8, _.a < 3),
+        t.union(t.mutate(a=t.a * 10)).filter(_.a > (ibis.literal(1) + 1)),
+        t.filter((_.b.cast("int64") > 4) & ibis.literal(True)).count(),
+        t.select(c=ibis.cases((t.a > 2, 2), else_=3), b=t.b),
+    ]
+
+    expected = [con.execute(expr) for expr in exprs]
+    monkeypatch.setattr(ibis.options.sql, "egraph_optimize", True)
+    for expr, exp in zip(exprs, expected):
+        result = con.execute(expr)
+        if isinstance(exp, int):
+            assert result == exp
+        else:
+            key = list(exp.columns)
+            result = result.sort_values(key).reset_index(drop=True)
+            assert result.equals(exp.sort_values(key).reset_index(drop=True))
+
+
+def test_egraph_optimize_signed_zero():
+    # folding yields -0.0 which must not join the eclass of the 0.0 operand
+    expr = (ibis.literal(0.0) * -1).atan2(-1)
+    result = optimize(expr.op())
+    assert isinstance(result.left, ops.Literal)
+    assert math.copysign(1, result.left.value) == -1
+
+
+@pytest.mark.parametrize(
+    ("func", "call"), [(ibis.random, "RANDOM()"), (ibis.uuid, "UUID()")]
+)
+def test_egraph_optimize_impure(monkeypatch, func, call):
+    t = ibis.table({"a": "int64"}, "t")
+    expr = t.mutate(x=func()).select(y=_.x, z=_.x).filter(_.y != _.z).count()
+
+    monkeypatch.setattr(ibis.options.sql, "egraph_optimize", True)
+    # the impure value isn't inlined into both columns
+    assert ibis.to_sql(expr, dialect="duckdb").count(call) == 1
+
+
+def test_egraph_optimize_impure_results(monkeypatch):
+    # sqlite flattens subqueries evaluating their impure values once per
+    # reference on its own, duckdb keeps them
+    pytest.importorskip("duckdb")
+    con = ibis.duckdb.connect()
+    t = con.create_table("t", ibis.memtable({"a": list(range(200))}))
+    expr = t.mutate(x=ibis.random()).select(y=_.x, z=_.x)
+
+    monkeypatch.setattr(ibis.options.sql, "egraph_optimize", True)
+    result = con.execute(expr)
+    assert len(result) == 200
+    assert result.y.equals(result.z)
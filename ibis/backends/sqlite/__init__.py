@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import functools
+import os
 import sqlite3
 from typing import TYPE_CHECKING, Any
 
@@ -23,7 +24,7 @@ from ibis.backends.sqlite.converter import SQLitePandasData
 from ibis.backends.sqlite.udf import ignore_nulls, register_all
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Mapping
+    from collections.abc import Iterator
     from pathlib import Path
 
     import pandas as pd
@@ -43,9 +44,43 @@ def _quote(name: str) -> str:
     return sg.to_identifier(name, quoted=True).sql("sqlite")
 
 
+def _is_native(dtype: dt.DataType) -> bool:
+    return (
+        dtype.is_integer()
+        or dtype.is_floating()
+        or dtype.is_string()
+        or dtype.is_binary()
+        or dtype.is_null()
+    )
+
+
+def _to_sqlite_values(array: pa.Array) -> list:
+    """Convert `array` into a list of values that SQLite can bind.
+
+    Temporal values are formatted the way the pandas adapter registered by
+    `_init_sqlite3` formats them, so both upload paths store the same text.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    typ = array.type
+    if pa.types.is_timestamp(typ):
+        fmt = "%Y-%m-%dT%H:%M:%S%z" if typ.tz is not None else "%Y-%m-%dT%H:%M:%S"
+        array = pc.strftime(array, format=fmt)
+        # match `isoformat`: drop all-zero fractions, render nanoseconds
+        # only when present and put a colon in the UTC offset
+        array = pc.replace_substring_regex(array, r"\.0+([+-]\d{4})?$", r"\1")
+        array = pc.replace_substring_regex(array, r"(\.\d{6})000([+-]\d{4})?$", r"\1\2")
+        array = pc.replace_substring_regex(array, r"([+-]\d\d)(\d\d)$", r"\1:\2")
+    elif pa.types.is_date(typ):
+        array = array.cast(pa.string())
+    return array.to_pylist()
+
+
 class Backend(SQLBackend, UrlFromPath):
     name = "sqlite"
     compiler = sc.sqlite.compiler
+    _param_style = "named"
     supports_python_udfs = True
 
     @property
@@ -91,7 +126,11 @@ class Backend(SQLBackend, UrlFromPath):
         """
         _init_sqlite3()
 
-        self.con = sqlite3.connect(":memory:" if database is None else database)
+        # the async methods run queries in worker threads, the sqlite3 module
+        # serializes access to the connection itself
+        self.con = sqlite3.connect(
+            ":memory:" if database is None else database, check_same_thread=False
+        )
 
         self._post_connect(type_map)
 
@@ -133,6 +172,8 @@ class Backend(SQLBackend, UrlFromPath):
     def raw_sql(self, query: str | sg.Expression, **kwargs: Any) -> Any:
         if not isinstance(query, str):
             query = query.sql(dialect=self.name)
+        if (params := kwargs.pop("params", None)) is not None:
+            return self.con.execute(query, params, **kwargs)
         return self.con.execute(query, **kwargs)
 
     @contextlib.contextmanager
@@ -140,6 +181,9 @@ class Backend(SQLBackend, UrlFromPath):
         with contextlib.closing(self.raw_sql(*args, **kwargs)) as result:
             yield result
 
+    def _interrupt(self) -> None:
+        self.con.interrupt()
+
     @contextlib.contextmanager
     def begin(self):
         cur = self.con.cursor()
@@ -316,29 +360,37 @@ class Backend(SQLBackend, UrlFromPath):
         df = pd.DataFrame.from_records(cursor, columns=schema.names, coerce_float=True)
         return SQLitePandasData.convert_table(df, schema)
 
-    @util.experimental
-    def to_pyarrow_batches(
-        self,
-        expr: ir.Expr,
-        *,
-        params: Mapping[ir.Scalar, Any] | None = None,
-        limit: int | str | None = None,
-        chunk_size: int = 1_000_000,
-        **_: Any,
-    ) -> pa.ipc.RecordBatchReader:
+    def _rows_to_arrow(self, rows: list[tuple], schema: sch.Schema) -> pa.RecordBatch:
         import pyarrow as pa
 
-        self._run_pre_execute_hooks(expr)
+        # SQLite is dynamically typed and only returns integers, floats, text
+        # and blobs, so other types are coerced by the pandas converter
+        if all(map(_is_native, schema.types)):
+            with contextlib.suppress(pa.ArrowInvalid, pa.ArrowTypeError):
+                return super()._rows_to_arrow(rows, schema)
 
-        schema = expr.as_table().schema()
-        with self._safe_raw_sql(
-            self.compile(expr, limit=limit, params=params)
-        ) as cursor:
-            df = self._fetch_from_cursor(cursor, schema)
-        table = pa.Table.from_pandas(
+        df = self._fetch_from_cursor(rows, schema)
+        return pa.RecordBatch.from_pandas(
             df, schema=schema.to_pyarrow(), preserve_index=False
         )
-        return table.to_reader(max_chunksize=chunk_size)
+
+    def _table_version(self, op: ops.DatabaseTable) -> tuple[int, ...] | None:
+        database = op.namespace.database or "main"
+        with self._safe_raw_sql("PRAGMA database_list") as cur:
+            files = {name: file for _, name, file in cur.fetchall()}
+        if not (path := files.get(database)):
+            # in-memory and temporary databases don't outlive the connection
+            return None
+        version = []
+        # in WAL mode commits are appended to the write-ahead log and only
+        # reach the database file when it's checkpointed
+        for file in (path, f"{path}-wal"):
+            try:
+                stat = os.stat(file)
+            except FileNotFoundError:
+                continue
+            version += stat.st_mtime_ns, stat.st_size
+        return tuple(version)
 
     def _generate_create_table(self, table: sge.Table, schema: sch.Schema):
         target = sge.Schema(this=table, expressions=schema.to_sqlglot(self.dialect))
@@ -348,16 +400,45 @@ class Backend(SQLBackend, UrlFromPath):
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
         table = sg.table(op.name, quoted=self.compiler.quoted, catalog="temp")
         create_stmt = self._generate_create_table(table, op.schema).sql(self.name)
-        df = op.data.to_frame()
 
-        data = df.itertuples(index=False)
+        with self.begin() as cur:
+            cur.execute(create_stmt)
+            self._insert_arrow(
+                cur,
+                op.name,
+                op.data.to_pyarrow(op.schema),
+                schema=op.schema,
+                catalog="temp",
+            )
+
+    def _insert_arrow(
+        self,
+        cur: sqlite3.Cursor,
+        name: str,
+        data: pa.Table,
+        *,
+        schema: sch.Schema,
+        catalog: str | None = None,
+        chunk_size: int = 100_000,
+    ) -> None:
+        """Insert `data` into the columns of `schema` in table `name`.
+
+        Rows are inserted one chunk at a time: each chunk is converted
+        column-wise from Arrow into values SQLite can bind and loaded with a
+        single `executemany` call. Progress is reported through
+        `ibis.options.verbose`.
+        """
         insert_stmt = self._build_insert_template(
-            op.name, schema=op.schema, catalog="temp", columns=True
+            name, schema=schema, catalog=catalog, columns=True
         )
 
-        with self.begin() as cur:
-            cur.execute(create_stmt)
-            cur.executemany(insert_stmt, data)
+        total = data.num_rows
+        inserted = 0
+        for batch in data.to_batches(max_chunksize=chunk_size):
+            values = map(_to_sqlite_values, batch.columns)
+            cur.executemany(insert_stmt, zip(*values))
+            inserted += batch.num_rows
+            util.log(f"{self.name}: inserted {inserted}/{total} rows into {name}")
 
     def _register_udfs(self, expr: ir.Expr) -> None:
         import ibis.expr.operations as ops
@@ -463,15 +544,17 @@ class Backend(SQLBackend, UrlFromPath):
         if schema is not None:
             schema = ibis.schema(schema)
 
+        data = insert_query = None
         if obj is not None:
             if not isinstance(obj, ir.Expr):
                 obj = ibis.memtable(obj)
 
-            self._run_pre_execute_hooks(obj)
-
-            insert_query = self.compiler.to_sqlglot(obj)
-        else:
-            insert_query = None
+            if isinstance(op := obj.op(), ops.InMemoryTable):
+                # in-memory data is loaded straight into the new table
+                data = op.data.to_pyarrow(op.schema)
+            else:
+                self._run_pre_execute_hooks(obj)
+                insert_query = self.compiler.to_sqlglot(obj)
 
         if temp:
             if database not in (None, "temp"):
@@ -493,8 +576,9 @@ class Backend(SQLBackend, UrlFromPath):
                 name, catalog=database, quoted=self.compiler.quoted
             )
 
+        target_schema = schema or obj.schema()
         create_stmt = self._generate_create_table(
-            created_table, schema=(schema or obj.schema())
+            created_table, schema=target_schema
         ).sql(self.name)
 
         with self.begin() as cur:
@@ -506,6 +590,14 @@ class Backend(SQLBackend, UrlFromPath):
                         self.name
                     )
                 )
+            elif data is not None:
+                self._insert_arrow(
+                    cur,
+                    created_table.name,
+                    data,
+                    schema=sch.Schema(dict(zip(target_schema, op.schema.types))),
+                    catalog=database,
+                )
 
             if overwrite:
                 cur.execute(
@@ -601,6 +693,25 @@ class Backend(SQLBackend, UrlFromPath):
         if not isinstance(obj, ir.Expr):
             obj = ibis.memtable(obj)
 
+        if isinstance(op := obj.op(), ops.InMemoryTable):
+            # load in-memory data directly instead of going through a
+            # temporary table; same column matching as `_build_insert_from_table`
+            target_cols = self.get_schema(table_name, database=database).keys()
+            source_cols = op.schema.keys()
+            columns = source_cols if source_cols <= target_cols else target_cols
+            schema = sch.Schema(dict(zip(columns, op.schema.types)))
+            with self.begin() as cur:
+                if overwrite:
+                    cur.execute(sge.Delete(this=table).sql(self.dialect))
+                self._insert_arrow(
+                    cur,
+                    table_name,
+                    op.data.to_pyarrow(op.schema),
+                    schema=schema,
+                    catalog=database,
+                )
+            return
+
         self._run_pre_execute_hooks(obj)
 
         query = self._build_insert_from_table(
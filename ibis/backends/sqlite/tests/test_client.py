@@ -4,11 +4,15 @@ import os
 import sqlite3
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 import pytest
 from pytest import param
 
 import ibis
 import ibis.expr.operations as ops
+from ibis.backends.sqlite import Backend
 from ibis.conftest import not_windows
 
 
@@ -96,3 +100,241 @@ def test_list_temp_tables_by_default(con):
     con.create_table(name, schema={"a": "int"}, temp=True)
     assert name in con.list_tables(database="temp")
     assert name in con.list_tables()
+
+
+def test_bind_params(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "bind_params", True)
+
+    con = ibis.sqlite.connect()
+    t = con.create_table(
+        "t",
+        ibis.memtable(
+            {"a": [1, 2, 3], "d": ["2024-01-01", "2024-01-02", "2024-01-03"]}
+        ).mutate(d=ibis._.d.cast("date")),
+    )
+    value = ibis.param("int64")
+    start = ibis.param("date")
+    expr = t.filter(t.a > value, t.d >= start).a.sum()
+
+    sql, kwargs = con._compile_bound(expr, params={value: 0, start: "2024-01-02"})
+    assert ":param_" in sql
+    assert kwargs["params"][start.op().name] == "2024-01-02"
+
+    assert con.execute(expr, params={value: 0, start: "2024-01-02"}) == 5
+    assert con.execute(expr, params={value: 2, start: "2024-01-01"}) == 3
+
+
+@pytest.mark.parametrize("coerce", [False, True], ids=["native_types", "coerced_types"])
+def test_to_pyarrow_batches(coerce):
+    con = ibis.sqlite.connect()
+    t = con.create_table(
+        "t",
+        ibis.memtable(
+            {
+                "a": [1, 2, None, 4, 5],
+                "b": [0.5, None, 1.5, 2.0, 2.5],
+                "c": ["x", "y", "z", None, "w"],
+                "d": ["2024-01-01", "2024-01-02", None, "2024-01-04", "2024-01-05"],
+                "e": [True, False, None, True, False],
+            }
+        ),
+    )
+    expr = t.mutate(d=t.d.cast("date")) if coerce else t.drop("d", "e")
+
+    with con.to_pyarrow_batches(expr, chunk_size=2) as reader:
+        assert reader.schema == expr.schema().to_pyarrow()
+        batches = list(reader)
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    result = pa.Table.from_batches(batches)
+    assert result.equals(expr.to_pyarrow())
+    assert result["a"].to_pylist() == [1, 2, None, 4, 5]
+    if coerce:
+        assert result["d"].type == pa.date32()
+        assert result["e"].to_pylist() == [True, False, None, True, False]
+
+
+@pytest.mark.parametrize("tz", [None, "UTC", "America/New_York"])
+@pytest.mark.parametrize("unit", ["s", "us", "ns"])
+def test_to_sqlite_values_matches_isoformat(tz, unit):
+    from ibis.backends.sqlite import _to_sqlite_values
+
+    values = pd.Series(
+        pd.to_datetime(
+            [
+                "2024-01-01",
+                "2024-01-01 01:02:03.5",
+                "2024-01-01 01:02:03.000001",
+                "2024-01-01 01:02:03.000000007",
+                None,
+            ],
+            format="ISO8601",
+        )
+    )
+    if tz is not None:
+        values = values.dt.tz_localize(tz)
+    array = pa.array(values).cast(pa.timestamp(unit, tz), safe=False)
+
+    expected = [None if pd.isna(v) else v.isoformat() for v in array.to_pandas()]
+    assert _to_sqlite_values(array) == expected
+
+
+def test_insert_in_memory_data(monkeypatch):
+    messages = []
+    monkeypatch.setattr(ibis.options, "verbose", True)
+    monkeypatch.setattr(ibis.options, "verbose_log", messages.append)
+
+    con = ibis.sqlite.connect()
+    df = pd.DataFrame(
+        {"a": range(5), "d": pd.date_range("2024-01-01", periods=5, tz="UTC")}
+    )
+    t = con.create_table("t", df)
+    con.insert("t", df.iloc[:2])
+    con.insert("t", df[["a"]], overwrite=True)
+
+    assert messages == [
+        "sqlite: inserted 5/5 rows into t",
+        "sqlite: inserted 2/2 rows into t",
+        "sqlite: inserted 5/5 rows into t",
+    ]
+    result = t.execute()
+    assert result.a.tolist() == list(range(5))
+    assert result.d.isna().all()
+
+
+def test_persistent_cache(tmp_path, monkeypatch):
+    path = tmp_path / "test.db"
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(ibis.options.cache, "directory", cache_dir)
+
+    con = ibis.sqlite.connect(path)
+    con.create_table("t", pd.DataFrame({"x": [1, 2, 3]}))
+    with con.table("t").mutate(y=lambda t: t.x * 2).cache() as cached:
+        assert cached.execute().y.tolist() == [2, 4, 6]
+    (entry,) = os.listdir(cache_dir)
+
+    # a new connection reuses the persisted result instead of recomputing it
+    con = ibis.sqlite.connect(path)
+    with monkeypatch.context() as m:
+        m.setattr(type(con), "to_pyarrow", None)
+        with con.table("t").mutate(y=lambda t: t.x * 2).cache() as cached:
+            assert cached.execute().y.tolist() == [2, 4, 6]
+    assert os.listdir(cache_dir) == [entry]
+
+    # modifying the source table invalidates the entry
+    con.insert("t", pd.DataFrame({"x": [4]}))
+    with con.table("t").mutate(y=lambda t: t.x * 2).cache() as cached:
+        assert cached.count().execute() == 4
+    assert len(os.listdir(cache_dir)) == 2
+
+    # in-memory data is never persisted
+    assert con._persistent_cache_key(ibis.memtable({"x": [1]})) is None
+
+
+def test_persistent_cache_wal(tmp_path, monkeypatch):
+    path = tmp_path / "test.db"
+    monkeypatch.setattr(ibis.options.cache, "directory", tmp_path / "cache")
+
+    con = ibis.sqlite.connect(path)
+    con.raw_sql("PRAGMA journal_mode=wal").close()
+    con.create_table("t", pd.DataFrame({"x": [1, 2]}))
+    with con.table("t").cache() as cached:
+        assert cached.count().execute() == 2
+
+    # commits of other connections only reach the write-ahead log
+    with sqlite3.connect(path) as other:
+        other.execute("INSERT INTO t VALUES (3)")
+    other.close()
+    assert os.path.exists(f"{path}-wal")
+
+    with con.table("t").cache() as cached:
+        assert cached.count().execute() == 3
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_execute_many(tmp_path, monkeypatch, pooled):
+    monkeypatch.setattr(Backend, "supports_connection_pool", pooled)
+    con = ibis.sqlite.connect(tmp_path / "test.db")
+    t = con.create_table("t", pd.DataFrame({"x": [1, 2, 3]}))
+    n = ibis.param("int64")
+    exprs = [t.x.sum() + n, t.filter(t.x > n).count(), t.x.max() * n]
+
+    results = con.execute_many(exprs, params={n: 1}, max_workers=2)
+    assert [result for result, _ in results] == [7, 2, 3]
+    assert all(elapsed >= 0 for _, elapsed in results)
+    assert con.execute_many([]) == []
+
+
+def test_execute_many_async():
+    import asyncio
+
+    con = ibis.sqlite.connect()
+    t = con.create_table("t", pd.DataFrame({"x": [1, 2, 3]}))
+    results = asyncio.run(con.execute_many_async([t.x.sum(), t.x.min()]))
+    assert [result for result, _ in results] == [6, 1]
+
+
+def test_async_methods():
+    import asyncio
+
+    con = ibis.sqlite.connect()
+    t = con.create_table("t", pd.DataFrame({"x": [1, 2, 3]}))
+
+    async def run():
+        result = await con.execute_async(t.x.sum())
+        table = await con.to_pyarrow_async(t)
+        batches = [
+            batch async for batch in con.to_pyarrow_batches_async(t, chunk_size=2)
+        ]
+        cur = await con.raw_sql_async("SELECT COUNT(*) FROM t")
+        (count,) = cur.fetchone()
+        cur.close()
+        return result, table, batches, count
+
+    result, table, batches, count = asyncio.run(run())
+    assert result == 6
+    assert table.column("x").to_pylist() == [1, 2, 3]
+    assert pa.Table.from_batches(batches).equals(table)
+    assert count == 3
+
+
+def test_async_cancellation_interrupts_query():
+    import asyncio
+
+    con = ibis.sqlite.connect()
+    query = """
+    WITH RECURSIVE r(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM r)
+    SELECT MAX(i) FROM r
+    """
+
+    async def run():
+        task = asyncio.create_task(con.raw_sql_async(query))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert con.execute(ibis.literal(1)) == 1
+
+
+def test_execute_dtype_backend(monkeypatch):
+    con = ibis.sqlite.connect()
+    df = pd.DataFrame({"x": pd.array([1, None], dtype="Int64"), "y": ["a", None]})
+    t = con.create_table("t", df)
+
+    result = t.execute(dtype_backend="numpy_nullable")
+    assert result.x.dtype == pd.Int64Dtype()
+    assert result.y.dtype == pd.StringDtype()
+
+    monkeypatch.setattr(ibis.options, "dtype_backend", "pyarrow")
+    result = t.x.to_pandas()
+    assert result.dtype == pd.ArrowDtype(pa.int64())
+    assert result.isna().tolist() == [False, True]
+    (batch,) = t.to_pandas_batches(dtype_backend="numpy")
+    assert batch.x.dtype == np.float64
+
+    # the backend's own methods accept it too
+    result = con.execute(t, dtype_backend="numpy_nullable")
+    assert result.x.dtype == pd.Int64Dtype()
+    assert con.to_pandas(t.x, dtype_backend="numpy").dtype == np.float64
@@ -40,6 +40,7 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase):
     compiler = sc.trino.compiler
     supports_create_or_replace = False
     supports_temporary_tables = False
+    supports_connection_pool = True
 
     def _from_url(self, url: ParseResult, **kwargs):
         catalog, db = url.path.strip("/").split("/")
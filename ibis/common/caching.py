@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import functools
-from typing import TYPE_CHECKING
+import os
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable
+
+    import pyarrow as pa
 
 
 def memoize(func: Callable) -> Callable:
@@ -22,3 +28,216 @@ def memoize(func: Callable) -> Callable:
             return result
 
     return wrapper
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """A bounded mapping evicting the least recently used entries first.
+
+    Parameters
+    ----------
+    maxsize
+        The maximum number of entries to keep.
+    """
+
+    __slots__ = ("_entries", "hits", "maxsize", "misses")
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value cached for `key` or `default`."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache `value` for `key`, evicting the oldest entries if full."""
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove the entry for `key` and return its value or `default`."""
+        return self._entries.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+class CacheFile(NamedTuple):
+    key: str
+    path: Path
+    size: int
+    last_used: float
+
+
+class PersistentCache:
+    """Arrow tables persisted as Parquet files in a directory.
+
+    Entries survive the process and are evicted least recently used first
+    once their total size exceeds `max_size`.
+
+    Parameters
+    ----------
+    directory
+        The directory holding the cached files, created if missing.
+    max_size
+        The maximum total size of the cached files in bytes, unbounded if
+        [](`None`).
+    """
+
+    __slots__ = ("directory", "max_size")
+
+    suffix = ".parquet"
+
+    def __init__(self, directory: str | Path, max_size: int | None = None) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def get(self, key: str) -> pa.Table | None:
+        """Return the table cached for `key` or [](`None`)."""
+        import pyarrow.parquet as pq
+
+        path = self._path(key)
+        try:
+            table = pq.read_table(path)
+        except FileNotFoundError:
+            return None
+        # the modification time doubles as the last time the entry was used
+        path.touch()
+        return table
+
+    def set(self, key: str, table: pa.Table) -> None:
+        """Persist `table` for `key`, evicting old entries if needed."""
+        import pyarrow.parquet as pq
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that concurrent readers never
+        # see a partially written entry
+        tmp = self.directory / f".{key}.{uuid.uuid4().hex}.tmp"
+        try:
+            pq.write_table(table, tmp)
+            os.replace(tmp, self._path(key))
+        finally:
+            tmp.unlink(missing_ok=True)
+        self.evict()
+
+    def entries(self) -> list[CacheFile]:
+        """Return the cached entries, least recently used first."""
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            key = path.name.removesuffix(self.suffix)
+            entries.append(CacheFile(key, path, stat.st_size, stat.st_mtime))
+        entries.sort(key=lambda entry: entry.last_used)
+        return entries
+
+    def evict(self) -> list[str]:
+        """Remove least recently used entries until within `max_size`.
+
+        Returns
+        -------
+        list[str]
+            The keys of the removed entries.
+        """
+        if self.max_size is None:
+            return []
+        entries = self.entries()
+        total = sum(entry.size for entry in entries)
+        removed = []
+        for entry in entries:
+            if total <= self.max_size:
+                break
+            entry.path.unlink(missing_ok=True)
+            total -= entry.size
+            removed.append(entry.key)
+        return removed
+
+    def purge(self, *keys: str) -> list[str]:
+        """Remove the entries for `keys`, or all entries if none are given.
+
+        Returns
+        -------
+        list[str]
+            The keys of the removed entries.
+        """
+        if not keys:
+            keys = [entry.key for entry in self.entries()]
+        removed = []
+        for key in keys:
+            path = self._path(key)
+            if path.exists():
+                path.unlink(missing_ok=True)
+                removed.append(key)
+        return removed
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+
+    p = ArgumentParser(description="Inspect and purge a persistent ibis cache.")
+    p.add_argument("directory", type=Path, help="The cache directory.")
+    commands = p.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List the cached entries.")
+    purge = commands.add_parser("purge", help="Remove cached entries.")
+    purge.add_argument(
+        "keys", nargs="*", help="Keys of the entries to remove, all if omitted."
+    )
+    purge.add_argument(
+        "--max-size",
+        type=int,
+        default=None,
+        help="Only evict least recently used entries beyond this many bytes.",
+    )
+    args = p.parse_args()
+
+    if args.command == "list":
+        cache = PersistentCache(args.directory)
+        for entry in cache.entries():
+            print(f"{entry.key}\t{entry.size}")  # noqa: T201
+    elif args.max_size is not None:
+        cache = PersistentCache(args.directory, max_size=args.max_size)
+        for key in cache.evict():
+            print(key)  # noqa: T201
+    else:
+        cache = PersistentCache(args.directory)
+        for key in cache.purge(*args.keys):
+            print(key)  # noqa: T201
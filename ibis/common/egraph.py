@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import collections
+import decimal
 import itertools
-import math
+import time
 from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
 from typing import Any, TypeVar
 
@@ -13,13 +14,47 @@ from ibis.util import promote_list
 K = TypeVar("K", bound=Hashable)
 
 
+def _substitute(obj: Any, func: Callable[[Node], Any]) -> Any:
+    """Apply `func` to the nodes of a possibly nested argument.
+
+    Unlike the graph traversal helpers this preserves the types of the
+    containers, so the results remain hashable and keep their semantics, for
+    example the order of a `FrozenOrderedDict`.
+    """
+    if isinstance(obj, Node):
+        return func(obj)
+    elif isinstance(obj, (tuple, list)):
+        return tuple(_substitute(item, func) for item in obj)
+    elif isinstance(obj, dict):
+        return type(obj)({k: _substitute(v, func) for k, v in obj.items()})
+    else:
+        return obj
+
+
+def _exact(value: Any) -> Any:
+    """Key a leaf value so that it only equals interchangeable values.
+
+    Comparing with `==` would conflate values like `0.0` and `-0.0`, so the
+    terms using them would end up in the same eclass.
+    """
+    if isinstance(value, (float, complex, decimal.Decimal)):
+        return (type(value), repr(value))
+    elif isinstance(value, tuple):
+        return tuple(map(_exact, value))
+    elif isinstance(value, Mapping):
+        return (type(value), tuple((k, _exact(v)) for k, v in value.items()))
+    return value
+
+
 class DisjointSet(Mapping[K, set[K]]):
     """Disjoint set data structure.
 
     Also known as union-find data structure. It is a data structure that keeps
     track of a set of elements partitioned into a number of disjoint (non-overlapping)
     subsets. It provides near-constant-time operations to add new sets, to merge
-    existing sets, and to determine whether elements are in the same set.
+    existing sets, and to determine whether elements are in the same set, by
+    merging the smaller sets into the larger ones and compressing the paths to
+    the representative ids while looking them up.
 
     Parameters
     ----------
@@ -92,8 +127,7 @@ class DisjointSet(Mapping[K, set[K]]):
             the given id.
 
         """
-        id = self._parents[id]
-        return self._classes[id]
+        return self._classes[self.find(id)]
 
     def __iter__(self) -> Iterator[K]:
         """Iterate over the ids in the disjoint set."""
@@ -119,7 +153,9 @@ class DisjointSet(Mapping[K, set[K]]):
         """
         if not isinstance(other, DisjointSet):
             return NotImplemented
-        return self._parents == other._parents
+        if len(self) != len(other):
+            return False
+        return all(self.find(id) == other.find(id) for id in self._parents)
 
     def copy(self) -> DisjointSet:
         """Make a copy of the disjoint set.
@@ -132,7 +168,7 @@ class DisjointSet(Mapping[K, set[K]]):
         """
         ds = DisjointSet()
         ds._parents = self._parents.copy()
-        ds._classes = self._classes.copy()
+        ds._classes = {id: members.copy() for id, members in self._classes.items()}
         return ds
 
     def add(self, id: K) -> K:
@@ -153,7 +189,7 @@ class DisjointSet(Mapping[K, set[K]]):
 
         """
         if id in self._parents:
-            return self._parents[id]
+            return self.find(id)
         self._parents[id] = id
         self._classes[id] = {id}
         return id
@@ -174,7 +210,18 @@ class DisjointSet(Mapping[K, set[K]]):
             The canonicalized id for the given id.
 
         """
-        return self._parents[id]
+        parents = self._parents
+        parent = parents[id]
+        while parent != id:
+            # path halving: point every other id on the path to its grandparent
+            # which keeps the trees flat without a second pass
+            grandparent = parents[parent]
+            if grandparent == parent:
+                return parent
+            parents[id] = grandparent
+            id = grandparent
+            parent = parents[id]
+        return id
 
     def union(self, id1, id2) -> bool:
         """Merge the classes that the given ids are in.
@@ -196,26 +243,23 @@ class DisjointSet(Mapping[K, set[K]]):
 
         """
         # Find the root of each class
-        id1 = self._parents[id1]
-        id2 = self._parents[id2]
+        id1 = self.find(id1)
+        id2 = self.find(id2)
         if id1 == id2:
             return False
 
-        # Merge the smaller eclass into the larger one, aka. union-find by size
+        # Attach the root of the smaller class to the root of the larger one,
+        # aka. union by size, so the trees stay logarithmically shallow
         class1 = self._classes[id1]
         class2 = self._classes[id2]
         if len(class1) >= len(class2):
             id1, id2 = id2, id1
             class1, class2 = class2, class1
+        self._parents[id1] = id2
 
-        # Update the parent pointers, this is called path compression but done
-        # during the union operation to keep the find operation minimal
-        for id in class1:
-            self._parents[id] = id2
-
-        # Do the actual merging and clear the other eclass
+        # Merge the members and drop the class of the former root
         class2 |= class1
-        class1.clear()
+        del self._classes[id1]
 
         return True
 
@@ -237,7 +281,7 @@ class DisjointSet(Mapping[K, set[K]]):
             True if the ids are connected, False otherwise.
 
         """
-        return self._parents[id1] == self._parents[id2]
+        return self.find(id1) == self.find(id2)
 
     def verify(self):
         """Verify that the disjoint set is not corrupted.
@@ -253,7 +297,7 @@ class DisjointSet(Mapping[K, set[K]]):
 
         """
         for id in self._parents:
-            if id not in self._classes[self._parents[id]]:
+            if id not in self._classes[self.find(id)]:
                 raise RuntimeError(
                     f"DisjointSet is corrupted: {id} is not in its class"
                 )
@@ -447,8 +491,8 @@ class DynamicApplier(Slotted):
     def substitute(self, egraph, enode, subst):
         kwargs = {k: v for k, v in subst.items() if isinstance(k, str)}
         result = self.func(egraph, enode, **kwargs)
-        if not isinstance(result, ENode):
-            raise TypeError(f"applier must return an ENode, got {type(result)}")
+        if not isinstance(result, Node):
+            raise TypeError(f"applier must return a Node, got {type(result)}")
         return result
 
 
@@ -507,6 +551,23 @@ class ENode(Slotted, Node):
         argstring = ", ".join(map(repr, self.args))
         return f"E{self.head.__name__}({argstring})"
 
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if type(other) is not ENode:
+            return NotImplemented
+        # compare the precomputed hashes first to avoid comparing the argument
+        # trees of different enodes
+        return (
+            self.__precomputed_hash__ == other.__precomputed_hash__
+            and self.head == other.head
+            and self.args == other.args
+            and _exact(self.args) == _exact(other.args)
+        )
+
+    def __hash__(self) -> int:
+        return self.__precomputed_hash__
+
     def __lt__(self, other):
         return False
 
@@ -514,16 +575,18 @@ class ENode(Slotted, Node):
     def from_node(cls, node: Any):
         """Convert an `ibis.common.graph.Node` to an `ENode`."""
 
-        def mapper(node, _, **kwargs):
-            return cls(node.__class__, kwargs.values())
+        def mapper(node, results, /, **_):
+            args = [_substitute(arg, results.__getitem__) for arg in node.__args__]
+            return cls(node.__class__, args)
 
         return node.map(mapper)[node]
 
     def to_node(self):
         """Convert the ENode back to an `ibis.common.graph.Node`."""
 
-        def mapper(node, _, **kwargs):
-            return node.head(**kwargs)
+        def mapper(node, results, /, **_):
+            args = (_substitute(arg, results.__getitem__) for arg in node.args)
+            return node.head(*args)
 
         return self.map(mapper)[self]
 
@@ -534,33 +597,84 @@ class ENode(Slotted, Node):
 
 
 class EGraph:
-    __slots__ = ("_eclasses", "_etables", "_nodes")
-    _nodes: dict
-    _etables: collections.defaultdict
+    """Equality graph storing equivalence classes of nodes, called eclasses.
+
+    Eclasses are identified by their canonical enode. Following the egg paper,
+    merging eclasses only records them in a worklist and the congruence
+    invariant, that enodes with equivalent arguments belong to the same
+    eclass, is restored in a single `rebuild` step after applying a batch of
+    rewrites instead of after every merge.
+    """
+
+    __slots__ = (
+        "_eclasses",
+        "_etables",
+        "_nodes",
+        "_parents",
+        "_terms",
+        "_worklist",
+    )
     _eclasses: DisjointSet
+    _etables: collections.defaultdict
+    _nodes: dict
+    _parents: dict
+    _terms: dict
+    _worklist: list
 
     def __init__(self):
-        # store the nodes before converting them to enodes, so we can spare the initial
-        # node traversal and omit the creation of enodes
+        # store the nodes added to the egraph along with their enodes, so adding or
+        # looking up an already added node spares converting it to enodes; they
+        # are keyed by identity since `==` conflates values like `0.0` and `-0.0`
         self._nodes = {}
-        # map enode heads to their eclass ids and their arguments, this is required for
-        # the relational e-matching (Node => dict[type, tuple[Union[ENode, Any], ...]])
+        # and the other way around, so converting enodes back to nodes reuses the
+        # nodes which have already been constructed
+        self._terms = {}
+        # map enode heads to their canonical enodes and their arguments, this is
+        # required for the relational e-matching (type => dict[ENode, tuple])
         self._etables = collections.defaultdict(dict)
         # map enodes to their eclass, this is the heart of the egraph
         self._eclasses = DisjointSet()
+        # map eclasses to the enodes using them as arguments, these have to be
+        # canonicalized when the eclass gets merged with another
+        self._parents = {}
+        # eclasses merged since the last rebuild
+        self._worklist = []
 
     def __repr__(self):
         return f"EGraph({self._eclasses})"
 
-    def _as_enode(self, node: Node) -> ENode:
-        """Convert a node to an enode."""
-        # order is important here since ENode is a subclass of Node
-        if isinstance(node, ENode):
-            return node
-        elif isinstance(node, Node):
-            return self._nodes.get(node) or ENode.from_node(node)
-        else:
-            raise TypeError(node)
+    def _lookup(self, node: Node) -> ENode:
+        """Find the eclass of a node which must be present in the egraph."""
+        if not isinstance(node, ENode):
+            if (entry := self._nodes.get(id(node))) is not None:
+                return self._eclasses.find(entry[1])
+            node = ENode.from_node(node)
+        if node in self._eclasses:
+            return self._eclasses.find(node)
+        args = tuple(_substitute(arg, self._lookup) for arg in node.args)
+        return self._eclasses.find(ENode(node.head, args))
+
+    def _canonicalize(self, enode: ENode) -> ENode:
+        """Replace the arguments of an enode with their canonical enodes."""
+        args = tuple(_substitute(arg, self._eclasses.find) for arg in enode.args)
+        return enode if args == enode.args else ENode(enode.head, args)
+
+    def _insert(self, enode: ENode) -> ENode:
+        """Add an enode whose arguments are canonical enodes."""
+        if enode in self._eclasses:
+            return self._eclasses.find(enode)
+
+        self._eclasses.add(enode)
+        self._etables[enode.head][enode] = enode.args
+        for child in enode.__children__:
+            self._parents.setdefault(child, []).append(enode)
+        return enode
+
+    def _add_enode(self, enode: ENode) -> ENode:
+        if enode in self._eclasses:
+            return self._eclasses.find(enode)
+        args = tuple(_substitute(arg, self._add_enode) for arg in enode.args)
+        return self._insert(ENode(enode.head, args))
 
     def add(self, node: Node) -> ENode:
         """Add a node to the egraph.
@@ -579,28 +693,74 @@ class EGraph:
             The canonical enode.
 
         """
-        enode = self._as_enode(node)
-        if enode in self._eclasses:
-            return self._eclasses.find(enode)
+        if isinstance(node, ENode):
+            return self._add_enode(node)
+        elif not isinstance(node, Node):
+            raise TypeError(node)
+        elif (entry := self._nodes.get(id(node))) is not None:
+            return self._eclasses.find(entry[1])
+
+        find = self._eclasses.find
+
+        def mapper(node, results, /, **_):
+            if (entry := self._nodes.get(id(node))) is not None:
+                return find(entry[1])
+            # the arguments are canonical enodes so comparing the new enode
+            # with the existing ones doesn't have to descend into them
+            args = [_substitute(arg, results.__getitem__) for arg in node.__args__]
+            enode = self._insert(ENode(node.__class__, args))
+            # keep the node alive so that its id isn't reused
+            self._nodes[id(node)] = (node, enode)
+            self._terms.setdefault(enode, node)
+            return find(enode)
 
-        args = []
-        for arg in enode.args:
-            if isinstance(arg, ENode):
-                args.append(self.add(arg))
-            else:
-                args.append(arg)
+        return node.map(mapper)[node]
 
-        enode = ENode(enode.head, args)
-        self._eclasses.add(enode)
-        self._etables[enode.head][enode] = tuple(args)
+    def term(self, enode: ENode) -> Node:
+        """Convert an enode of the egraph back to a node.
 
-        return enode
+        Unlike `ENode.to_node` this reuses the nodes added to the egraph, so the
+        conversion only constructs the nodes that haven't been seen before.
+
+        Parameters
+        ----------
+        enode :
+            An enode of the egraph.
+
+        Returns
+        -------
+        node :
+            The node represented by the enode.
+
+        """
+        try:
+            return self._terms[enode]
+        except KeyError:
+            pass
+        args = (_substitute(arg, self.term) for arg in enode.args)
+        node = self._terms[enode] = enode.head(*args)
+        return node
+
+    def _union(self, id1: ENode, id2: ENode) -> bool:
+        """Merge two eclasses deferring the restoration of congruence."""
+        id1 = self._eclasses.find(id1)
+        id2 = self._eclasses.find(id2)
+        if not self._eclasses.union(id1, id2):
+            return False
+
+        root = self._eclasses.find(id1)
+        other = id2 if root == id1 else id1
+        if other_parents := self._parents.pop(other, None):
+            self._parents.setdefault(root, []).extend(other_parents)
+        self._worklist.append(root)
+        return True
 
-    def union(self, node1: Node, node2: Node) -> ENode:
+    def union(self, node1: Node, node2: Node) -> bool:
         """Union two nodes in the egraph.
 
         The nodes are converted to enodes which must be present in the egraph.
-        The eclasses of the nodes are merged and the canonical enode is returned.
+        The eclasses of the nodes are merged, along with the eclasses of the
+        enodes which become congruent due to the merge.
 
         Parameters
         ----------
@@ -611,13 +771,47 @@ class EGraph:
 
         Returns
         -------
-        enode :
-            The canonical enode.
+        merged :
+            True if the eclasses were merged, False if they were already equal.
 
         """
-        enode1 = self._as_enode(node1)
-        enode2 = self._as_enode(node2)
-        return self._eclasses.union(enode1, enode2)
+        merged = self._union(self._lookup(node1), self._lookup(node2))
+        self.rebuild()
+        return merged
+
+    def _repair(self, eclass: ENode) -> None:
+        """Canonicalize the enodes using a merged eclass as argument."""
+        find = self._eclasses.find
+        parents = self._parents.pop(eclass, ())
+
+        unique = {}
+        for enode in parents:
+            canonical = self._canonicalize(enode)
+            if canonical != enode:
+                # replace the stale enode with its canonical form, which may
+                # already be present in another eclass in which case the two
+                # eclasses are congruent
+                self._etables[enode.head].pop(enode, None)
+                if canonical in self._eclasses:
+                    self._union(enode, canonical)
+                else:
+                    self._eclasses.add(canonical)
+                    self._eclasses.union(find(enode), canonical)
+                self._etables[canonical.head][canonical] = canonical.args
+            if (other := unique.get(canonical)) is not None:
+                self._union(other, enode)
+            unique[canonical] = enode
+
+        self._parents.setdefault(find(eclass), []).extend(unique)
+
+    def rebuild(self) -> None:
+        """Restore the congruence invariant after merging eclasses."""
+        find = self._eclasses.find
+        while self._worklist:
+            todo = {find(eclass) for eclass in self._worklist}
+            self._worklist.clear()
+            for eclass in todo:
+                self._repair(find(eclass))
 
     def _match_args(self, args, patargs):
         """Match the arguments of an enode against a pattern's arguments.
@@ -660,6 +854,53 @@ class EGraph:
                 return None
         return subst
 
+    def _index(self, head: type, indexes: dict) -> dict[ENode, list[tuple]]:
+        """Group the arguments of the enodes of a given head by their eclass.
+
+        The indexes are only valid until the next merge, so they are cached in
+        the `indexes` dictionary owned by the caller.
+        """
+        try:
+            return indexes[head]
+        except KeyError:
+            pass
+        find = self._eclasses.find
+        index = indexes[head] = collections.defaultdict(list)
+        for enode, args in self._etables[head].items():
+            index[find(enode)].append(args)
+        return index
+
+    def _match(self, pattern: Pattern, indexes: dict) -> list[tuple[ENode, dict]]:
+        """Match a pattern returning every enode and substitution pair."""
+        # patterns could be reordered to match on the most selective one first
+        patterns = dict(reversed(list(pattern.flatten())))
+        if any(pat.matches_none() for pat in patterns.values()):
+            return []
+
+        # extract the first pattern
+        (auxvar, pattern), *rest = patterns.items()
+
+        # match the first pattern and create the initial substitutions
+        matches = []
+        for enode, args in self._etables[pattern.head].items():
+            if (subst := self._match_args(args, pattern.args)) is not None:
+                subst[auxvar.name] = enode
+                matches.append((enode, subst))
+
+        # match the rest of the patterns against the enodes of the eclasses
+        # bound to their auxiliary variables and extend the substitutions
+        for auxvar, pattern in rest:
+            index = self._index(pattern.head, indexes)
+            tmp = []
+            for enode, subst in matches:
+                for args in index.get(subst[auxvar.name], ()):
+                    newsubst = self._match_args(args, pattern.args)
+                    if newsubst is not None:
+                        tmp.append((enode, {**subst, **newsubst}))
+            matches = tmp
+
+        return matches
+
     def match(self, pattern: Pattern) -> dict[ENode, dict[str, Any]]:
         """Match a pattern in the egraph.
 
@@ -678,46 +919,24 @@ class EGraph:
             A dictionary mapping the matched enodes to their substitutions.
 
         """
-        # patterns could be reordered to match on the most selective one first
-        patterns = dict(reversed(list(pattern.flatten())))
-        if any(pat.matches_none() for pat in patterns.values()):
-            return {}
-
-        # extract the first pattern
-        (auxvar, pattern), *rest = patterns.items()
-        matches = {}
-
-        # match the first pattern and create the initial substitutions
-        rel = self._etables[pattern.head]
-        for enode, args in rel.items():
-            if (subst := self._match_args(args, pattern.args)) is not None:
-                subst[auxvar.name] = enode
-                matches[enode] = subst
-
-        # match the rest of the patterns and extend the substitutions
-        for auxvar, pattern in rest:
-            rel = self._etables[pattern.head]
-            tmp = {}
-            for enode, subst in matches.items():
-                if args := rel.get(subst[auxvar.name]):
-                    if (newsubst := self._match_args(args, pattern.args)) is not None:
-                        tmp[enode] = {**subst, **newsubst}
-            matches = tmp
+        self.rebuild()
+        return dict(self._match(pattern, {}))
 
-        return matches
-
-    def apply(self, rewrites: list[Rewrite]) -> int:
+    def apply(self, rewrites: list[Rewrite], deadline: float | None = None) -> int:
         """Apply the given rewrites to the egraph.
 
-        Iteratively match the patterns and apply the rewrites to the graph. The returned
-        number of changes is the number of eclasses that were merged. This is the
-        number of changes made to the egraph. The egraph is saturated if the number of
-        changes is zero.
+        Match the patterns of all rewrites first, then apply the rewrites to the
+        matches and rebuild the egraph once. The returned number of changes is the
+        number of eclasses that were merged. This is the number of changes made to
+        the egraph. The egraph is saturated if the number of changes is zero.
 
         Parameters
         ----------
         rewrites :
             A list of rewrites to apply.
+        deadline :
+            Value of `time.monotonic()` after which the remaining rewrites are
+            skipped.
 
         Returns
         -------
@@ -725,15 +944,28 @@ class EGraph:
             The number of changes made to the egraph.
 
         """
-        n_changes = 0
+        self.rebuild()
+
+        indexes = {}
+        matches = []
         for rewrite in promote_list(rewrites):
-            for match, subst in self.match(rewrite.matcher).items():
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            matches.append((rewrite, self._match(rewrite.matcher, indexes)))
+
+        n_changes = 0
+        for rewrite, pairs in matches:
+            for match, subst in pairs:
                 enode = rewrite.applier.substitute(self, match, subst)
                 enode = self.add(enode)
-                n_changes += self._eclasses.union(match, enode)
+                n_changes += self._union(match, enode)
+
+        self.rebuild()
         return n_changes
 
-    def run(self, rewrites: list[Rewrite], n: int = 10) -> bool:
+    def run(
+        self, rewrites: list[Rewrite], n: int = 10, timeout: float | None = None
+    ) -> bool:
         """Run the match-apply cycles for the given number of iterations.
 
         Parameters
@@ -742,6 +974,9 @@ class EGraph:
             A list of rewrites to apply.
         n :
             The number of iterations to run.
+        timeout :
+            The number of seconds after which no more rewrites are applied, even
+            if there are iterations left. `None` means no time limit.
 
         Returns
         -------
@@ -749,21 +984,34 @@ class EGraph:
             True if the egraph is saturated, False otherwise.
 
         """
-        return any(not self.apply(rewrites) for _i in range(n))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for _i in range(n):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            if not self.apply(rewrites, deadline=deadline):
+                return True
+        return False
 
-    # TODO(kszucs): investigate whether the costs and best enodes could be maintained
-    # during the union operations after each match-apply cycle
-    def extract(self, node: Node) -> Node:
+    def extract(
+        self,
+        node: Node,
+        cost: Callable[[ENode, Callable[[ENode], Any]], Any] | None = None,
+    ) -> Node:
         """Extract a node from the egraph.
 
         The node is converted to an enode which recursively gets converted to an
-        enode having the lowest cost according to equivalence classes. Currently
-        the cost function is hardcoded as the depth of the enode.
+        enode having the lowest cost according to equivalence classes.
 
         Parameters
         ----------
         node :
             The node to extract from the egraph.
+        cost :
+            Function called with an enode and a function returning the cost of
+            the eclass of one of its argument enodes, which must return the
+            cost of the enode. Costs can be any comparable values but must be
+            greater than the costs of the arguments. Defaults to the number of
+            enodes and leaf values in the extracted term.
 
         Returns
         -------
@@ -771,34 +1019,54 @@ class EGraph:
             The extracted node.
 
         """
-        enode = self._as_enode(node)
-        enode = self._eclasses.find(enode)
-        costs = {en: (math.inf, None) for en in self._eclasses.keys()}
-
-        def enode_cost(enode):
-            cost = 1
-            for arg in enode.args:
-                if isinstance(arg, ENode):
-                    cost += costs[arg][0]
-                else:
-                    cost += 1
-            return cost
-
-        changed = True
-        while changed:
-            changed = False
-            for en, enodes in self._eclasses.items():
-                new_cost = min((enode_cost(en), en) for en in enodes)
-                if costs[en][0] != new_cost[0]:
-                    changed = True
-                costs[en] = new_cost
+        self.rebuild()
+        enode = self._lookup(node)
+        cost = cost or _term_size
+
+        find = self._eclasses.find
+        best = {}
+
+        def costof(arg):
+            return best[find(arg)][0]
+
+        # compute the cheapest enode of each eclass starting from the leaves and
+        # revisiting the parents of an eclass whenever its cost decreases, the
+        # queue is deduplicated so an enode with many arguments is revisited
+        # once per wave of updates rather than once per argument
+        children = {}
+        queue = {}
+        for table in self._etables.values():
+            for en in table:
+                children[en] = en.__children__
+                if not children[en]:
+                    queue[en] = None
+
+        while queue:
+            en = next(iter(queue))
+            del queue[en]
+            args = children.get(en)
+            if args is None:
+                args = children[en] = en.__children__
+            if not all(find(arg) in best for arg in args):
+                continue
+            en_cost = cost(en, costof)
+            eclass = find(en)
+            if eclass not in best or en_cost < best[eclass][0]:
+                best[eclass] = (en_cost, en)
+                queue.update(dict.fromkeys(self._parents.get(eclass, ())))
+
+        memo = {}
 
         def extract(en):
-            if not isinstance(en, ENode):
-                return en
-            best = costs[en][1]
-            args = tuple(extract(a) for a in best.args)
-            return best.head(*args)
+            eclass = find(en)
+            try:
+                return memo[eclass]
+            except KeyError:
+                pass
+            _, en = best[eclass]
+            args = (_substitute(arg, extract) for arg in en.args)
+            result = memo[eclass] = en.head(*args)
+            return result
 
         return extract(enode)
 
@@ -821,8 +1089,20 @@ class EGraph:
             True if the nodes are equivalent, False otherwise.
 
         """
-        enode1 = self._as_enode(node1)
-        enode2 = self._as_enode(node2)
-        enode1 = self._eclasses.find(enode1)
-        enode2 = self._eclasses.find(enode2)
-        return enode1 == enode2
+        self.rebuild()
+        return self._lookup(node1) == self._lookup(node2)
+
+
+def _term_size(enode: ENode, costof: Callable[[ENode], int]) -> int:
+    """Count the enodes and leaf values of the cheapest term of an enode."""
+
+    def size(arg):
+        if isinstance(arg, ENode):
+            return costof(arg)
+        elif isinstance(arg, (tuple, dict)):
+            values = arg.values() if isinstance(arg, dict) else arg
+            return sum(map(size, values))
+        else:
+            return 1
+
+    return 1 + sum(map(size, enode.args))
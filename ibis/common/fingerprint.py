@@ -0,0 +1,246 @@
+"""Deterministic fingerprints of values which are stable across processes.
+
+Unlike `hash()` which is randomized per process for strings, fingerprints only
+depend on the structure of the fingerprinted value, so they can be used as keys
+of caches shared between processes and machines.
+
+Nodes holding arguments which are only meaningful within the process, like
+counters or generated names, can define `__fingerprint_args__(label)`
+returning the arguments to serialize instead of `__args__`. `label(value)`
+numbers the distinct values passed to it in the traversal order of the graph
+being fingerprinted, so such arguments can be replaced by their position. The
+nodes within the labeled values are compared by their fingerprints.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime
+import decimal
+import enum
+import hashlib
+import uuid
+from typing import Any
+
+from ibis.common.collections import FrozenOrderedDict
+from ibis.common.dispatch import lazy_singledispatch
+from ibis.common.graph import Node
+from ibis.common.grounds import Concrete
+
+DIGEST_SIZE = 16
+
+
+def _combine(tag: bytes, *parts: bytes) -> bytes:
+    h = hashlib.blake2b(tag, digest_size=DIGEST_SIZE)
+    for part in parts:
+        # length prefixes keep the serialization unambiguous
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.digest()
+
+
+def _qualname(typ: type) -> bytes:
+    return f"{typ.__module__}.{typ.__qualname__}".encode()
+
+
+@lazy_singledispatch
+def tokenize(value: Any) -> bytes:
+    """Return a canonical byte serialization of `value`.
+
+    Composite values are serialized to the digest of their components.
+    """
+    raise TypeError(f"Cannot fingerprint values of type {type(value)}")
+
+
+@tokenize.register(type(None))
+@tokenize.register(bool)
+@tokenize.register(int)
+@tokenize.register(float)
+@tokenize.register(complex)
+@tokenize.register(decimal.Decimal)
+@tokenize.register(datetime.date)
+@tokenize.register(datetime.time)
+@tokenize.register(datetime.timedelta)
+@tokenize.register(uuid.UUID)
+def _(value):
+    # the reprs of these types are deterministic and distinguish their values,
+    # including `-0.0` from `0.0` and the timezone of temporal values
+    return _qualname(type(value)) + b":" + repr(value).encode()
+
+
+@tokenize.register(str)
+def _(value):
+    return b"str:" + value.encode("utf-8", "surrogatepass")
+
+
+@tokenize.register(bytes)
+def _(value):
+    return b"bytes:" + value
+
+
+@tokenize.register(enum.Enum)
+def _(value):
+    return _qualname(type(value)) + b":" + value.name.encode()
+
+
+@tokenize.register(type)
+def _(value):
+    return b"type:" + _qualname(value)
+
+
+@tokenize.register(tuple)
+@tokenize.register(list)
+def _(value):
+    return _combine(_qualname(type(value)), *map(tokenize, value))
+
+
+@tokenize.register(frozenset)
+@tokenize.register(set)
+def _(value):
+    return _combine(_qualname(type(value)), *sorted(map(tokenize, value)))
+
+
+@tokenize.register(dict)
+def _(value):
+    items = (_combine(b"item", tokenize(k), tokenize(v)) for k, v in value.items())
+    if isinstance(value, FrozenOrderedDict):
+        # ordered dictionaries only compare equal if their order matches
+        return _combine(_qualname(type(value)), *items)
+    return _combine(_qualname(type(value)), *sorted(items))
+
+
+def _tokenize_concrete(value: Concrete) -> bytes:
+    try:
+        return value.__fingerprint__
+    except AttributeError:
+        pass
+    token = _combine(_qualname(type(value)), *map(tokenize, value.__args__))
+    object.__setattr__(value, "__fingerprint__", token)
+    return token
+
+
+class _Token(bytes):
+    """The serialization of a node of the graph being fingerprinted."""
+
+    __slots__ = ()
+
+
+@tokenize.register(_Token)
+def _(value):
+    return bytes(value)
+
+
+def _resolve(arg: Any, results: dict[Node, bytes]) -> Any:
+    """Replace the nodes of a possibly nested argument by their tokens."""
+    if isinstance(arg, Node):
+        return _Token(results[arg])
+    elif isinstance(arg, (tuple, list)):
+        return type(arg)(_resolve(item, results) for item in arg)
+    elif isinstance(arg, dict):
+        return type(arg)({k: _resolve(v, results) for k, v in arg.items()})
+    return arg
+
+
+def _tokenize_graph(root: Node) -> bytes:
+    labels: dict[Any, int] = {}
+    # nodes whose token depends on the labels of the graph, so can't be memoized
+    relative: set[Node] = set()
+
+    def mapper(node, results, /, **_):
+        with contextlib.suppress(AttributeError):
+            return node.__fingerprint__
+
+        used = False
+        if (method := getattr(node, "__fingerprint_args__", None)) is None:
+            args = node.__args__
+        else:
+
+            def label(value):
+                nonlocal used
+                used = True
+                # nodes within the labeled value compare by their fingerprints
+                key = _resolve(value, results)
+                return labels.setdefault(key, len(labels))
+
+            args = method(label)
+
+        args = _resolve(args, results)
+        token = _combine(_qualname(type(node)), *map(tokenize, args))
+        if used or any(child in relative for child in node.__children__):
+            relative.add(node)
+        else:
+            object.__setattr__(node, "__fingerprint__", token)
+        return token
+
+    # visit the graph in topological order to avoid deep recursion, each node
+    # is serialized once and the results are memoized where possible
+    return root.map(mapper)[root]
+
+
+@tokenize.register(Concrete)
+def _(value):
+    if isinstance(value, Node) and not hasattr(value, "__fingerprint__"):
+        return _tokenize_graph(value)
+    return _tokenize_concrete(value)
+
+
+@tokenize.register("numpy.generic")
+def _(value):
+    return _combine(_qualname(type(value)), tokenize(value.item()))
+
+
+@tokenize.register("numpy.ndarray")
+def _(value):
+    import numpy as np
+
+    if value.dtype.hasobject:
+        return _combine(b"numpy.ndarray", *map(tokenize, value.tolist()))
+    value = np.ascontiguousarray(value)
+    return _combine(
+        b"numpy.ndarray",
+        value.dtype.str.encode(),
+        repr(value.shape).encode(),
+        value.tobytes(),
+    )
+
+
+@tokenize.register("pyarrow.Table")
+def _(value):
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, value.schema) as writer:
+        writer.write_table(value)
+    return _combine(b"pyarrow.Table", sink.getvalue().to_pybytes())
+
+
+@tokenize.register("pandas.DataFrame")
+def _(value):
+    import pyarrow as pa
+
+    return tokenize(pa.Table.from_pandas(value, preserve_index=False))
+
+
+@tokenize.register("polars.DataFrame")
+def _(value):
+    return tokenize(value.to_arrow())
+
+
+def fingerprint(value: Any) -> str:
+    """Return a fingerprint of `value` which is stable across processes.
+
+    Fingerprints of `Concrete` instances are memoized, so fingerprinting an
+    expression graph only serializes the nodes which haven't been fingerprinted
+    before.
+
+    Parameters
+    ----------
+    value
+        The value to fingerprint.
+
+    Returns
+    -------
+    str
+        The hexadecimal BLAKE2 digest of the canonical serialization of `value`.
+    """
+    return _combine(b"fingerprint", tokenize(value)).hex()
@@ -6,11 +6,22 @@ import itertools
 from abc import abstractmethod
 from collections import deque
 from collections.abc import Callable, Iterable, Iterator, KeysView, Mapping, Sequence
-from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ClassVar,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from ibis.common.bases import Hashable
 from ibis.common.patterns import NoMatch, Pattern
-from ibis.common.typing import _ClassInfo
+from ibis.common.typing import UnionType, _ClassInfo
 from ibis.util import experimental, promote_list
 
 if TYPE_CHECKING:
@@ -71,6 +82,84 @@ def _flatten_collections(node: Any) -> Iterator[N]:
             yield from _flatten_collections(items)
 
 
+def _collect_nodes(args: Iterable[Any], nodes: list[Node]) -> list[Node]:
+    """Non-generator variant of `_flatten_collections` appending to a list.
+
+    Avoids creating a generator object for every level of the arguments which
+    is noticeable when computing the children of many nodes.
+    """
+    for item in args:
+        if isinstance(item, Node):
+            nodes.append(item)
+        elif isinstance(item, (tuple, list)):
+            _collect_nodes(item, nodes)
+        elif isinstance(item, dict):
+            _collect_nodes(itertools.chain.from_iterable(item.items()), nodes)
+    return nodes
+
+
+def _may_hold_nodes(typehint: Any) -> bool:
+    """Check whether a value annotated with the given typehint can hold nodes.
+
+    Used to precompute the arguments worth traversing for annotated classes,
+    see `Node.__traversable__`. Errs on the side of caution by returning `True`
+    for anything it cannot reason about.
+
+    Parameters
+    ----------
+    typehint
+        An evaluated type annotation or `None` if there isn't one.
+
+    Returns
+    -------
+    Whether the value can be a node or a collection containing nodes.
+
+    Examples
+    --------
+    >>> _may_hold_nodes(str)
+    False
+    >>> _may_hold_nodes(tuple[str, ...])
+    False
+    >>> _may_hold_nodes(Optional[Node])
+    True
+    >>> _may_hold_nodes(Any)
+    True
+
+    """
+    if typehint is None or typehint is Any:
+        return True
+
+    origin, args = get_origin(typehint), get_args(typehint)
+    if origin is Annotated:
+        return _may_hold_nodes(args[0])
+    elif origin is Literal:
+        return False
+    elif origin is Union or origin is UnionType:
+        return any(map(_may_hold_nodes, args))
+    elif origin is not None:
+        if isinstance(origin, type) and issubclass(origin, Node):
+            return True
+        elif origin in (tuple, list, dict, Sequence, Mapping) or (
+            isinstance(origin, type) and issubclass(origin, (tuple, list, dict))
+        ):
+            # the nodes are only looked up in the items of these collections
+            return any(_may_hold_nodes(arg) for arg in args if arg is not Ellipsis)
+        return True
+    elif isinstance(typehint, TypeVar):
+        bound = typehint.__bound__
+        return bound is None or _may_hold_nodes(bound)
+    elif isinstance(typehint, type):
+        if issubclass(typehint, (str, bytes)):
+            return False
+        # the value can only be a node if the annotated type is related to Node
+        # or a collection traversed for nodes if it is related to those
+        return any(
+            issubclass(typehint, cls) or issubclass(cls, typehint)
+            for cls in (Node, tuple, list, dict)
+        )
+    return True
+
+
 def _recursive_lookup(obj: Any, dct: dict) -> Any:
     """Recursively replace objects in a nested structure with values from a dict.
 
@@ -248,6 +337,13 @@ def _coerce_replacer(obj: ReplacerLike, context: Optional[dict] = None) -> Repla
 class Node(Hashable):
     __slots__ = ()
 
+    __traversable__: ClassVar[Optional[tuple[int, ...]]] = None
+    """Positions of the arguments which can hold nodes, `None` means all.
+
+    Precomputed for annotated classes from the argument typehints so the
+    traversals can skip arguments like names and datatypes.
+    """
+
     @classmethod
     def __recreate__(cls, kwargs: Any) -> Self:
         """Reconstruct the node from the given arguments."""
@@ -266,7 +362,17 @@ class Node(Hashable):
     @property
     def __children__(self) -> tuple[Node, ...]:
         """Sequence of children nodes."""
-        return tuple(_flatten_collections(self.__args__))
+        args = self.__args__
+        if (positions := self.__traversable__) is None:
+            return tuple(_collect_nodes(args, []))
+
+        nodes = []
+        for i in positions:
+            if isinstance(arg := args[i], Node):
+                nodes.append(arg)
+            elif isinstance(arg, (tuple, list, dict)):
+                _collect_nodes((arg,), nodes)
+        return tuple(nodes)
 
     def __rich_repr__(self):
         """Support for rich reprerentation of the node."""
@@ -295,14 +401,10 @@ class Node(Hashable):
         """
         results: dict[Node, Any] = {}
 
-        graph, _ = Graph.from_bfs(self, filter=filter).toposort()
-        for node in graph:
-            # minor optimization to directly recurse into the children
-            kwargs = {
-                k: _recursive_lookup(v, results)
-                for k, v in zip(node.__argnames__, node.__args__)
-            }
-            results[node] = fn(node, results, **kwargs)
+        nodes, children = _traverse(self, filter)
+        for i in _toposort(children)[1]:
+            node = nodes[i]
+            results[node] = fn(node, results, **_lookup_kwargs(node, results))
 
         return results
 
@@ -335,23 +437,20 @@ class Node(Hashable):
         """
         results: dict[Node, Any] = {}
 
-        graph, dependents = Graph.from_bfs(self, filter=filter).toposort()
-        dependents = {k: set(v) for k, v in dependents.items()}
+        nodes, children = _traverse(self, filter)
+        dependents, order = _toposort(children)
+        remaining = [len(set(ids)) for ids in dependents]
 
-        for node, dependencies in graph.items():
-            # minor optimization to directly recurse into the children
-            kwargs = {
-                k: _recursive_lookup(v, results)
-                for k, v in zip(node.__argnames__, node.__args__)
-            }
-            results[node] = fn(node, results, **kwargs)
+        for i in order:
+            node = nodes[i]
+            results[node] = fn(node, results, **_lookup_kwargs(node, results))
 
             # remove the results belonging to the dependencies if they are not
             # needed by other nodes during the rest of the traversal
-            for dependency in set(dependencies):
-                dependents[dependency].remove(node)
-                if not dependents[dependency]:
-                    del results[dependency]
+            for j in set(children[i]):
+                remaining[j] -= 1
+                if not remaining[j]:
+                    del results[nodes[j]]
 
         return results.get(self, self)
 
@@ -365,10 +464,11 @@ class Node(Hashable):
         """
         results: dict[Node, Any] = {}
 
-        graph, _ = Graph.from_bfs(self, filter=filter).toposort()
-        for node, children in graph.items():
-            args = _recursive_lookup(children, results)
-            results[node] = fn(node, *args)
+        nodes, children = _traverse(self, filter)
+        values: list[Any] = [None] * len(nodes)
+        for i in _toposort(children)[1]:
+            node = nodes[i]
+            values[i] = results[node] = fn(node, *[values[j] for j in children[i]])
 
         return results
 
@@ -405,10 +505,13 @@ class Node(Hashable):
         determined by a breadth-first search.
 
         """
-        graph = Graph.from_bfs(self, filter=filter, context=context)
         finder = _coerce_finder(finder, context)
         if ordered:
-            graph, _ = graph.toposort()
+            if filter is not None:
+                filter = _coerce_finder(filter, context)
+            nodes, children = _traverse(self, filter)
+            return [node for i in _toposort(children)[1] if finder(node := nodes[i])]
+        graph = Graph.from_bfs(self, filter=filter, context=context)
         return [node for node in graph.nodes() if finder(node)]
 
     @experimental
@@ -482,6 +585,7 @@ class Node(Hashable):
         replacer: ReplacerLike,
         filter: Optional[FinderLike] = None,
         context: Optional[dict] = None,
+        replacements: Optional[Mapping[Node, Any]] = None,
     ) -> Any:
         """Match and replace nodes in the graph according to a given pattern.
 
@@ -500,25 +604,43 @@ class Node(Hashable):
             the given filter and stop otherwise.
         context
             Optional context to use for the pattern matching.
+        replacements
+            Optional mapping of nodes to their already known replacements. The
+            traversal doesn't descend into these nodes, their replacements are
+            used as is.
 
         Returns
         -------
         The root node of the graph with the replaced nodes.
 
         """
-        replacements: dict[Node, Any] = {}
-
         fn = _coerce_replacer(replacer, context)
+        finder = None if filter is None else _coerce_finder(filter)
 
-        graph, _ = Graph.from_bfs(self, filter=filter).toposort()
-        for node in graph:
-            kwargs = {}
+        if replacements:
+            # don't descend into the nodes with already known replacements
+            known = replacements
+
+            def finder(node, _filter=finder):
+                return node not in known and (_filter is None or _filter(node))
+
+            replacements = {k: v for k, v in known.items() if v is not k}
+        else:
+            replacements = {}
+
+        nodes, children = _traverse(self, finder)
+        for i in _toposort(children)[1]:
+            node = nodes[i]
+            names, args = node.__argnames__, node.__args__
+            kwargs = dict(zip(names, args))
+            positions = node.__traversable__
             # Apply already rewritten nodes to the children of the node
             changed = False
-            for k, v in zip(node.__argnames__, node.__args__):
-                v, vchanged = _apply_replacements(v, replacements)
-                changed |= vchanged
-                kwargs[k] = v
+            for j in range(len(args)) if positions is None else positions:
+                v, vchanged = _apply_replacements(args[j], replacements)
+                if vchanged:
+                    changed = True
+                    kwargs[names[j]] = v
 
             # Call the replacer on the node with any rewritten nodes (or None
             # if unchanged).
@@ -673,6 +795,99 @@ class Graph(dict[Node, Sequence[Node]]):
         return result, dependents
 
 
+def _traverse(
+    root: Node | Iterable[Node], filter: Optional[Finder] = None
+) -> tuple[list[Node], list[list[int]]]:
+    """Breadth-first traversal assigning integer ids to the nodes.
+
+    Equivalent to `Graph.from_bfs` but represents the graph compactly: the ids
+    are the positions of the nodes in the visiting order and the adjacency is
+    a list of child ids per node.
+
+    Parameters
+    ----------
+    root
+        Root node or nodes of the graph.
+    filter
+        A callable which returns a boolean given a node. The traversal will only
+        visit nodes that match the given filter and stop otherwise.
+
+    Returns
+    -------
+    The nodes in breadth-first order and the ids of the children of each node.
+
+    """
+    nodes: list[Node] = []
+    index: dict[Node, int] = {}
+    for node in _flatten_collections(promote_list(root)):
+        if node not in index and (filter is None or filter(node)):
+            index[node] = len(nodes)
+            nodes.append(node)
+
+    # the list of nodes doubles as the queue of the traversal
+    children: list[list[int]] = []
+    for node in nodes:
+        ids = []
+        for child in node.__children__:
+            if (j := index.get(child)) is None:
+                if filter is not None and not filter(child):
+                    continue
+                j = index[child] = len(nodes)
+                nodes.append(child)
+            ids.append(j)
+        children.append(ids)
+
+    return nodes, children
+
+
+def _toposort(children: Sequence[Sequence[int]]) -> tuple[list, list[int]]:
+    """Topologically sort a graph of integer node ids using Kahn's algorithm.
+
+    Parameters
+    ----------
+    children
+        The ids of the children of each node.
+
+    Returns
+    -------
+    The ids of the dependents of each node and the node ids in topological
+    order.
+
+    """
+    in_degree = [len(ids) for ids in children]
+    dependents: list[list[int]] = [[] for _ in children]
+    for i, ids in enumerate(children):
+        for j in ids:
+            dependents[j].append(i)
+
+    # the order list doubles as the queue of the algorithm
+    order = [i for i, count in enumerate(in_degree) if not count]
+    for i in order:
+        for j in dependents[i]:
+            in_degree[j] -= 1
+            if not in_degree[j]:
+                order.append(j)
+
+    if len(order) != len(children):
+        raise ValueError("cycle detected in the graph")
+
+    return dependents, order
+
+
+def _lookup_kwargs(node: Node, results: Mapping[Node, Any]) -> dict[str, Any]:
+    """Construct the keyword arguments of a node from the results of its children."""
+    names, args = node.__argnames__, node.__args__
+    kwargs = dict(zip(names, args))
+    positions = node.__traversable__
+    for i in range(len(args)) if positions is None else positions:
+        arg = args[i]
+        if isinstance(arg, Node):
+            kwargs[names[i]] = results.get(arg, arg)
+        elif isinstance(arg, (tuple, list, dict)):
+            kwargs[names[i]] = _recursive_lookup(arg, results)
+    return kwargs
+
+
 # these could be callables instead
 proceed = True
 halt = False
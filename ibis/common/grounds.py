@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+from collections.abc import Mapping, MutableMapping
 from copy import copy
 from typing import (
     Any,
@@ -8,6 +9,7 @@ from typing import (
     Union,
     get_origin,
 )
+from weakref import WeakValueDictionary
 
 from typing_extensions import Self, dataclass_transform
 
@@ -27,6 +29,7 @@ from ibis.common.bases import (  # noqa: F401
     Singleton,
 )
 from ibis.common.collections import FrozenDict  # noqa: TC001
+from ibis.common.graph import _may_hold_nodes
 from ibis.common.patterns import Pattern
 from ibis.common.typing import evaluate_annotations
 
@@ -81,6 +84,13 @@ class AnnotableMeta(AbstractMeta):
         signature = Signature.merge(*signatures, **arguments)
         argnames = tuple(signature.parameters.keys())
 
+        # precompute which arguments are worth visiting during graph traversals
+        traversable = tuple(
+            i
+            for i, param in enumerate(signature.parameters.values())
+            if _may_hold_nodes(param.annotation.typehint)
+        )
+
         namespace.update(
             __module__=module,
             __qualname__=qualname,
@@ -89,6 +99,7 @@ class AnnotableMeta(AbstractMeta):
             __match_args__=argnames,
             __signature__=signature,
             __slots__=tuple(slots),
+            __traversable__=traversable,
         )
         return super().__new__(metacls, clsname, bases, namespace, **kwargs)
 
@@ -186,9 +197,46 @@ class Annotable(Abstract, metaclass=AnnotableMeta):
 
 
 class Concrete(Immutable, Comparable, Annotable):
-    """Opinionated base class for immutable data classes."""
+    """Opinionated base class for immutable data classes.
+
+    Instances can optionally be hash-consed, see `set_interning`: constructing
+    an instance structurally equal to a live one returns the existing instance
+    instead, so equal instances share memory and compare equal by identity.
+    Subclasses holding values which compare equal without being
+    interchangeable (like `0.0` and `-0.0`) opt out by setting `__interned__`
+    to `None` and may override `__intern_key__` to let their parents be
+    interned nonetheless.
+    """
+
+    __slots__ = ("__args__", "__fingerprint__", "__precomputed_hash__")
+
+    __interned__: ClassVar[MutableMapping[Any, Self] | None] = None
+    """Table of the interned instances, `None` disables interning."""
+
+    @classmethod
+    def __create__(cls, *args: Any, **kwargs: Any) -> Self:
+        return cls.__intern__(super().__create__(*args, **kwargs))
+
+    @classmethod
+    def __recreate__(cls, kwargs: Any) -> Self:
+        return cls.__intern__(super().__recreate__(kwargs))
 
-    __slots__ = ("__args__", "__precomputed_hash__")
+    @classmethod
+    def __intern__(cls, instance: Self) -> Self:
+        if (instances := cls.__interned__) is None:
+            return instance
+        # the key must not reference the instance to keep it collectable
+        key = (cls, _intern_key(instance.__args__))
+        return instances.setdefault(key, instance)
+
+    @property
+    def __intern_key__(self) -> Any:
+        """The key standing for this instance in its parents' intern keys.
+
+        Interned instances are unique so their identity is enough, instances
+        which aren't interned are only interchangeable with themselves.
+        """
+        return (Concrete, id(self))
 
     def __init__(self, **kwargs: Any) -> None:
         # collect and set the arguments in a single pass
@@ -218,8 +266,20 @@ class Concrete(Immutable, Comparable, Annotable):
     def __hash__(self) -> int:
         return self.__precomputed_hash__
 
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        # interned instances with matching hashes are most likely identical,
+        # so only consult the comparison cache for possible hash collisions
+        if (
+            type(self) is not type(other)
+            or self.__precomputed_hash__ != other.__precomputed_hash__
+        ):
+            return False
+        return super().__eq__(other)
+
     def __equals__(self, other) -> bool:
-        return hash(self) == hash(other) and self.__args__ == other.__args__
+        return self.__args__ == other.__args__
 
     @property
     def args(self):
@@ -235,3 +295,38 @@ class Concrete(Immutable, Comparable, Annotable):
             raise AttributeError(f"Unexpected arguments: {unknown_args}")
         kwargs.update(overrides)
         return self.__recreate__(kwargs)
+
+
+def _intern_key(value: Any) -> Any:
+    """Build a key which only matches interchangeable arguments.
+
+    Comparing the arguments with `==` would conflate values like `0.0` and
+    `-0.0`, so child instances are keyed by their `__intern_key__` instead.
+    """
+    if isinstance(value, Concrete):
+        return value.__intern_key__
+    elif isinstance(value, tuple):
+        return tuple(map(_intern_key, value))
+    elif isinstance(value, Mapping):
+        items = ((_intern_key(k), _intern_key(v)) for k, v in value.items())
+        return (type(value), tuple(items))
+    elif isinstance(value, float):
+        return (float, repr(value))
+    return value
+
+
+def set_interning(enabled: bool) -> None:
+    """Enable or disable the hash-consing of `Concrete` instances.
+
+    Interning deduplicates structurally equal instances which makes equality
+    checks between them an identity check, at the cost of a lookup in a weak
+    table on every instantiation. Instances created before enabling it are
+    not interned retroactively.
+
+    Parameters
+    ----------
+    enabled
+        Whether to intern the instances created from now on.
+
+    """
+    Concrete.__interned__ = WeakValueDictionary() if enabled else None
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from ibis.common.caching import CacheInfo, LRUCache, PersistentCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # touch `a` so that `b` becomes the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.get("b") is None
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=2)
+
+
+def test_lru_cache_clear_and_pop():
+    cache = LRUCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "missing") == "missing"
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=128, currsize=0)
+
+
+def test_persistent_cache(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pytest.importorskip("pyarrow.parquet")
+
+    table = pa.table({"a": [1, 2, 3]})
+    cache = PersistentCache(tmp_path / "cache")
+    assert cache.get("a") is None
+    assert cache.entries() == []
+
+    cache.set("a", table)
+    cache.set("b", table)
+    assert "a" in cache
+    assert cache.get("a").equals(table)
+    assert {entry.key for entry in cache.entries()} == {"a", "b"}
+
+    assert cache.purge("a", "missing") == ["a"]
+    assert "a" not in cache
+    assert cache.purge() == ["b"]
+    assert cache.entries() == []
+
+
+def test_persistent_cache_evicts_least_recently_used(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pytest.importorskip("pyarrow.parquet")
+
+    table = pa.table({"a": list(range(100))})
+    cache = PersistentCache(tmp_path)
+    for i, key in enumerate("abc"):
+        cache.set(key, table)
+        os.utime(cache._path(key), (i, i))
+
+    cache.max_size = 2 * cache.entries()[0].size
+    assert cache.evict() == ["a"]
+    assert [entry.key for entry in cache.entries()] == ["b", "c"]
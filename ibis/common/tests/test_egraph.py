@@ -496,6 +496,81 @@ def test_egraph_rewrite(node, expected):
     assert best == expected
 
 
+def test_egraph_extract_with_cost():
+    rules = [Mul[a, Lit[2]] >> Add[a, a]]
+    node = Mul(Lit(3), Lit(2))
+    egraph = EGraph()
+    egraph.add(node)
+    egraph.run(rules, 10)
+
+    def cost(enode, costof):
+        own = 10 if enode.head is Mul else 1
+        return own + sum(map(costof, enode.__children__))
+
+    assert egraph.extract(node) == node
+    assert egraph.extract(node, cost=cost) == Add(Lit(3), Lit(3))
+
+
+def test_egraph_run_timeout():
+    rules = [Add[a, b] >> Add[b, a], Add[a, Add[b, c]] >> Add[Add[a, b], c]]
+    node = Add(1, Add(2, Add(3, Add(4, Add(5, Add(6, 7))))))
+    egraph = EGraph()
+    egraph.add(node)
+    assert not egraph.run(rules, 500, timeout=0)
+    assert len(egraph._eclasses) == 6
+
+
+def test_egraph_relations():
+    t = ibis.table({"a": "int64", "b": "string"}, name="t")
+    # case expressions have a `results` field
+    d = ibis.cases((t.a > 2, 2), else_=3)
+    expr = t.select(c=t.a + 1, b=t.b, d=d).filter(ibis._.c > 1).order_by("b")
+    node = expr.op()
+
+    enode = ENode.from_node(node)
+    assert enode.to_node() == node
+
+    egraph = EGraph()
+    egraph.add(node)
+    assert egraph.extract(node) == node
+
+
+def test_egraph_union_restores_congruence():
+    egraph = EGraph()
+    egraph.add(Add(Mul(Lit(1), Lit(2)), Lit(3)))
+    egraph.add(Add(Lit(2), Lit(3)))
+    assert not egraph.equivalent(Add(Mul(Lit(1), Lit(2)), Lit(3)), Add(Lit(2), Lit(3)))
+
+    # merging the arguments merges the enodes using them
+    assert egraph.union(Mul(Lit(1), Lit(2)), Lit(2))
+    assert egraph.equivalent(Add(Mul(Lit(1), Lit(2)), Lit(3)), Add(Lit(2), Lit(3)))
+    assert not egraph.union(Add(Mul(Lit(1), Lit(2)), Lit(3)), Add(Lit(2), Lit(3)))
+
+
+def test_egraph_match_nested_non_canonical():
+    # the nested pattern has to match an enode of the eclass which isn't its
+    # canonical enode
+    egraph = EGraph()
+    egraph.add(Add(Lit(0), Lit(1)))
+    egraph.add(Mul(Lit(5), Lit(1)))
+    egraph.union(Lit(0), Mul(Lit(5), Lit(1)))
+
+    matches = egraph.match(Add[Mul[a, b], c])
+    assert len(matches) == 1
+    (subst,) = matches.values()
+    assert subst["a"] == egraph.add(Lit(5))
+
+
+def test_egraph_term():
+    node = Add(Mul(Lit(1), Lit(2)), Lit(3))
+    egraph = EGraph()
+    enode = egraph.add(node)
+    assert egraph.term(enode) is node
+
+    new = egraph.add(ENode(Add, (enode, enode)))
+    assert egraph.term(new) == Add(node, node)
+
+
 def is_equal(a, b, rules, iters=7):
     egraph = EGraph()
     id_a = egraph.add(a)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import ibis
+import ibis.expr.operations as ops
+from ibis.common.collections import FrozenDict, FrozenOrderedDict
+from ibis.common.fingerprint import fingerprint
+
+EXPR = """
+import ibis
+
+t = ibis.table(dict(a="int", b="string"), name="t")
+expr = (
+    t.filter(t.a > 1)
+    .mutate(c=t.b.upper() + "x", d=ibis.literal(1.5))
+    .group_by("c")
+    .agg(n=t.a.sum(), m=t.b.collect())
+)
+"""
+
+
+def test_fingerprint_is_stable_across_processes():
+    namespace = {}
+    exec(EXPR, namespace)  # noqa: S102
+    expected = namespace["expr"].fingerprint()
+
+    for seed in ("1", "2"):
+        result = subprocess.run(
+            [sys.executable, "-c", f"{EXPR}\nprint(expr.fingerprint())"],
+            env={"PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == expected
+
+
+def test_fingerprint_structural_equality():
+    t1 = ibis.table(dict(a="int"), name="t")
+    t2 = ibis.table(dict(a="int"), name="t")
+    assert (t1.a + 1).fingerprint() == (t2.a + 1).fingerprint()
+    assert (t1.a + 1).fingerprint() != (t1.a + 2).fingerprint()
+    assert t1.fingerprint() != ibis.table(dict(a="int64"), name="u").fingerprint()
+    assert t1.fingerprint() != ibis.table(dict(a="string"), name="t").fingerprint()
+
+
+@pytest.mark.parametrize(
+    ("left", "right"),
+    [
+        (0.0, -0.0),
+        (1, True),
+        (1, 1.0),
+        (1, "1"),
+        ("a", b"a"),
+        ((1, 2), [1, 2]),
+        ((1, (2, 3)), ((1, 2), 3)),
+        (FrozenOrderedDict(a=1, b=2), FrozenOrderedDict(b=2, a=1)),
+    ],
+)
+def test_fingerprint_distinguishes_values(left, right):
+    assert fingerprint(left) != fingerprint(right)
+
+
+def test_fingerprint_unordered_collections():
+    assert fingerprint(FrozenDict(a=1, b=2)) == fingerprint(FrozenDict(b=2, a=1))
+    assert fingerprint(frozenset("abc")) == fingerprint(frozenset("cba"))
+
+
+def test_fingerprint_memtable_data():
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    assert (
+        ibis.memtable(df, name="m").fingerprint()
+        == ibis.memtable(df.copy(), name="m").fingerprint()
+    )
+    assert (
+        ibis.memtable(df, name="m").fingerprint()
+        != ibis.memtable(df.iloc[:2], name="m").fingerprint()
+    )
+
+
+def test_fingerprint_ignores_reference_identifiers():
+    t = ibis.table(dict(a="int", b="string"), name="t")
+
+    def build():
+        return t.join(t.view(), "a").filter(t.b != "x")
+
+    expected = build().fingerprint()
+    # unrelated references advance the identifier counters
+    t.view()
+    t.join(t, "a")
+    assert build().fingerprint() == expected
+    assert t.view().fingerprint() == t.view().fingerprint()
+    assert build().select("a").fingerprint() != expected
+
+    # join positions and view identifiers which coincide aren't confused
+    view = ops.SelfReference(t.op(), identifier=1).to_expr()
+    assert t.join(view, "a").fingerprint() == t.join(t.view(), "a").fingerprint()
+
+
+MEMTABLE_EXPR = """
+import ibis
+
+t = ibis.memtable({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+expr = t.join(t.view(), "a").group_by("b").agg(n=ibis._.a.sum())
+"""
+
+
+def test_fingerprint_unnamed_memtable_across_processes():
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    namespace = {}
+    exec(MEMTABLE_EXPR, namespace)  # noqa: S102
+    expected = namespace["expr"].fingerprint()
+
+    # the other process generates other names and reference identifiers
+    script = f"""
+import ibis
+ibis.table(dict(a="int")).view()
+{MEMTABLE_EXPR}
+print(expr.fingerprint())
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == expected
+
+    # the name is kept if chosen by the user
+    df = {"a": [1]}
+    assert (
+        ibis.memtable(df, name="m").fingerprint()
+        != ibis.memtable(df, name="n").fingerprint()
+    )
+    assert ibis.memtable(df).fingerprint() == ibis.memtable(df).fingerprint()
+
+
+def test_fingerprint_deep_expression():
+    expr = ibis.table(dict(a="int"), name="t").a
+    for i in range(sys.getrecursionlimit() * 2):
+        expr = expr + i
+    assert len(expr.fingerprint()) == 32
+
+
+def test_fingerprint_unsupported_value():
+    with pytest.raises(TypeError, match="Cannot fingerprint"):
+        fingerprint(object())
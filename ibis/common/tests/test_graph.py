@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
+from typing import Annotated, Any, Literal, Optional, TypeVar
 
 import pytest
 
@@ -11,7 +12,10 @@ from ibis.common.graph import (
     _coerce_finder,
     _coerce_replacer,
     _flatten_collections,
+    _may_hold_nodes,
     _recursive_lookup,
+    _toposort,
+    _traverse,
     bfs,
     bfs_while,
     dfs,
@@ -114,6 +118,29 @@ def test_toposort_cycle_detection():
         g.toposort()
 
 
+def test_traverse_matches_bfs():
+    nodes, children = _traverse(A)
+    graph = bfs(A)
+    assert nodes == list(graph)
+    assert [tuple(nodes[j] for j in ids) for ids in children] == list(graph.values())
+
+    nodes, children = _traverse(A, filter=lambda node: node.name != "B")
+    assert nodes == list(bfs_while(A, filter=lambda node: node.name != "B"))
+    assert children == [[1], []]
+
+
+def test_toposort_matches_graph_toposort():
+    nodes, children = _traverse(A)
+    dependents, order = _toposort(children)
+    g, deps = Graph(A).toposort()
+    assert [nodes[i] for i in order] == list(g)
+    assert [tuple(nodes[j] for j in ids) for ids in dependents] == list(deps.values())
+
+    # A depends on B which depends on A
+    with pytest.raises(ValueError, match="cycle detected in the graph"):
+        _toposort([[1], [0]])
+
+
 def test_nested_children():
     a = MyNode(name="a", children=[])
     b = MyNode(name="b", children=[a])
@@ -170,6 +197,23 @@ def test_replace_with_mapping():
     assert result == new_A
 
 
+def test_replace_with_known_replacements():
+    visited = []
+
+    def replacer(node, children):
+        visited.append(node.name)
+        new = node.__recreate__(children) if children else node
+        return new.copy(name=new.name.lower())
+
+    new_B = MyNode(name="b", children=[])
+    result = A.replace(replacer, replacements={B: new_B})
+    assert result == MyNode(name="a", children=[new_B, MyNode(name="c", children=[])])
+    assert sorted(visited) == ["A", "C"]
+
+    # the root itself is known
+    assert A.replace(replacer, replacements={A: new_B}) is new_B
+
+
 @pytest.mark.parametrize("kind", ["pattern", "mapping", "function"])
 def test_replace_doesnt_recreate_unchanged_nodes(kind):
     A1 = MyNode(name="A1", children=[])
@@ -281,6 +325,62 @@ def test_concrete_with_traversable_children():
     assert copied == All((T, F), strict=False)
 
 
+@pytest.mark.parametrize(
+    ("typehint", "expected"),
+    [
+        (None, True),
+        (Any, True),
+        (int, False),
+        (str, False),
+        (Node, True),
+        (object, True),
+        (Optional[Node], True),
+        (Optional[int], False),
+        (tuple[int, ...], False),
+        (tuple[Node, ...], True),
+        (frozendict[str, int], False),
+        (frozendict[str, Node], True),
+        (Sequence[str], False),
+        (Sequence, True),
+        (Literal["a", "b"], False),
+        (Annotated[int, "meta"], False),
+        (TypeVar("T", bound=int), False),
+        (TypeVar("T"), True),
+        ("Node", True),
+    ],
+)
+def test_may_hold_nodes(typehint, expected):
+    assert _may_hold_nodes(typehint) is expected
+
+
+class Leaf(Concrete, Node):
+    name: str
+    number: int
+
+
+class Branch(Concrete, Node):
+    name: str
+    left: Leaf
+    rights: tuple[Leaf, ...]
+    flag: bool = False
+
+
+def test_traversable_arguments():
+    assert Leaf.__traversable__ == ()
+    assert Branch.__traversable__ == (1, 2)
+
+    a, b = Leaf("a", 1), Leaf("b", 2)
+    node = Branch("node", a, (b, a))
+    assert node.__children__ == (a, b, a)
+    assert node.replace({a: b}) == Branch("node", b, (b, b))
+    assert node.map(lambda _, __, **kwargs: kwargs)[node] == {
+        "name": "node",
+        "left": {"name": "a", "number": 1},
+        "rights": ({"name": "b", "number": 2}, {"name": "a", "number": 1}),
+        "flag": False,
+    }
+
+
 class MySequence(Sequence):
     def __init__(self, *items):
         self.items = items
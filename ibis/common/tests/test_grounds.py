@@ -30,6 +30,7 @@ from ibis.common.grounds import (
     Concrete,
     Immutable,
     Singleton,
+    set_interning,
 )
 from ibis.common.patterns import (
     Any,
@@ -1011,8 +1012,8 @@ def test_concrete():
         object,
     )
 
-    assert BetweenWithCalculated.__create__.__func__ is Annotable.__create__.__func__
-    assert BetweenWithCalculated.__eq__ is Comparable.__eq__
+    assert BetweenWithCalculated.__create__.__func__ is Concrete.__create__.__func__
+    assert BetweenWithCalculated.__eq__ is Concrete.__eq__
     assert BetweenWithCalculated.__argnames__ == ("value", "lower", "upper")
 
     # annotable
@@ -1044,6 +1045,26 @@ def test_concrete():
     assert pickle.loads(pickle.dumps(obj)) == obj
 
 
+def test_concrete_interning():
+    set_interning(True)
+    try:
+        obj = BetweenWithCalculated(10, lower=5, upper=15)
+        assert BetweenWithCalculated(10, lower=5, upper=15) is obj
+        assert obj.copy(value=10) is obj
+        assert obj.copy(value=11) is not obj
+        assert pickle.loads(pickle.dumps(obj)) is obj
+
+        # the table doesn't keep the instances alive
+        ref = weakref.ref(obj)
+        del obj
+        assert ref() is None
+        assert not Concrete.__interned__
+    finally:
+        set_interning(False)
+
+    assert BetweenWithCalculated(1, 0, 2) is not BetweenWithCalculated(1, 0, 2)
+
+
 def test_composition_of_concrete_and_singleton():
     class ConcSing(Concrete, Singleton):
         value = CoercedTo(int)
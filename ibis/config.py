@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable  # noqa: TC003
-from typing import Annotated, Any, Optional
+from pathlib import Path  # noqa: TC003
+from typing import Annotated, Any, Literal, Optional, Union
 
 from public import public
 
@@ -40,12 +41,109 @@ class SQL(Config):
         explicit limit. [](`None`) means no limit.
     default_dialect : str
         Dialect to use for printing SQL when the backend cannot be determined.
+    compile_cache_size : int
+        Maximum number of compiled SQL strings each backend keeps around to
+        avoid recompiling the same expression. `0` disables the cache.
+    bind_params : bool
+        Whether to compile scalar parameters to placeholders and pass their
+        values to the database driver at execution time instead of inlining
+        them as literals, allowing the database to reuse query plans. Only
+        used by backends whose driver supports it, currently DuckDB, SQLite,
+        PostgreSQL and MySQL.
+    incremental_compile : bool
+        Whether to remember the lowered form of compiled expressions while
+        they're alive, so that expressions built on top of them only lower
+        their new operations when compiled.
+    push_down_predicates : bool
+        Whether to apply filters before the projections, joins and unions
+        they follow where this doesn't change the result, for engines which
+        don't push predicates down on their own. Also used by the Polars
+        backend.
+    eliminate_common_subexpressions : bool
+        Whether to compute expensive value expressions used several times in
+        a query, for example in a filter, a projection and a sort key, once in
+        a subquery instead of letting the engine evaluate every occurrence.
+    prune_columns : bool
+        Whether to remove the columns that don't contribute to the result from
+        the subqueries of the generated SQL, for engines that don't prune
+        unused columns of nested queries well on their own.
+    fold_constants : bool
+        Whether to evaluate arithmetic, comparisons, boolean logic, string
+        concatenation and casts of literals at compile time and to drop the
+        branches of `coalesce`, `ifelse` and case expressions and the filter
+        predicates which are known to be skipped. Also used by the Polars
+        backend.
+    egraph_optimize : bool
+        Whether to search for a cheaper equivalent of each compiled expression
+        by saturating an e-graph with rules commuting filters with
+        projections, joins and unions, folding constants, simplifying boolean
+        expressions and removing redundant casts, then extracting the
+        cheapest plan according to the compiler's cost model.
+    egraph_iterations : int
+        Maximum number of times the rules are applied to the whole e-graph
+        when `egraph_optimize` is set.
+    egraph_timeout : float | None
+        Number of seconds after which no more rules are applied when
+        `egraph_optimize` is set, bounding the compilation latency.
+        [](`None`) means no time limit.
 
     """
 
     fuse_selects: bool = True
     default_limit: Optional[PosInt] = None
     default_dialect: str = "duckdb"
+    compile_cache_size: PosInt = 256
+    bind_params: bool = False
+    incremental_compile: bool = True
+    push_down_predicates: bool = False
+    eliminate_common_subexpressions: bool = False
+    prune_columns: bool = False
+    fold_constants: bool = False
+    egraph_optimize: bool = False
+    egraph_iterations: PosInt = 8
+    egraph_timeout: Optional[float] = 0.1
+
+
+class Cache(Config):
+    """Options controlling `Table.cache`.
+
+    Attributes
+    ----------
+    directory : str | Path | None
+        Directory in which cached results are also persisted as Parquet files,
+        so that other processes caching the same expression against the same
+        backend reuse them instead of recomputing the query. Results are
+        keyed on the compiled query and, where the backend can tell, the
+        version of the source tables. [](`None`) disables persistence.
+    max_size : int | None
+        Maximum total size in bytes of the persisted results. Least recently
+        used results are evicted beyond it. [](`None`) means no limit.
+
+    """
+
+    directory: Optional[Union[str, Path]] = None
+    max_size: Optional[PosInt] = None
+
+
+class Memtable(Config):
+    """Options controlling `ibis.memtable`.
+
+    Attributes
+    ----------
+    spill_threshold : int | None
+        Estimated size in bytes above which the data of pandas, PyArrow and
+        Polars memtables is written to an Arrow IPC file and memory-mapped
+        when a backend reads it, instead of being kept on the Python heap.
+        The file is removed once the memtable is garbage collected.
+        [](`None`) disables spilling.
+    spill_directory : str | Path | None
+        Directory in which spilled memtables are written. [](`None`) uses the
+        system's temporary directory.
+
+    """
+
+    spill_threshold: Optional[PosInt] = None
+    spill_directory: Optional[Union[str, Path]] = None
 
 
 class Interactive(Config):
@@ -130,6 +228,18 @@ class Options(Config):
         set.
     sql: SQL
         SQL-related options.
+    dtype_backend : str
+        The kind of pandas dtypes results are converted to. `"numpy"` uses
+        NumPy dtypes, where nullable integers become floats or objects,
+        `"numpy_nullable"` uses the masked nullable extension dtypes for
+        numbers, booleans and strings, and `"pyarrow"` uses `pd.ArrowDtype`
+        for every column, which avoids copying results computed as Arrow.
+        Can be overridden per call by passing `dtype_backend` to `execute`,
+        `to_pandas` or `to_pandas_batches`.
+    cache : Cache
+        Options controlling `Table.cache`.
+    memtable : Memtable
+        Options controlling `ibis.memtable`.
     clickhouse : Config | None
         Clickhouse specific options.
     impala : Config | None
@@ -148,6 +258,9 @@ class Options(Config):
     graphviz_repr: bool = False
     default_backend: Optional[Any] = None
     sql: SQL = SQL()
+    dtype_backend: Literal["numpy", "numpy_nullable", "pyarrow"] = "numpy"
+    cache: Cache = Cache()
+    memtable: Memtable = Memtable()
     clickhouse: Optional[Config] = None
     impala: Optional[Config] = None
     pandas: Optional[Config] = None
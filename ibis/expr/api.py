@@ -9,6 +9,7 @@ import itertools
 import numbers
 import operator
 from collections import Counter
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
 
 import ibis.expr.builders as bl
@@ -45,7 +46,6 @@ from ibis.util import deprecated, experimental
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
-    from pathlib import Path
 
     import geopandas as gpd
     import pandas as pd
@@ -335,8 +335,12 @@ def memtable(
     ----------
     data
         A table-like object (`pandas.DataFrame`, `pyarrow.Table`, or
-        `polars.DataFrame`), or any data accepted by the `pandas.DataFrame`
-        constructor (e.g. a list of dicts).
+        `polars.DataFrame`), the path of an Arrow IPC file, or any data
+        accepted by the `pandas.DataFrame` constructor (e.g. a list of dicts).
+
+        Arrow IPC files are memory-mapped rather than loaded, and so are
+        in-memory tables larger than `ibis.options.memtable.spill_threshold`
+        once spilled to disk.
 
         Note that ibis objects (e.g. `MapValue`) may not be passed in as part
         of `data` and will result in an error.
@@ -414,7 +418,28 @@ def memtable(
 
         schema = ibis.schema(schema)
 
-    return _memtable(data, name=name, schema=schema, columns=columns)
+    expr = _memtable(data, name=name, schema=schema, columns=columns)
+    return _spill_memtable(expr)
+
+
+def _spill_memtable(expr: Table) -> Table:
+    import ibis
+
+    options = ibis.options.memtable
+    if (threshold := options.spill_threshold) is None:
+        return expr
+
+    op = expr.op()
+    size = op.data.estimated_size()
+    if size is None or size <= threshold:
+        return expr
+
+    from ibis.formats.pyarrow import PyArrowIPCFileProxy
+
+    data = PyArrowIPCFileProxy.from_pyarrow(
+        op.data.to_pyarrow(op.schema), directory=options.spill_directory
+    )
+    return op.copy(data=data).to_expr()
 
 
 @lazy_singledispatch
@@ -437,6 +462,37 @@ def _memtable(
     return _memtable(data, columns=columns, schema=schema, name=name)
 
 
+@_memtable.register(str)
+def _memtable_from_str(data: str, **kwargs) -> Table:
+    if not data.endswith((".arrow", ".feather", ".ipc")):
+        raise ValueError(
+            "Only the paths of Arrow IPC files (`.arrow`, `.feather` or `.ipc`) "
+            f"can be used to construct a memtable, got {data!r}"
+        )
+    return _memtable_from_path(Path(data), **kwargs)
+
+
+@_memtable.register(Path)
+def _memtable_from_path(
+    data: Path,
+    *,
+    name: str | None = None,
+    schema: SchemaLike | None = None,
+    columns: Iterable[str] | None = None,
+) -> Table:
+    from ibis.formats.pyarrow import PyArrowIPCFileProxy
+
+    proxy = PyArrowIPCFileProxy(data)
+    inferred = Schema.from_pyarrow(proxy.read_schema())
+    if columns is not None:
+        schema = sch.Schema(dict(zip(columns, inferred.values())))
+    return ops.InMemoryTable(
+        name=name if name is not None else util.gen_name("pyarrow_memtable"),
+        schema=inferred if schema is None else schema,
+        data=proxy,
+    ).to_expr()
+
+
 @_memtable.register("pandas.DataFrame")
 def _memtable_from_pandas_dataframe(
     data: pd.DataFrame,
@@ -142,11 +142,24 @@ class Literal(Scalar[T]):
 
     shape = ds.scalar
 
+    # values like `0.0` and `-0.0` or timestamps in different timezones compare
+    # equal without being interchangeable, so don't intern literals
+    __interned__ = None
+
     def __init__(self, value, dtype):
         # normalize ensures that the value is a valid value for the given dtype
         value = dt.normalize(dtype, value)
         super().__init__(value=value, dtype=dtype)
 
+    @property
+    def __intern_key__(self):
+        # let the operations using literals be interned by keying them on an
+        # exact representation of the value
+        value = self.value
+        if value is None or type(value) in (bool, int, str):
+            return (Literal, self.dtype, type(value), value)
+        return (Literal, self.dtype, type(value), repr(value))
+
     @property
     def name(self):
         if self.dtype.is_interval():
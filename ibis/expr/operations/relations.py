@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import itertools
+import re
 import typing
 from abc import abstractmethod
 from typing import Annotated, Any, Literal, Optional, TypeVar
@@ -28,6 +29,9 @@ from ibis.formats import TableProxy  # noqa: TC001
 
 T = TypeVar("T")
 
+# names created by `ibis.util.gen_name`
+_GENERATED_NAME = re.compile(r"ibis_\w+_[a-z2-7]{26}")
+
 Unaliased = Annotated[T, ~InstanceOf(Alias)]
 NonSortKey = Annotated[T, ~InstanceOf(SortKey)]
 
@@ -182,6 +186,11 @@ class Reference(Relation):
     def schema(self):
         return self.parent.schema
 
+    def __fingerprint_args__(self, label):
+        # identifiers are drawn from a process wide counter or are positions
+        # within a join chain, only whether two references are the same matters
+        return (self.parent, label((type(self), self.identifier, self.parent)))
+
 
 # TODO(kszucs): remove in favor of View
 @public
@@ -423,6 +432,13 @@ class InMemoryTable(PhysicalTable):
     schema: Schema
     data: TableProxy
 
+    def __fingerprint_args__(self, label):
+        # generated names differ between processes, the data identifies the
+        # table instead
+        if _GENERATED_NAME.fullmatch(self.name):
+            return (None, self.schema, self.data)
+        return self.__args__
+
 
 @public
 class SQLQueryResult(Relation):
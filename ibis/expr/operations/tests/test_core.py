@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import Optional
 
 import pytest
@@ -11,6 +12,7 @@ import ibis.expr.operations as ops
 import ibis.expr.rules as rlz
 import ibis.expr.types as ir
 from ibis.common.annotations import ValidationError
+from ibis.common.grounds import set_interning
 from ibis.common.patterns import EqualTo
 
 t = ibis.table([("a", "int64")], name="t")
@@ -231,3 +233,26 @@ def test_expression_class_aliases():
     assert ir.AnyValue is ir.Value
     assert ir.AnyScalar is ir.Scalar
     assert ir.AnyColumn is ir.Column
+
+
+def test_interning():
+    set_interning(True)
+    try:
+        expr1 = t.a + 1
+        expr2 = t.a + 1
+        assert expr1.op() is expr2.op()
+
+        # literals are compared by value but not interned
+        assert ops.Literal(0.0, dt.float64) is not ops.Literal(-0.0, dt.float64)
+
+        # nor are the operations using equal but different literals
+        pos, neg = (t.a + 0.0).op(), (t.a + -0.0).op()
+        assert pos is not neg
+        assert math.copysign(1, pos.right.value) == 1
+        assert math.copysign(1, neg.right.value) == -1
+        assert (t.a + -0.0).op() is neg
+
+        # unique nodes stay unique
+        assert ibis.param("int64").op() is not ibis.param("int64").op()
+    finally:
+        set_interning(False)
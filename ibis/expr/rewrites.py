@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import math
+import operator
 from collections import defaultdict
 
 import toolz
 
+import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 from ibis.common.collections import FrozenDict  # noqa: TC001
 from ibis.common.deferred import Item, _, deferred, var
@@ -13,7 +16,7 @@ from ibis.common.exceptions import ExpressionError, IbisInputError
 from ibis.common.graph import Node as Traversable
 from ibis.common.graph import traverse
 from ibis.common.grounds import Concrete
-from ibis.common.patterns import Check, pattern, replace
+from ibis.common.patterns import Check, NoMatch, pattern, replace
 from ibis.common.typing import VarTuple  # noqa: TC001
 from ibis.util import Namespace, promote_list
 
@@ -197,8 +200,14 @@ def peel_join_field(_):
 
 
 @replace(p.ScalarParameter)
-def replace_parameter(_, params, **kwargs):
-    """Replace scalar parameters with their values."""
+def replace_parameter(_, params, bind_params=False, **kwargs):
+    """Replace scalar parameters with their values.
+
+    Parameters without a value are kept if `bind_params` is set, their values
+    are supplied to the driver at execution time.
+    """
+    if bind_params and _ not in params:
+        return _
     return ops.Literal(value=params[_], dtype=_.dtype)
 
 
@@ -352,6 +361,14 @@ def subsequent_projects(_, y):
     return ops.Project(y.parent, values)
 
 
+@replace(p.Project(y @ p.Project))
+def merge_projects(_, y):
+    # inlining impure values would evaluate them once per reference
+    if any(v.find(ops.Impure, filter=ops.Value) for v in y.values.values()):
+        return _
+    return subsequent_projects.match(_, {})
+
+
 @replace(p.Filter(y @ p.Filter))
 def subsequent_filters(_, y):
     rule = p.Field(y, name) >> d.Field(y.parent, name)
@@ -371,6 +388,473 @@ def reorder_filter_project(_, y):
     return ops.Project(inner, projs)
 
 
+# operations whose result depends on the rows of the relation they are
+# evaluated on rather than just the current row
+_ROW_DEPENDENT = (
+    ops.WindowFunction,
+    ops.Analytic,
+    ops.Reduction,
+    ops.Subquery,
+    ops.Impure,
+)
+
+# joins preserving the rows of the tables joined before them, so filtering
+# those tables commutes with the join
+_PRESERVING_JOINS = frozenset(
+    {"inner", "left", "cross", "semi", "anti", "any_inner", "any_left", "asof"}
+)
+
+# joins which keep the rows of their right side intact, so it can be filtered
+# before joining
+_FILTERABLE_JOINS = frozenset({"inner", "right", "cross", "any_inner"})
+
+
+def _row_dependent(values) -> bool:
+    return any(value.find(_ROW_DEPENDENT, filter=ops.Value) for value in values)
+
+
+def _filterable_join_tables(chain: ops.JoinChain) -> set[ops.Reference]:
+    """Return the tables of `chain` that can be filtered before joining."""
+    hows = [link.how for link in chain.rest]
+    tables = set()
+    for i, table in enumerate(chain.tables):
+        if i and hows[i - 1] not in _FILTERABLE_JOINS:
+            continue
+        if _PRESERVING_JOINS.issuperset(hows[i:]):
+            tables.add(table)
+    return tables
+
+
+def _push_filter(node: ops.Relation) -> ops.Relation:
+    """Push the predicates of a filter towards the tables as far as possible."""
+    while isinstance(node, ops.Filter):
+        result = filter_pushdown.match(node, {})
+        if result is NoMatch or result == node:
+            break
+        node = result
+    return node
+
+
+@replace(p.Filter(y @ p.Project))
+def push_filter_through_project(_, y):
+    # filtering the input would change the results of window functions
+    if _row_dependent(_.predicates) or _row_dependent(y.values.values()):
+        return _
+
+    rule = p.Field(y, name) >> Item(y.values, name)
+    preds = tuple(v.replace(rule, filter=ops.Value) for v in _.predicates)
+    inner = _push_filter(ops.Filter(y.parent, preds))
+
+    rule = p.Field(y.parent, name) >> d.Field(inner, name)
+    values = {k: v.replace(rule, filter=ops.Value) for k, v in y.values.items()}
+    return ops.Project(inner, values)
+
+
+@replace(p.Filter(y @ p.JoinChain))
+def push_filter_into_join(_, y):
+    if _row_dependent(y.values.values()):
+        return _
+
+    tables = _filterable_join_tables(y)
+    rule = p.Field(y, name) >> Item(y.values, name)
+
+    pushed = defaultdict(list)
+    remaining = []
+    for pred in _.predicates:
+        value = pred.replace(rule, filter=ops.Value)
+        (table, *rest) = value.relations or (None,)
+        if not rest and table in tables and not _row_dependent([value]):
+            pushed[table].append(value)
+        else:
+            remaining.append(pred)
+
+    if not pushed:
+        return _
+
+    subs = {}
+    for table, preds in pushed.items():
+        rule = p.Field(table, name) >> d.Field(table.parent, name)
+        preds = tuple(v.replace(rule, filter=ops.Value) for v in preds)
+        subs[table] = table.copy(parent=_push_filter(ops.Filter(table.parent, preds)))
+
+    def rewrite(value):
+        return value.replace(subs, filter=p.Value | p.Reference)
+
+    chain = ops.JoinChain(
+        subs.get(y.first, y.first),
+        rest=[
+            link.copy(
+                table=subs.get(link.table, link.table),
+                predicates=tuple(map(rewrite, link.predicates)),
+            )
+            for link in y.rest
+        ],
+        values={k: rewrite(v) for k, v in y.values.items()},
+    )
+    if not remaining:
+        return chain
+
+    rule = p.Field(y, name) >> d.Field(chain, name)
+    preds = tuple(v.replace(rule, filter=ops.Value) for v in remaining)
+    return ops.Filter(chain, preds)
+
+
+@replace(p.Filter(y @ p.Union))
+def push_filter_into_union(_, y):
+    if _row_dependent(_.predicates):
+        return _
+
+    def branch(rel):
+        rule = p.Field(y, name) >> d.Field(rel, name)
+        preds = tuple(v.replace(rule, filter=ops.Value) for v in _.predicates)
+        return _push_filter(ops.Filter(rel, preds))
+
+    return y.copy(left=branch(y.left), right=branch(y.right))
+
+
+filter_pushdown = (
+    subsequent_filters
+    | push_filter_through_project
+    | push_filter_into_join
+    | push_filter_into_union
+)
+
+
+@replace(p.Filter)
+def push_filters_down(_, **kwargs):
+    """Push filter predicates through projections, joins and unions.
+
+    Conjuncts referencing a single table of a join are applied to that table
+    before joining unless an outer join would null-extend its rows, and
+    filters above a union are applied to both of its branches. Predicates
+    with window functions, reductions, subqueries or impure functions are
+    kept in place, as are the filters above projections or joins computing
+    window functions since filtering their input would change the windows.
+    """
+    return _push_filter(_)
+
+
+# constant folding, the rules are applied bottom-up so folded arguments fold
+# their parents in the same pass; only the operations whose result doesn't
+# depend on the engine are folded, for example string comparisons are kept
+# since they depend on the collation
+
+_ARITHMETIC = {
+    ops.Add: operator.add,
+    ops.Subtract: operator.sub,
+    ops.Multiply: operator.mul,
+    ops.Divide: operator.truediv,
+}
+
+_COMPARISONS = {
+    ops.Equals: operator.eq,
+    ops.NotEquals: operator.ne,
+    ops.Greater: operator.gt,
+    ops.GreaterEqual: operator.ge,
+    ops.Less: operator.lt,
+    ops.LessEqual: operator.le,
+}
+
+
+def _is_literal(node, *values) -> bool:
+    return isinstance(node, ops.Literal) and (not values or node.value in values)
+
+
+def _is_number(node) -> bool:
+    return isinstance(node, ops.Literal) and (
+        node.dtype.is_integer() or node.dtype.is_floating()
+    )
+
+
+def _is_nan(value) -> bool:
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _same_type(left: dt.DataType, right: dt.DataType) -> bool:
+    return left.copy(nullable=True) == right.copy(nullable=True)
+
+
+def _number_literal(value, dtype: dt.DataType) -> ops.Literal | None:
+    """Construct a numeric literal if `value` is representable by `dtype`."""
+    if dtype.is_integer():
+        if isinstance(value, bool) or not isinstance(value, int):
+            return None
+        if not dtype.bounds.lower <= value <= dtype.bounds.upper:
+            return None
+    elif dtype.is_floating():
+        if not math.isfinite(value):
+            return None
+        # only widen to double precision, narrowing would lose precision
+        if dtype.is_float32() or dtype.is_float16():
+            return None
+        if isinstance(value, int) and abs(value) > 2**53:
+            return None
+        value = float(value)
+    else:
+        return None
+    return ops.Literal(value, dtype)
+
+
+def _cast_literal(node: ops.Literal, to: dt.DataType) -> ops.Literal | None:
+    """Cast a literal at compile time where the result doesn't depend on the engine."""
+    if node.value is None or _same_type(node.dtype, to):
+        return ops.Literal(node.value, to)
+    elif _is_number(node):
+        return _number_literal(node.value, to)
+    return None
+
+
+def _with_dtype(node: ops.Value, dtype: dt.DataType) -> ops.Value:
+    """Ensure that a value replacing an operation of `dtype` has the same type."""
+    if _same_type(node.dtype, dtype):
+        return node
+    elif isinstance(node, ops.Literal) and (
+        (result := _cast_literal(node, dtype)) is not None
+    ):
+        return result
+    return ops.Cast(node, dtype)
+
+
+@replace(p.Add | p.Subtract | p.Multiply | p.Divide)
+def fold_arithmetic(_, **kwargs):
+    # the patterns also match subclasses like FloorDivide, whose rounding of
+    # negative operands depends on the engine
+    if (func := _ARITHMETIC.get(type(_))) is None:
+        return _
+    left, right = _.left, _.right
+    if not (_is_number(left) and _is_number(right)):
+        return _
+    if left.value is None or right.value is None:
+        return _
+    if isinstance(_, ops.Divide) and right.value == 0:
+        return _
+    value = func(left.value, right.value)
+    return _number_literal(value, _.dtype) or _
+
+
+@replace(p.Negate)
+def fold_negate(_, **kwargs):
+    if not _is_number(_.arg) or _.arg.value is None:
+        return _
+    return _number_literal(-_.arg.value, _.dtype) or _
+
+
+@replace(p.Equals | p.NotEquals | p.Greater | p.GreaterEqual | p.Less | p.LessEqual)
+def fold_comparison(_, **kwargs):
+    left, right = _.left, _.right
+    if not (
+        (_is_number(left) and _is_number(right))
+        or (
+            _is_literal(left)
+            and _is_literal(right)
+            and left.dtype.is_boolean()
+            and right.dtype.is_boolean()
+        )
+    ):
+        return _
+    if left.value is None or right.value is None:
+        return ops.Literal(None, _.dtype)
+    if _is_nan(left.value) or _is_nan(right.value):
+        # engines disagree on how NaN compares
+        return _
+    return ops.Literal(_COMPARISONS[type(_)](left.value, right.value), _.dtype)
+
+
+@replace(p.And)
+def fold_and(_, **kwargs):
+    left, right = _.left, _.right
+    if _is_literal(left, False) or _is_literal(right, False):
+        return ops.Literal(False, _.dtype)
+    elif _is_literal(left, True):
+        return right
+    elif _is_literal(right, True):
+        return left
+    elif _is_literal(left, None) and _is_literal(right, None):
+        return ops.Literal(None, _.dtype)
+    return _
+
+
+@replace(p.Or)
+def fold_or(_, **kwargs):
+    left, right = _.left, _.right
+    if _is_literal(left, True) or _is_literal(right, True):
+        return ops.Literal(True, _.dtype)
+    elif _is_literal(left, False):
+        return right
+    elif _is_literal(right, False):
+        return left
+    elif _is_literal(left, None) and _is_literal(right, None):
+        return ops.Literal(None, _.dtype)
+    return _
+
+
+@replace(p.Xor)
+def fold_xor(_, **kwargs):
+    left, right = _.left, _.right
+    if not (_is_literal(left) and _is_literal(right)):
+        return _
+    if left.value is None or right.value is None:
+        return ops.Literal(None, _.dtype)
+    return ops.Literal(left.value != right.value, _.dtype)
+
+
+@replace(p.Not)
+def fold_not(_, **kwargs):
+    if isinstance(_.arg, ops.Not):
+        return _.arg.arg
+    elif _is_literal(_.arg):
+        value = _.arg.value
+        return ops.Literal(None if value is None else not value, _.dtype)
+    return _
+
+
+@replace(p.StringConcat)
+def fold_string_concat(_, **kwargs):
+    args = []
+    for arg in _.arg:
+        if _is_literal(arg) and arg.value is None:
+            # engines disagree on whether nulls are skipped or propagated
+            return _
+        if args and _is_literal(arg) and _is_literal(args[-1]):
+            args[-1] = ops.Literal(args[-1].value + arg.value, dt.string)
+        else:
+            args.append(arg)
+
+    if len(args) == len(_.arg):
+        return _
+    elif len(args) == 1:
+        return _with_dtype(args[0], _.dtype)
+    return ops.StringConcat(tuple(args))
+
+
+@replace(p.Cast)
+def fold_cast(_, **kwargs):
+    if _.arg.dtype == _.to:
+        return _.arg
+    elif isinstance(_.arg, ops.Literal):
+        return _cast_literal(_.arg, _.to) or _
+    return _
+
+
+@replace(p.Coalesce)
+def fold_coalesce(_, **kwargs):
+    args = []
+    for arg in _.arg:
+        if _is_literal(arg, None):
+            continue
+        args.append(arg)
+        if _is_literal(arg):
+            # the following arguments are never evaluated
+            break
+
+    if len(args) == len(_.arg):
+        return _
+    elif not args:
+        return ops.Literal(None, _.dtype)
+    elif len(args) == 1:
+        return _with_dtype(args[0], _.dtype)
+    return _with_dtype(ops.Coalesce(tuple(args)), _.dtype)
+
+
+@replace(p.IfElse)
+def fold_ifelse(_, **kwargs):
+    if _is_literal(_.bool_expr, True):
+        return _with_dtype(_.true_expr, _.dtype)
+    elif _is_literal(_.bool_expr):
+        return _with_dtype(_.false_null_expr, _.dtype)
+    return _
+
+
+def _fold_cases(node, matches):
+    """Drop the branches of a case expression known not to match.
+
+    `matches` returns `True` or `False` if a condition is known to match or
+    not at compile time, and `None` otherwise.
+    """
+    cases, results = [], []
+    default = node.default
+    for case, result in zip(node.cases, node.results):
+        matched = matches(case)
+        if matched is None:
+            cases.append(case)
+            results.append(result)
+        elif matched:
+            # the following branches and the default are never evaluated
+            default = result
+            break
+
+    if len(cases) == len(node.cases) and default is node.default:
+        return node
+    elif not cases:
+        if default is None:
+            return ops.Literal(None, node.dtype)
+        return _with_dtype(default, node.dtype)
+    return _with_dtype(
+        node.copy(cases=tuple(cases), results=tuple(results), default=default),
+        node.dtype,
+    )
+
+
+@replace(p.SearchedCase)
+def fold_searched_case(_, **kwargs):
+    def matches(case):
+        return case.value is True if _is_literal(case) else None
+
+    return _fold_cases(_, matches)
+
+
+@replace(p.SimpleCase)
+def fold_simple_case(_, **kwargs):
+    base = _.base
+    if not (_is_number(base) or (_is_literal(base) and base.dtype.is_boolean())):
+        return _
+
+    def matches(case):
+        if base.value is None:
+            # null never compares equal
+            return False
+        elif not _is_literal(case) or not (_is_number(case) or case.dtype.is_boolean()):
+            return None
+        return case.value is not None and case.value == base.value
+
+    return _fold_cases(_, matches)
+
+
+@replace(p.Filter)
+def drop_true_predicates(_, **kwargs):
+    predicates = tuple(pred for pred in _.predicates if not _is_literal(pred, True))
+    if len(predicates) == len(_.predicates):
+        return _
+    elif not predicates:
+        return _.parent
+    return _.copy(predicates=predicates)
+
+
+fold_constants = (
+    fold_arithmetic
+    | fold_negate
+    | fold_comparison
+    | fold_and
+    | fold_or
+    | fold_xor
+    | fold_not
+    | fold_string_concat
+    | fold_cast
+    | fold_coalesce
+    | fold_ifelse
+    | fold_searched_case
+    | fold_simple_case
+    | drop_true_predicates
+)
+"""Evaluate the value expressions of literals at compile time.
+
+Folds arithmetic, comparisons, boolean logic, string concatenation and casts
+of literals, drops the arguments of `coalesce`, `ifelse` and case expressions
+which are known to be skipped, and removes filter predicates which are always
+true.
+"""
+
+
 def simplify(node):
     # TODO(kszucs): add a utility to the graph module to do rewrites in multiple
     # passes after each other
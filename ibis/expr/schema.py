@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from collections import Counter
 from collections.abc import Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any, Union
@@ -20,6 +21,14 @@ if TYPE_CHECKING:
     import sqlglot.expressions as sge
 
 
+@functools.lru_cache(maxsize=256)
+def _name_locs(names: tuple[str, ...]) -> dict[str, int]:
+    # schemas derived without renaming columns, e.g. by casting them, share
+    # the same name -> position index instead of rebuilding it; the returned
+    # mapping must be treated as read-only
+    return dict(zip(names, range(len(names))))
+
+
 class Schema(Concrete, Coercible, MapSet):
     """An ordered mapping of str -> [datatype](./datatypes.qmd), used to hold a [Table](./expression-tables.qmd#ibis.expr.tables.Table)'s schema."""
 
@@ -76,7 +85,7 @@ class Schema(Concrete, Coercible, MapSet):
 
     @attribute
     def _name_locs(self) -> dict[str, int]:
-        return {v: i for i, v in enumerate(self.names)}
+        return _name_locs(self.names)
 
     def equals(self, other: Schema) -> bool:
         """Return whether `other` is equal to `self`.
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import pytest
+
 import ibis
 import ibis.expr.operations as ops
-from ibis.expr.rewrites import simplify
+from ibis import _
+from ibis.expr.rewrites import fold_constants, push_filters_down, simplify
 
 t = ibis.table(
     name="t",
@@ -102,3 +105,129 @@ def test_simplify_project_filter_project():
 
     t4_opt = simplify(t4.op())
     assert t4_opt == proj.op()
+
+
+u = ibis.table(name="u", schema={"int_col": "int64", "value": "float64"})
+
+
+def test_push_filters_down_join():
+    joined = t.join(u, "int_col")
+    expr = joined.filter(joined.bool_col, joined.value > 0, joined.float_col < _.value)
+    result = expr.op().replace(push_filters_down)
+
+    assert isinstance(result, ops.Filter)
+    chain = result.parent
+    (pred,) = result.predicates
+    assert pred.relations == {chain}
+
+    assert chain.first.parent == ops.Filter(t, [t.bool_col])
+    (link,) = chain.rest
+    assert link.table.parent == ops.Filter(u, [u.value > 0])
+    assert link.table.identifier == joined.op().rest[0].table.identifier
+    assert chain.schema == joined.schema()
+
+
+@pytest.mark.parametrize(
+    ("how", "left", "right"),
+    [
+        ("inner", True, True),
+        ("left", True, False),
+        ("right", False, True),
+        ("outer", False, False),
+        ("asof", True, False),
+        ("positional", False, False),
+    ],
+)
+def test_push_filters_down_outer_joins(how, left, right):
+    if how == "asof":
+        joined = t.asof_join(u, "int_col")
+    elif how == "positional":
+        joined = t.join(u, how=how, lname="{name}_left")
+    else:
+        joined = t.join(u, "int_col", how=how)
+    value = "value_right" if "value_right" in joined.columns else "value"
+    expr = joined.filter(joined.bool_col, joined[value] > 0)
+    result = expr.op().replace(push_filters_down)
+
+    chain = result.parent if isinstance(result, ops.Filter) else result
+    assert isinstance(chain.first.parent, ops.Filter) is left
+    assert isinstance(chain.rest[0].table.parent, ops.Filter) is right
+
+
+def test_push_filters_down_keeps_window_semantics():
+    windowed = t.mutate(rank=ibis.row_number().over(order_by=t.float_col))
+    expr = windowed.filter(windowed.int_col > 0)
+    assert expr.op().replace(push_filters_down) == expr.op()
+
+    joined = t.join(u, "int_col").mutate(n=ibis.row_number())
+    expr = joined.filter(joined.value > 0)
+    assert expr.op().replace(push_filters_down) == expr.op()
+
+    expr = t.filter(t.int_col > 0).join(u, "int_col")
+    expr = expr.filter(expr.value > expr.value.mean())
+    assert expr.op().replace(push_filters_down) == expr.op()
+
+
+def test_push_filters_down_union_and_project():
+    projected = t.select(x=t.int_col + 1, y=t.float_col)
+    expr = projected.union(projected).filter(_.x > 1)
+    result = expr.op().replace(push_filters_down)
+
+    assert isinstance(result, ops.Union)
+    assert result.left == result.right
+    assert isinstance(result.left, ops.Project)
+    assert result.left.parent == ops.Filter(t, [t.int_col + 1 > 1])
+
+
+def test_fold_constants_values():
+    one, two = ibis.literal(1), ibis.literal(2)
+    cases = [
+        (one + two * 3, ibis.literal(7, "int8")),
+        (-(one - two), ibis.literal(1, "int8")),
+        (one / two, ibis.literal(0.5)),
+        ((one + two) > 2, ibis.literal(True)),
+        (ibis.literal("a") + "b" + "c", ibis.literal("abc")),
+        (ibis.literal(5).cast("float64"), ibis.literal(5.0)),
+        (t.int_col.cast("int64"), t.int_col),
+        (ibis.coalesce(ibis.null("int32"), 5, t.int_col), ibis.literal(5, "int64")),
+        (ibis.ifelse(two > one, t.int_col, 0), t.int_col),
+        ((t.bool_col & True) | False, t.bool_col),
+        (t.bool_col & ibis.literal(False), ibis.literal(False)),
+        (~~t.bool_col, t.bool_col),
+        (
+            ibis.cases((one > two, 1), (t.bool_col, 2), (two > one, 3), else_=4),
+            ibis.cases((t.bool_col, 2), else_=3),
+        ),
+        (two.cases((1, "a"), (2, "b"), else_="c"), ibis.literal("b")),
+    ]
+    for expr, expected in cases:
+        assert expr.op().replace(fold_constants) == expected.op()
+
+
+def test_fold_constants_keeps_engine_dependent_values():
+    cases = [
+        # division by zero, overflow and string collations are engine specific
+        ibis.literal(1) / 0,
+        ibis.literal(2**62, "int64") * 4,
+        ibis.literal("a") < "b",
+        ibis.literal(float("nan")) == ibis.literal(float("nan")),
+        ibis.literal(1.5).cast("int64"),
+        ibis.literal("a") + ibis.null("string"),
+        t.bool_col | ibis.null("boolean"),
+        # so is the rounding of integer division and remainders
+        ibis.literal(5) // 2,
+        ibis.literal(-7) // 2,
+        ibis.literal(7) // -2,
+        ibis.literal(-7) % 2,
+        ibis.literal(7) % -2,
+    ]
+    for expr in cases:
+        assert expr.op().replace(fold_constants) == expr.op()
+
+
+def test_fold_constants_filter():
+    expr = t.filter(ibis.literal(True), t.int_col > ibis.literal(1) + 1)
+    assert expr.op().replace(fold_constants) == ops.Filter(t, [t.int_col > 2])
+
+    expr = t.filter(ibis.literal(1) < 2).select("int_col")
+    assert expr.op().replace(fold_constants) == t.select("int_col").op()
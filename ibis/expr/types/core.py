@@ -3,7 +3,7 @@ from __future__ import annotations
 import contextlib
 import os
 import webbrowser
-from typing import TYPE_CHECKING, Any, NoReturn
+from typing import TYPE_CHECKING, Any, Literal, NoReturn
 
 from public import public
 
@@ -11,6 +11,7 @@ import ibis
 import ibis.expr.operations as ops
 from ibis.common.annotations import ValidationError
 from ibis.common.exceptions import IbisError, TranslationError
+from ibis.common.fingerprint import fingerprint
 from ibis.common.grounds import Immutable
 from ibis.common.patterns import Coercible, CoercionError
 from ibis.common.typing import get_defining_scope
@@ -164,6 +165,32 @@ class Expr(Immutable, Coercible):
             )
         return self._arg.equals(other._arg)
 
+    def fingerprint(self) -> str:
+        """Return a structural fingerprint that is stable across processes.
+
+        Unlike `hash()`, the fingerprint doesn't change between Python
+        processes, so it can be used as the key of caches shared between
+        processes or machines. Structurally equivalent expressions have the
+        same fingerprint, regardless of the names generated for unnamed
+        in-memory tables and the identifiers of table references.
+
+        Returns
+        -------
+        str
+            A hexadecimal digest of the expression.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> t1 = ibis.table(dict(a="int"), name="t")
+        >>> t2 = ibis.table(dict(a="int"), name="t")
+        >>> t1.fingerprint() == t2.fingerprint()
+        True
+        >>> t1.fingerprint() == t1.a.fingerprint()
+        False
+        """
+        return fingerprint(self._arg)
+
     def __bool__(self) -> bool:
         raise ValueError("The truth value of an Ibis expression is not defined")
 
@@ -401,6 +428,7 @@ class Expr(Immutable, Coercible):
         self,
         limit: int | str | None = "default",
         params: Mapping[ir.Value, Any] | None = None,
+        dtype_backend: Literal["numpy", "numpy_nullable", "pyarrow"] | None = None,
         **kwargs: Any,
     ):
         """Execute an expression against its backend if one exists.
@@ -412,6 +440,9 @@ class Expr(Immutable, Coercible):
             "no limit". The default is in `ibis/config.py`.
         params
             Mapping of scalar parameter expressions to value
+        dtype_backend
+            The kind of pandas dtypes to convert the result to. `None` uses
+            `ibis.options.dtype_backend`.
         kwargs
             Keyword arguments
 
@@ -451,7 +482,7 @@ class Expr(Immutable, Coercible):
         [`Value.to_pandas()`](./expression-generic.qmd#ibis.expr.types.generic.Value.to_pandas)
         """
         return self._find_backend(use_default=True).execute(
-            self, limit=limit, params=params, **kwargs
+            self, limit=limit, params=params, dtype_backend=dtype_backend, **kwargs
         )
 
     def compile(
@@ -617,6 +648,7 @@ class Expr(Immutable, Coercible):
         limit: int | str | None = None,
         params: Mapping[ir.Value, Any] | None = None,
         chunk_size: int = 1_000_000,
+        dtype_backend: Literal["numpy", "numpy_nullable", "pyarrow"] | None = None,
         **kwargs: Any,
     ) -> Iterator[pd.DataFrame | pd.Series | Any]:
         """Execute expression and return an iterator of pandas DataFrames.
@@ -633,6 +665,9 @@ class Expr(Immutable, Coercible):
             Mapping of scalar parameter expressions to value.
         chunk_size
             Maximum number of rows in each returned `DataFrame`.
+        dtype_backend
+            The kind of pandas dtypes to convert the batches to. `None` uses
+            `ibis.options.dtype_backend`.
         kwargs
             Keyword arguments
 
@@ -645,6 +680,7 @@ class Expr(Immutable, Coercible):
             params=params,
             limit=limit,
             chunk_size=chunk_size,
+            dtype_backend=dtype_backend,
             **kwargs,
         )
 
@@ -4687,6 +4687,44 @@ class Table(Expr, _FixedTextJupyterMixin):
 
         return ops.Project(self, exprs).to_expr()
 
+    def edit(self) -> ColumnEditor:
+        """Start a batch of column edits that is applied as a single projection.
+
+        Chaining [`rename`](#ibis.expr.types.relations.Table.rename),
+        [`drop`](#ibis.expr.types.relations.Table.drop),
+        [`cast`](#ibis.expr.types.relations.Table.cast) and
+        [`relocate`](#ibis.expr.types.relations.Table.relocate) calls creates
+        a new relation and schema for every step, which gets expensive on wide
+        tables. The returned editor records the edits against a plain mapping
+        of columns and only builds a relation once
+        [`ColumnEditor.build`](#ibis.expr.types.relations.ColumnEditor.build)
+        is called.
+
+        Returns
+        -------
+        ColumnEditor
+            A builder accumulating column edits on this table.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> t = ibis.table({"a": "int8", "b": "string", "c": "float64"}, name="t")
+        >>> expr = (
+        ...     t.edit()
+        ...     .rename(x="a")
+        ...     .drop("b")
+        ...     .cast({"c": "float32"})
+        ...     .relocate("c", before="x")
+        ...     .build()
+        ... )
+        >>> expr.schema()
+        ibis.Schema {
+          c  float32
+          x  int8
+        }
+        """
+        return ColumnEditor(self)
+
     def window_by(
         self,
         time_col: str | ir.Value,
@@ -4932,4 +4970,183 @@ class CachedTable(Table):
         return current_backend._finalize_cached_table(self.op().name)
 
 
+@public
+class ColumnEditor:
+    """Accumulate column edits on a table and apply them as one projection.
+
+    Columns are referred to by their current name, so a column renamed by an
+    earlier edit must be referred to by its new name afterwards. Create an
+    editor with [`Table.edit`](#ibis.expr.types.relations.Table.edit).
+    """
+
+    __slots__ = ("_table", "_values")
+
+    def __init__(self, table: Table) -> None:
+        self._table = table
+        self._values = dict(table.op().fields)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._values)})"
+
+    def _check(self, names: Iterable[str]) -> None:
+        if missing := [name for name in names if name not in self._values]:
+            raise com.IbisInputError(
+                f"Columns not found: {missing}. Existing columns: {list(self._values)}"
+            )
+
+    def rename(
+        self, mapping: Mapping[str, str] | None = None, /, **substitutions: str
+    ) -> ColumnEditor:
+        """Rename columns, expressed as `new_name=old_name`.
+
+        Parameters
+        ----------
+        mapping
+            A mapping from new name to old name.
+        substitutions
+            Columns to be renamed, expressed as `new_name=old_name`.
+
+        Returns
+        -------
+        ColumnEditor
+            The editor, for chaining.
+        """
+        renames = {}
+        for new_name, old_name in itertools.chain(
+            (mapping or {}).items(), substitutions.items()
+        ):
+            if old_name in renames:
+                raise ValueError(
+                    f"duplicate new names passed for renaming {old_name!r}"
+                )
+            renames[old_name] = new_name
+        self._check(renames)
+
+        values = {
+            renames.get(name, name): value for name, value in self._values.items()
+        }
+        if len(values) != len(self._values):
+            raise com.IbisInputError("Renaming would result in duplicate column names")
+        self._values = values
+        return self
+
+    def drop(self, *names: str) -> ColumnEditor:
+        """Remove columns.
+
+        Parameters
+        ----------
+        names
+            Names of the columns to drop.
+
+        Returns
+        -------
+        ColumnEditor
+            The editor, for chaining.
+        """
+        self._check(names)
+        for name in names:
+            self._values.pop(name, None)
+        return self
+
+    def _cast(self, schema: SchemaLike, cast_method: str) -> ColumnEditor:
+        schema = sch.schema(schema)
+        self._check(schema.names)
+        values = self._values
+        for name, dtype in schema.items():
+            values[name] = getattr(values[name].to_expr(), cast_method)(dtype).op()
+        return self
+
+    def cast(self, schema: SchemaLike) -> ColumnEditor:
+        """Cast columns.
+
+        Parameters
+        ----------
+        schema
+            Mapping, schema or iterable of pairs of column names and types.
+
+        Returns
+        -------
+        ColumnEditor
+            The editor, for chaining.
+        """
+        return self._cast(schema, cast_method="cast")
+
+    def try_cast(self, schema: SchemaLike) -> ColumnEditor:
+        """Cast columns, producing `NULL` for values that fail to cast.
+
+        Parameters
+        ----------
+        schema
+            Mapping, schema or iterable of pairs of column names and types.
+
+        Returns
+        -------
+        ColumnEditor
+            The editor, for chaining.
+        """
+        return self._cast(schema, cast_method="try_cast")
+
+    def relocate(
+        self,
+        *names: str,
+        before: str | Sequence[str] | None = None,
+        after: str | Sequence[str] | None = None,
+    ) -> ColumnEditor:
+        """Move columns before or after other columns.
+
+        If neither `before` nor `after` is given the columns are moved to the
+        front.
+
+        Parameters
+        ----------
+        names
+            Names of the columns to move, in their new relative order.
+        before
+            Move the columns before the first of these columns.
+        after
+            Move the columns after the last of these columns.
+
+        Returns
+        -------
+        ColumnEditor
+            The editor, for chaining.
+        """
+        if before is not None and after is not None:
+            raise com.IbisInputError("Cannot specify both `before` and `after`")
+
+        moved = dict.fromkeys(names)
+        self._check(moved)
+
+        columns = list(self._values)
+        positions = dict(zip(columns, range(len(columns))))
+        if before is not None:
+            anchors = util.promote_list(before)
+            self._check(anchors)
+            where = min((positions[name] for name in anchors), default=0)
+        elif after is not None:
+            anchors = util.promote_list(after)
+            self._check(anchors)
+            where = max((positions[name] for name in anchors), default=-1) + 1
+        else:
+            where = 0
+
+        order = [name for name in columns[:where] if name not in moved]
+        order.extend(moved)
+        order.extend(name for name in columns[where:] if name not in moved)
+
+        values = self._values
+        self._values = {name: values[name] for name in order}
+        return self
+
+    def build(self) -> Table:
+        """Apply the accumulated edits.
+
+        Returns
+        -------
+        Table
+            A single projection of the original table with all edits applied.
+        """
+        return ops.Project(self._table, self._values).to_expr()
+
+
 public(Table=Table, CachedTable=CachedTable)
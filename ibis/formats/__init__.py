@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Generic, TypeVar
 
+from ibis.common.fingerprint import tokenize
 from ibis.util import PseudoHashable, indent
 
 if TYPE_CHECKING:
@@ -239,6 +240,10 @@ class TableProxy(PseudoHashable[T]):
         data_repr = indent(repr(self.obj), spaces=2)
         return f"{self.__class__.__name__}:\n{data_repr}"
 
+    def estimated_size(self) -> int | None:
+        """Return the approximate size of the data in bytes, if cheap to tell."""
+        return None
+
     @abstractmethod
     def to_frame(self) -> pd.DataFrame:  # pragma: no cover
         """Convert this input to a pandas DataFrame."""
@@ -260,3 +265,8 @@ class TableProxy(PseudoHashable[T]):
         with pa.RecordBatchFileWriter(out, data.schema) as writer:
             writer.write(data)
         return out.getvalue()
+
+
+@tokenize.register(TableProxy)
+def _(value):
+    return tokenize(value.obj)
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+from contextvars import ContextVar
 from functools import partial
 from importlib.util import find_spec as _find_spec
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 import pandas as pd
@@ -20,11 +21,107 @@ from ibis.formats.numpy import NumpyType
 from ibis.formats.pyarrow import PyArrowData, PyArrowSchema, PyArrowType
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import polars as pl
     import pyarrow as pa
 
 geospatial_supported = _find_spec("geopandas") is not None
 
+DtypeBackend = Literal["numpy", "numpy_nullable", "pyarrow"]
+
+_dtype_backend: ContextVar[DtypeBackend | None] = ContextVar(
+    "dtype_backend", default=None
+)
+
+_NULLABLE_DTYPES = {
+    dt.Int8: pd.Int8Dtype(),
+    dt.Int16: pd.Int16Dtype(),
+    dt.Int32: pd.Int32Dtype(),
+    dt.Int64: pd.Int64Dtype(),
+    dt.UInt8: pd.UInt8Dtype(),
+    dt.UInt16: pd.UInt16Dtype(),
+    dt.UInt32: pd.UInt32Dtype(),
+    dt.UInt64: pd.UInt64Dtype(),
+    dt.Float32: pd.Float32Dtype(),
+    dt.Float64: pd.Float64Dtype(),
+    dt.Boolean: pd.BooleanDtype(),
+    dt.String: pd.StringDtype(),
+}
+
+
+def get_dtype_backend() -> DtypeBackend:
+    """Return the dtype backend results are currently converted with."""
+    if (backend := _dtype_backend.get()) is not None:
+        return backend
+
+    from ibis import options
+
+    return options.dtype_backend
+
+
+@contextlib.contextmanager
+def dtype_backend(backend: DtypeBackend | None) -> Iterator[None]:
+    """Convert the results computed within the block with `backend`.
+
+    `None` keeps the dtype backend of the enclosing block, which defaults to
+    `ibis.options.dtype_backend`.
+    """
+    if backend is None:
+        yield
+        return
+    if backend not in ("numpy", "numpy_nullable", "pyarrow"):
+        raise ValueError(
+            "dtype_backend must be one of 'numpy', 'numpy_nullable' or "
+            f"'pyarrow', got {backend!r}"
+        )
+    token = _dtype_backend.set(backend)
+    try:
+        yield
+    finally:
+        _dtype_backend.reset(token)
+
+
+def iter_with_dtype_backend(
+    batches: Iterator, backend: DtypeBackend | None
+) -> Iterator:
+    """Produce every element of `batches` with the dtype backend `backend`."""
+    if backend is None:
+        yield from batches
+        return
+    while True:
+        with dtype_backend(backend):
+            try:
+                batch = next(batches)
+            except StopIteration:
+                return
+        yield batch
+
+
+def _identity(value):
+    return value
+
+
+def _map_unique(s: pd.Series, func) -> pd.Series:
+    """Apply `func` to the non-null elements of `s`, once per distinct value.
+
+    Falls back to mapping every element if the values aren't hashable.
+    """
+    values = s.to_numpy(dtype=object)
+    notnull = ~pd.isna(values)
+    try:
+        codes, uniques = pd.factorize(values[notnull])
+    except TypeError:
+        return s.map(func, na_action="ignore")
+
+    converted = np.empty(len(uniques), dtype=object)
+    for i, value in enumerate(uniques):
+        converted[i] = func(value)
+
+    result = values.copy()
+    result[notnull] = converted[codes]
+    return pd.Series(result, index=s.index, name=s.name)
+
 
 class PandasType(NumpyType):
     @classmethod
@@ -135,8 +232,48 @@ class PandasData(DataMapper):
                 return GeoDataFrame(df, geometry=geom)
         return df
 
+    @classmethod
+    def from_pyarrow(
+        cls, table: pa.Table, schema: sch.Schema, **kwargs
+    ) -> pd.DataFrame:
+        """Convert the result `table` of an expression with `schema` to pandas.
+
+        The table is converted with a single `to_pandas` call, passing
+        `kwargs`, except for the nested and null columns which NumPy dtypes
+        can't represent; those are converted to Python objects. With the
+        `"pyarrow"` dtype backend every column is wrapped without a copy. The
+        result still has to be converted to `schema`, for example by passing
+        it to `__pandas_result__`.
+        """
+        import pyarrow as pa
+
+        table = table.rename_columns(list(schema.names))
+        backend = get_dtype_backend()
+        if backend == "pyarrow":
+            return table.to_pandas(**kwargs, types_mapper=pd.ArrowDtype)
+        elif backend == "numpy_nullable":
+            kwargs["types_mapper"] = {
+                PyArrowType.from_ibis(klass()): pandas_type
+                for klass, pandas_type in _NULLABLE_DTYPES.items()
+            }.get
+
+        fallback = [
+            i
+            for i, (field, dtype) in enumerate(zip(table.schema, schema.types))
+            if pa.types.is_nested(field.type) or dtype.is_null()
+        ]
+        keep = [i for i in range(table.num_columns) if i not in fallback]
+        df = table.select(keep).to_pandas(**kwargs)
+        for i in fallback:
+            df.insert(i, table.column_names[i], table.column(i).to_pylist())
+        return df
+
     @classmethod
     def convert_column(cls, obj, dtype):
+        backend_type = cls._backend_type(dtype, get_dtype_backend())
+        if backend_type is not None and backend_type == obj.dtype:
+            return obj
+
         pandas_type = PandasType.from_ibis(dtype)
 
         method_name = f"convert_{dtype.__class__.__name__}"
@@ -144,11 +281,33 @@ class PandasData(DataMapper):
 
         result = convert_method(obj, dtype, pandas_type)
         assert not isinstance(result, np.ndarray), f"{convert_method} -> {type(result)}"
+
+        if backend_type is not None:
+            try:
+                return result.astype(backend_type)
+            except Exception:  # noqa: BLE001
+                # keep the values the extension dtype can't hold, e.g. UUIDs
+                return result
         return result
 
+    @staticmethod
+    def _backend_type(dtype, backend):
+        """Return the extension dtype of `dtype` columns for `backend`, if any."""
+        if backend == "pyarrow" and not dtype.is_geospatial():
+            try:
+                return pd.ArrowDtype(PyArrowType.from_ibis(dtype))
+            except Exception:  # noqa: BLE001
+                # types without an arrow equivalent stay numpy backed
+                return None
+        elif backend == "numpy_nullable":
+            return _NULLABLE_DTYPES.get(type(dtype))
+        return None
+
     @classmethod
     def convert_scalar(cls, obj, dtype):
-        df = PandasData.convert_table(obj, sch.Schema({str(obj.columns[0]): dtype}))
+        # scalars are returned as Python objects regardless of the dtype backend
+        with dtype_backend("numpy"):
+            df = PandasData.convert_table(obj, sch.Schema({str(obj.columns[0]): dtype}))
         value = df.iat[0, 0]
 
         if dtype.is_array():
@@ -209,7 +368,7 @@ class PandasData(DataMapper):
                 try:
                     from dateutil.parser import parse as date_parse
 
-                    return s.map(date_parse, na_action="ignore")
+                    return _map_unique(s, date_parse)
                 except TypeError:
                     return s
             except (ValueError, TypeError):
@@ -239,7 +398,7 @@ class PandasData(DataMapper):
                 else:
                     return v
 
-            return s.map(try_date, na_action="ignore")
+            return _map_unique(s, try_date)
 
     @classmethod
     def convert_Interval(cls, s, dtype, pandas_type):
@@ -264,11 +423,11 @@ class PandasData(DataMapper):
             scale=dtype.scale,
             strict=False,
         )
-        return s.map(func, na_action="ignore")
+        return _map_unique(s, func)
 
     @classmethod
     def convert_UUID(cls, s, dtype, pandas_type):
-        return s.map(cls.get_element_converter(dtype), na_action="ignore")
+        return _map_unique(s, cls.get_element_converter(dtype))
 
     @classmethod
     def convert_Struct(cls, s, dtype, pandas_type):
@@ -291,16 +450,19 @@ class PandasData(DataMapper):
     @classmethod
     def get_element_converter(cls, dtype):
         name = f"convert_{type(dtype).__name__}_element"
-        funcgen = getattr(cls, name, lambda _: lambda x: x)
-        return funcgen(dtype)
+        funcgen = getattr(cls, name, None)
+        return _identity if funcgen is None else funcgen(dtype)
 
     @classmethod
     def convert_Struct_element(cls, dtype):
         converters = tuple(map(cls.get_element_converter, dtype.types))
+        identity = all(converter is _identity for converter in converters)
 
         def convert(values, names=dtype.names, converters=converters):
             if values is None:
                 return values
+            elif identity and isinstance(values, dict) and len(values) == len(names):
+                return dict(values)
 
             items = (
                 values.items()
@@ -319,7 +481,8 @@ class PandasData(DataMapper):
         import json
 
         def convert(value):
-            if value is None:
+            if not isinstance(value, (str, bytes, bytearray)):
+                # already decoded by the driver
                 return value
             try:
                 return json.loads(value)
@@ -365,6 +528,8 @@ class PandasData(DataMapper):
     @classmethod
     def convert_Array_element(cls, dtype):
         convert_value = cls.get_element_converter(dtype.value_type)
+        if convert_value is _identity:
+            return lambda values: values if values is None else list(values)
 
         def convert(values):
             if values is None:
@@ -380,6 +545,8 @@ class PandasData(DataMapper):
     def convert_Map_element(cls, dtype):
         convert_key = cls.get_element_converter(dtype.key_type)
         convert_value = cls.get_element_converter(dtype.value_type)
+        if convert_key is _identity and convert_value is _identity:
+            return lambda raw_row: raw_row if raw_row is None else dict(raw_row)
 
         def convert(raw_row):
             if raw_row is None:
@@ -409,6 +576,11 @@ class PandasData(DataMapper):
 
 
 class PandasDataFrameProxy(TableProxy[pd.DataFrame]):
+    def estimated_size(self) -> int:
+        # object columns only count their pointers, measuring the python
+        # objects themselves is as slow as converting them
+        return int(self.obj.memory_usage(index=False, deep=False).sum())
+
     def to_frame(self) -> pd.DataFrame:
         return self.obj
 
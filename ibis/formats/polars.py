@@ -172,6 +172,9 @@ class PolarsData(DataMapper):
 
 
 class PolarsDataFrameProxy(TableProxy[pl.DataFrame]):
+    def estimated_size(self) -> int:
+        return self.obj.estimated_size()
+
     def to_frame(self) -> pd.DataFrame:
         return self.obj.to_pandas()
 
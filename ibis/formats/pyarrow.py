@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
+import os
+import tempfile
+import weakref
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pyarrow as pa
@@ -8,6 +13,7 @@ import pyarrow_hotfix  # noqa: F401
 
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
+from ibis.common.fingerprint import tokenize
 from ibis.expr.schema import Schema
 from ibis.formats import DataMapper, SchemaMapper, TableProxy, TypeMapper
 from ibis.util import V
@@ -336,6 +342,9 @@ class PyArrowData(DataMapper):
 
 
 class PyArrowTableProxy(TableProxy[V]):
+    def estimated_size(self) -> int:
+        return self.obj.nbytes
+
     def to_frame(self):
         return self.obj.to_pandas()
 
@@ -384,3 +393,96 @@ directly by running `ibis.memtable(my_dataset.to_table())`."""
 
     def to_polars(self, schema: Schema) -> pa.Table:
         raise com.UnsupportedOperationError(self.ERROR_MESSAGE)
+
+
+def _remove_file(path: str) -> None:
+    with contextlib.suppress(OSError):
+        os.remove(path)
+
+
+class PyArrowIPCFileProxy(TableProxy[str]):
+    """Proxy for an Arrow IPC file which is memory-mapped when read.
+
+    Reading the file maps its buffers instead of copying them, so the data
+    stays out of the Python heap until a backend actually consumes it.
+    """
+
+    __slots__ = ("obj",)
+    obj: str
+
+    def __init__(self, obj: str | Path, *, owned: bool = False) -> None:
+        self.obj = os.path.abspath(obj)
+        self.hash = hash((type(self.obj), self.obj))
+        if owned:
+            # spilled files only live as long as the proxy referencing them
+            weakref.finalize(self, _remove_file, self.obj)
+
+    @classmethod
+    def from_pyarrow(
+        cls, table: pa.Table, directory: str | Path | None = None
+    ) -> PyArrowIPCFileProxy:
+        """Spill `table` to a temporary IPC file removed with the proxy."""
+        fd, path = tempfile.mkstemp(
+            suffix=".arrow", prefix="ibis_memtable_", dir=directory
+        )
+        os.close(fd)
+        try:
+            with pa.OSFile(path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        except BaseException:
+            _remove_file(path)
+            raise
+        return cls(path, owned=True)
+
+    def _read(self) -> pa.Table:
+        return pa.ipc.open_file(pa.memory_map(self.obj)).read_all()
+
+    def read_schema(self) -> pa.Schema:
+        """Return the schema stored in the file without reading the data."""
+        return pa.ipc.open_file(pa.memory_map(self.obj)).schema
+
+    def to_frame(self) -> pd.DataFrame:
+        return self._read().to_pandas()
+
+    def to_pyarrow(self, schema: Schema) -> pa.Table:
+        # columns may have been renamed when constructing the memtable
+        table = self._read().rename_columns(list(schema.names))
+        return PyArrowData.convert_table(table, schema)
+
+    def to_pyarrow_dataset(self, schema: Schema) -> ds.Dataset:
+        """Return a dataset scanning the file.
+
+        Use with backends that can perform pushdowns into dataset objects.
+        """
+        import pyarrow.dataset as ds
+
+        if self.read_schema() == PyArrowSchema.from_ibis(schema):
+            return ds.dataset(self.obj, format="arrow")
+        # renamed or cast columns, wrap the converted memory-mapped table
+        return ds.dataset(self.to_pyarrow(schema))
+
+    def to_pyarrow_bytes(self, schema: Schema) -> bytes:
+        if self.read_schema() == PyArrowSchema.from_ibis(schema):
+            # the file already is the serialized table
+            return Path(self.obj).read_bytes()
+        return super().to_pyarrow_bytes(schema)
+
+    def to_polars(self, schema: Schema) -> pl.DataFrame:
+        import polars as pl
+
+        from ibis.formats.polars import PolarsData
+
+        df = pl.read_ipc(self.obj, memory_map=True)
+        df = df.rename(dict(zip(df.columns, schema.names)))
+        return PolarsData.convert_table(df, schema)
+
+
+@tokenize.register(PyArrowIPCFileProxy)
+def _(value):
+    # spilled files have random names, so identify files by their contents
+    digest = hashlib.blake2b(digest_size=16)
+    with open(value.obj, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return b"arrow.ipc:" + digest.digest()
@@ -440,3 +440,104 @@ def test_schema_doesnt_match_input_columns():
     schema = sch.Schema({"a": "int64", "b": "int64"})
     with pytest.raises(ValueError, match="schema names don't match"):
         PandasData.convert_table(df, schema)
+
+
+def test_convert_repeated_values():
+    import uuid
+
+    u = uuid.uuid4()
+    df = pd.DataFrame(
+        {
+            "u": [str(u), None, u.bytes, str(u)],
+            "d": [Decimal("1.50"), None, Decimal("1.5"), Decimal("2")],
+        }
+    )
+    schema = ibis.schema({"u": "uuid", "d": "decimal(5, 2)"})
+    result = PandasData.convert_table(df, schema)
+    assert result.u.tolist() == [u, None, u, u]
+    assert result.d.tolist() == [
+        Decimal("1.50"),
+        None,
+        Decimal("1.50"),
+        Decimal("2.00"),
+    ]
+
+
+def test_convert_nested_without_element_conversion():
+    df = pd.DataFrame(
+        {
+            "a": [np.array([1, 2]), None],
+            "s": [{"x": 1, "y": "a"}, None],
+            "m": [[("k", 1)], None],
+            "j": ['{"a": [1]}', {"b": 2}],
+        }
+    )
+    schema = ibis.schema(
+        {
+            "a": "array<int64>",
+            "s": "struct<x: int64, y: string>",
+            "m": "map<string, int64>",
+            "j": "json",
+        }
+    )
+    result = PandasData.convert_table(df, schema)
+    assert result.a.tolist() == [[1, 2], None]
+    assert result.s.tolist() == [{"x": 1, "y": "a"}, None]
+    assert result.m.tolist() == [{"k": 1}, None]
+    assert result.j.tolist() == [{"a": [1]}, {"b": 2}]
+
+
+def test_from_pyarrow():
+    table = pa.table(
+        {
+            "i": pa.array([1, None], type=pa.int64()),
+            "a": pa.array([[1], None], type=pa.list_(pa.int64())),
+            "n": pa.array([None, None], type=pa.int32()),
+            "s": pa.array(["x", None]),
+        }
+    )
+    schema = ibis.schema(
+        {"i": "int64", "a": "array<int64>", "n": "null", "b": "string"}
+    )
+    df = PandasData.from_pyarrow(table, schema)
+
+    assert df.columns.tolist() == ["i", "a", "n", "b"]
+    assert df.i.dtype == np.float64
+    assert df.a.tolist() == [[1], None]
+    assert df.n.tolist() == [None, None]
+    assert df.b.tolist() == ["x", None]
+
+
+@pytest.mark.parametrize(
+    ("backend", "expected"),
+    [
+        ("numpy", [np.dtype("float64"), np.dtype("object")]),
+        ("numpy_nullable", [pd.Int64Dtype(), pd.StringDtype()]),
+        ("pyarrow", [pd.ArrowDtype(pa.int64()), pd.ArrowDtype(pa.string())]),
+    ],
+)
+def test_dtype_backend(backend, expected):
+    from ibis.formats.pandas import dtype_backend
+
+    table = pa.table({"i": pa.array([1, None]), "s": pa.array(["a", None])})
+    schema = ibis.schema({"i": "int64", "s": "string"})
+    df = pd.DataFrame({"i": [1, None], "s": ["a", None]}, dtype=object)
+
+    with dtype_backend(backend):
+        from_arrow = PandasData.convert_table(
+            PandasData.from_pyarrow(table, schema), schema
+        )
+        from_objects = PandasData.convert_table(df, schema)
+
+    assert from_arrow.dtypes.tolist() == expected
+    if backend != "numpy":
+        assert from_objects.dtypes.tolist() == expected
+        assert from_arrow.i.isna().tolist() == [False, True]
+
+
+def test_dtype_backend_invalid():
+    from ibis.formats.pandas import dtype_backend
+
+    with pytest.raises(ValueError, match="dtype_backend must be one of"):
+        with dtype_backend("numpy_masked"):
+            pass
@@ -24,6 +24,9 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 import ibis.selectors as s
 from ibis.backends import _get_backend_names
+from ibis.backends.sql.optimizer import RULES, CostModel
+from ibis.common.egraph import EGraph
+from ibis.common.grounds import set_interning
 
 pytestmark = [pytest.mark.benchmark]
 
@@ -377,6 +380,10 @@ def region():
 
 @pytest.fixture(scope="module")
 def tpc_h02(part, supplier, partsupp, nation, region):
+    return make_tpc_h02(part, supplier, partsupp, nation, region)
+
+
+def make_tpc_h02(part, supplier, partsupp, nation, region):
     REGION = "EUROPE"
     SIZE = 25
     TYPE = "BRASS"
@@ -434,6 +441,30 @@ def test_repr_tpc_h02(benchmark, tpc_h02):
     benchmark(repr, tpc_h02)
 
 
+def saturate(node):
+    egraph = EGraph()
+    egraph.add(node)
+    egraph.run(RULES, n=8)
+    return egraph.extract(node, cost=CostModel())
+
+
+@pytest.mark.benchmark(group="egraph")
+def test_egraph_run_tpc_h02(benchmark, tpc_h02):
+    benchmark(saturate, tpc_h02.op())
+
+
+@pytest.mark.benchmark(group="egraph")
+@pytest.mark.parametrize("ncols", [100, 1_000, 10_000])
+def test_egraph_run_wide_tpc_h02(benchmark, tpc_h02, ncols):
+    # a projection of many computed columns on top of TPC-H query 2 followed by
+    # a filter, yielding tens of thousands of enodes for the largest case
+    key = tpc_h02.p_partkey.cast("int64")
+    expr = tpc_h02.select(
+        **{f"x{i}": (key + (ibis.literal(i) + 1)) * 2 for i in range(ncols)}
+    ).filter(ibis._.x0 > 1, ~~(ibis._.x1 < 5))
+    benchmark(saturate, expr.op())
+
+
 @pytest.mark.benchmark(group="repr")
 def test_repr_huge_union(benchmark):
     n = 10
@@ -487,11 +518,30 @@ def test_complex_datatype_builtins(benchmark, func):
     benchmark(func, datatype)
 
 
+@pytest.fixture(params=[False, True], ids=["plain", "interned"])
+def interning(request):
+    set_interning(request.param)
+    yield request.param
+    set_interning(False)
+
+
 @pytest.mark.benchmark(group="equality")
 def test_large_expr_equals(benchmark, tpc_h02):
     benchmark(ir.Expr.equals, tpc_h02, copy.deepcopy(tpc_h02))
 
 
+@pytest.mark.benchmark(group="equality")
+def test_large_expr_equals_rebuilt(
+    benchmark, interning, part, supplier, partsupp, nation, region
+):
+    # structurally equal expressions built independently of each other
+    def setup():
+        args = part, supplier, partsupp, nation, region
+        return (make_tpc_h02(*args), make_tpc_h02(*args)), {}
+
+    benchmark.pedantic(ir.Expr.equals, setup=setup, rounds=50)
+
+
 @pytest.mark.benchmark(group="datatype")
 @pytest.mark.parametrize(
     "dtypes",
@@ -675,6 +725,52 @@ def test_snowflake_medium_sized_to_pandas(benchmark):
     benchmark.pedantic(lineitem.to_pandas, rounds=5, iterations=1, warmup_rounds=1)
 
 
+def _pandas_conversion_data(dtype, n):
+    import decimal
+    import json
+    import uuid
+
+    uuids = [uuid.uuid4() for _ in range(100)]
+    values = {
+        "struct<a: int64, b: string>": lambda i: {"a": i, "b": str(i)},
+        "array<int64>": lambda i: list(range(i % 10)),
+        "array<timestamp('UTC')>": lambda i: [datetime.datetime(2000, 1, 1, i % 24)],
+        "map<string, int64>": lambda i: [(str(i % 10), i)],
+        "json": lambda i: json.dumps({"a": i % 100}),
+        "uuid": lambda i: str(uuids[i % 100]),
+        "decimal(10, 2)": lambda i: decimal.Decimal(i % 1000) / 100,
+        "timestamp('UTC')": lambda i: datetime.datetime(
+            2000, 1, 1, i % 24, tzinfo=pytz.UTC
+        ),
+    }[dtype]
+    return [None if i % 10 == 0 else values(i) for i in range(n)]
+
+
+@pytest.mark.benchmark(group="pandas_conversion")
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        "struct<a: int64, b: string>",
+        "array<int64>",
+        "array<timestamp('UTC')>",
+        "map<string, int64>",
+        "json",
+        "uuid",
+        "decimal(10, 2)",
+        "timestamp('UTC')",
+    ],
+)
+def test_pandas_convert_table(benchmark, dtype):
+    pd = pytest.importorskip("pandas")
+
+    from ibis.formats.pandas import PandasData
+
+    df = pd.DataFrame({"x": _pandas_conversion_data(dtype, 100_000)})
+    schema = ibis.schema({"x": dtype})
+    result = benchmark(PandasData.convert_table, df, schema)
+    assert len(result) == len(df)
+
+
 def test_parse_many_duckdb_types(benchmark):
     from ibis.backends.sql.datatypes import DuckDBType
 
@@ -800,6 +896,19 @@ def test_big_join_expr(benchmark, src, diff):
     benchmark(ir.Table.join, src, diff, ["validation_name"], how="outer")
 
 
+@pytest.mark.benchmark(group="interning")
+def test_big_expr_build(benchmark, interning, srcs, diffs, nrels):
+    # interning is paid for while constructing, so build the expressions in
+    # the timed function
+    def build():
+        src = make_big_union(srcs, nrels)
+        diff = make_big_union(diffs, nrels)
+        src.join(diff, ["validation_name"], how="outer")
+        return src.op().equals(make_big_union(srcs, nrels).op())
+
+    benchmark(build)
+
+
 def test_big_join_compile(benchmark, src, diff):
     pytest.importorskip("duckdb")
 
@@ -871,6 +980,51 @@ def test_large_union_compile(benchmark, many_tables):
     assert benchmark(ibis.to_sql, expr, dialect="duckdb") is not None
 
 
+@pytest.fixture(scope="module")
+def deep_graph():
+    # a long chain of projections on top of a large union, ~50k nodes
+    num_cols = 10
+    t = ibis.union(
+        *(ibis.table({f"c{i}": "int" for i in range(num_cols)}) for _ in range(2000))
+    )
+    for i in range(2000):
+        t = t.mutate(**{f"c{i % num_cols}": t[f"c{(i + 1) % num_cols}"] + i})
+    return t.op()
+
+
+@pytest.mark.benchmark(group="traversal")
+@pytest.mark.parametrize(
+    "method",
+    [
+        "toposort",
+        "map",
+        "map_clear",
+        "map_nodes",
+        "find",
+        "find_ordered",
+        "replace",
+    ],
+)
+def test_deep_graph_traversal(benchmark, deep_graph, method):
+    from ibis.common.graph import Graph
+
+    if method == "toposort":
+        graph = Graph.from_bfs(deep_graph)
+        benchmark(graph.toposort)
+    elif method == "map":
+        benchmark(deep_graph.map, lambda node, results, **kwargs: None)
+    elif method == "map_clear":
+        benchmark(deep_graph.map_clear, lambda node, results, **kwargs: None)
+    elif method == "map_nodes":
+        benchmark(deep_graph.map_nodes, lambda node, *args: None)
+    elif method == "find":
+        benchmark(deep_graph.find, ops.Add)
+    elif method == "find_ordered":
+        benchmark(deep_graph.find, ops.Add, ordered=True)
+    else:
+        benchmark(deep_graph.replace, lambda node, kwargs: node)
+
+
 @pytest.mark.parametrize("cols", [128, 256])
 @pytest.mark.parametrize("op", ["construct", "compile"])
 def test_large_add(benchmark, cols, op):
@@ -976,6 +1130,39 @@ def test_wide_relocate(benchmark, input, column, relative, cols):
     benchmark(t.relocate, column.format(last), **{input: relative.format(last)})
 
 
+@pytest.mark.parametrize("method", ["chained", "edit"])
+@pytest.mark.parametrize("cols", [100, 1_000])
+def test_wide_bulk_edit(benchmark, method, cols):
+    t = ibis.table(name="t", schema={f"a{i}": "int" for i in range(cols)})
+    edits = 10
+    renames = {f"b{i}": f"a{i}" for i in range(edits)}
+    drops = [f"a{i}" for i in range(edits, 2 * edits)]
+    casts = {f"a{i}": "float64" for i in range(2 * edits, 3 * edits)}
+
+    def chained():
+        expr = t
+        for new, old in renames.items():
+            expr = expr.rename({new: old})
+        for name in drops:
+            expr = expr.drop(name)
+        for name, dtype in casts.items():
+            expr = expr.cast({name: dtype})
+        return expr.relocate("b0", after=f"a{cols - 1}")
+
+    def edit():
+        editor = t.edit()
+        for new, old in renames.items():
+            editor.rename({new: old})
+        for name in drops:
+            editor.drop(name)
+        for name, dtype in casts.items():
+            editor.cast({name: dtype})
+        return editor.relocate("b0", after=f"a{cols - 1}").build()
+
+    result = benchmark(locals()[method])
+    assert result.schema() == edit().schema()
+
+
 def test_duckdb_timestamp_conversion(benchmark, con):
     start = datetime.datetime(2000, 1, 1, tzinfo=pytz.UTC)
     stop = datetime.datetime(2000, 2, 1, tzinfo=pytz.UTC)
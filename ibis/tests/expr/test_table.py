@@ -1831,6 +1831,50 @@ def test_drop_equality():
     assert t.drop("a", "b").equals(t.drop("b", "a"))
 
 
+def test_edit():
+    t = ibis.table(dict.fromkeys("abcd", "int"), name="t")
+
+    expr = (
+        t.edit()
+        .rename(x="a", y="b")
+        .drop("c")
+        .cast({"d": "float64", "y": "string"})
+        .relocate("d", after="x")
+        .build()
+    )
+    expected = t.select(x=t.a, d=t.d.cast("float64"), y=t.b.cast("string"))
+    assert expr.equals(expected)
+    assert isinstance(expr.op(), ops.Project)
+    assert expr.op().parent == t.op()
+
+    assert t.edit().relocate("c", "d").build().columns == ("c", "d", "a", "b")
+    assert t.edit().relocate("a", before="d").build().columns == ("b", "c", "a", "d")
+    assert (
+        t.edit().try_cast({"a": "string"}).build().equals(t.try_cast({"a": "string"}))
+    )
+    assert t.edit().build().schema() == t.schema()
+
+
+def test_edit_errors():
+    t = ibis.table(dict.fromkeys("abcd", "int"), name="t")
+
+    with pytest.raises(com.IbisInputError, match="Columns not found"):
+        t.edit().drop("e")
+
+    # edits refer to columns by their current name
+    with pytest.raises(com.IbisInputError, match="Columns not found"):
+        t.edit().rename(x="a").cast({"a": "string"})
+
+    with pytest.raises(com.IbisInputError, match="duplicate column names"):
+        t.edit().rename(b="a")
+
+    with pytest.raises(ValueError, match="duplicate new names"):
+        t.edit().rename(x="a", y="a")
+
+    with pytest.raises(com.IbisInputError, match="both"):
+        t.edit().relocate("a", before="b", after="c")
+
+
 def test_python_table_ambiguous():
     with pytest.raises(NotImplementedError):
         ibis.memtable(